@@ -4,6 +4,7 @@ import argparse
 import json
 import os
 import re
+import sys
 from datetime import UTC, datetime
 from pathlib import Path
 from urllib.error import URLError
@@ -17,23 +18,40 @@ from kb.enrichment_bootstrap import bootstrap_session_login
 from kb.enrichment_config import EnrichmentConfig, SupportedSource, load_enrichment_config_from_env
 from kb.enrichment_run import EnrichmentRunError, EnrichmentRunReport, RunStatus, run_enrichment_for_entity
 from kb.enrichment_sessions import export_session_state_json, import_session_state_json
-from kb.edges import derive_citation_edges, derive_employment_edges, sync_edge_backlinks
+from kb.edge_index import DEFAULT_EDGE_INDEX_PATH, open_edge_index
+from kb.edges import changed_entity_dirs, derive_citation_edges, derive_employment_edges, sync_edge_backlinks
 from kb.mcp_server import EntityUpsertInput, upsert_entity_file, run_server as run_fastmcp_server
-from kb.schemas import shard_for_slug
+from kb.schemas import parse_partial_date, shard_for_slug
 from kb.semantic import (
+    DATE_METADATA_FIELDS,
+    DEFAULT_ANN_MIN_CHUNKS,
+    DEFAULT_EMBED_BATCH_SIZE,
+    DEFAULT_FILTER_DATE_FIELD,
     DEFAULT_INDEX_PATH,
     DEFAULT_MAX_CHARS,
     DEFAULT_MIN_CHARS,
     DEFAULT_MODEL_CACHE_PATH,
     DEFAULT_MODEL_NAME,
     DEFAULT_OVERLAP_CHARS,
+    DEFAULT_QUERY_CACHE_PATH,
+    DEFAULT_RRF_K,
     FastEmbedBackend,
+    QueryEmbeddingCache,
+    SemanticFilter,
+    benchmark_semantic_index,
     build_semantic_index,
+    hybrid_search_index,
     load_semantic_index,
     resolve_runtime_path,
     search_semantic_index,
 )
-from kb.validate import run_validation, infer_data_root, collect_changed_paths, normalize_scope_paths
+from kb.validate import (
+    DEFAULT_VALIDATION_CACHE_PATH,
+    collect_changed_paths,
+    infer_data_root,
+    normalize_scope_paths,
+    run_validation,
+)
 
 _FRONTMATTER_BLOCK_RE = re.compile(r"\A---\n(?P<frontmatter>.*?)\n---\n?(?P<body>.*)\Z", re.DOTALL)
 _SLUG_SANITIZE_RE = re.compile(r"[^a-z0-9]+")
@@ -67,6 +85,67 @@ class PersonInitError(RuntimeError):
     pass
 
 
+def _add_semantic_filter_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--kind",
+        action="append",
+        default=None,
+        help="Only score chunks from this entity kind (person, org, source, ...); repeatable.",
+    )
+    parser.add_argument(
+        "--path-prefix",
+        default=None,
+        help="Only score chunks under this data path directory (e.g. person/al).",
+    )
+    parser.add_argument(
+        "--entity",
+        default=None,
+        help="Only score chunks belonging to this entity ref (e.g. person@alice).",
+    )
+    parser.add_argument(
+        "--source-type",
+        default=None,
+        help="Only score chunks from sources with this source-type.",
+    )
+    parser.add_argument(
+        "--date-field",
+        default=DEFAULT_FILTER_DATE_FIELD,
+        choices=DATE_METADATA_FIELDS,
+        help=f"Frontmatter date used by --date-from/--date-to (default: {DEFAULT_FILTER_DATE_FIELD}).",
+    )
+    parser.add_argument(
+        "--date-from",
+        type=_partial_date_argument,
+        default=None,
+        help="Inclusive lower bound (YYYY, YYYY-MM or YYYY-MM-DD).",
+    )
+    parser.add_argument(
+        "--date-to",
+        type=_partial_date_argument,
+        default=None,
+        help="Inclusive upper bound (YYYY, YYYY-MM or YYYY-MM-DD); partial dates cover the whole period.",
+    )
+
+
+def _partial_date_argument(value: str) -> str:
+    try:
+        return parse_partial_date(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+
+
+def _semantic_filter_from_args(args: argparse.Namespace) -> SemanticFilter:
+    return SemanticFilter(
+        kinds=tuple(args.kind or ()),
+        path_prefix=args.path_prefix,
+        entity=args.entity,
+        source_type=args.source_type,
+        date_field=args.date_field,
+        date_from=args.date_from,
+        date_to=args.date_to,
+    )
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="KB v2 utilities")
     subparsers = parser.add_subparsers(dest="command", required=True)
@@ -90,6 +169,17 @@ def build_parser() -> argparse.ArgumentParser:
     )
     validate_parser.add_argument("paths", nargs="*", help="Optional explicit paths to validate.")
     validate_parser.add_argument("--pretty", action="store_true", help="Pretty-print JSON output.")
+    validate_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Parse and validate files in N worker processes (0 = one per CPU core).",
+    )
+    validate_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Re-parse every file instead of reusing {DEFAULT_VALIDATION_CACHE_PATH}.",
+    )
 
     sync_edges_parser = subparsers.add_parser(
         "sync-edges",
@@ -132,6 +222,12 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Skip running sync-edges after derivation.",
     )
+    derive_edges_parser.add_argument(
+        "--changed",
+        action="store_true",
+        help="Re-derive only edges from entities changed relative to HEAD.",
+    )
+    derive_edges_parser.add_argument("paths", nargs="*", help="Optional entity paths to re-derive edges for.")
 
     derive_citation_parser = subparsers.add_parser(
         "derive-citation-edges",
@@ -158,6 +254,42 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Skip running sync-edges after derivation.",
     )
+    derive_citation_parser.add_argument(
+        "--changed",
+        action="store_true",
+        help="Re-derive only edges from entities changed relative to HEAD.",
+    )
+    derive_citation_parser.add_argument("paths", nargs="*", help="Optional entity paths to re-derive edges for.")
+
+    edges_parser = subparsers.add_parser(
+        "edges",
+        help="Query the edge adjacency index by endpoint and relation.",
+    )
+    edges_parser.add_argument(
+        "--project-root",
+        type=Path,
+        default=Path(__file__).resolve().parents[1],
+        help="Repository root path.",
+    )
+    edges_parser.add_argument(
+        "--data-root",
+        default=None,
+        help="Data root directory (default: data).",
+    )
+    edges_parser.add_argument(
+        "--from",
+        dest="from_entity",
+        default=None,
+        help="Source entity ref, e.g. person/al/person@alice.",
+    )
+    edges_parser.add_argument("--to", dest="to_entity", default=None, help="Target entity ref, e.g. org/ac/org@acme.")
+    edges_parser.add_argument("--relation", default=None, help="Edge relation, e.g. works_at.")
+    edges_parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Rebuild the index from canonical edge files before querying.",
+    )
+    edges_parser.add_argument("--pretty", action="store_true", help="Pretty-print JSON output.")
 
     mcp_parser = subparsers.add_parser(
         "mcp-server",
@@ -232,6 +364,37 @@ def build_parser() -> argparse.ArgumentParser:
         default=DEFAULT_OVERLAP_CHARS,
         help=f"Overlap for splitting large paragraphs (default: {DEFAULT_OVERLAP_CHARS}).",
     )
+    semantic_index_parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Ignore the existing index and re-embed every chunk.",
+    )
+    semantic_index_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_EMBED_BATCH_SIZE,
+        help=f"Chunks embedded and written per batch (default: {DEFAULT_EMBED_BATCH_SIZE}).",
+    )
+    semantic_index_parser.add_argument(
+        "--parallel",
+        type=int,
+        default=None,
+        help="Embed with N data-parallel worker processes (0 = all cores; default: single process).",
+    )
+    semantic_index_parser.add_argument(
+        "--progress",
+        action="store_true",
+        help="Print embedding progress to stderr.",
+    )
+    semantic_index_parser.add_argument(
+        "--ann",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help=(
+            "Build an approximate nearest-neighbour (IVF) index alongside the vectors "
+            f"(default: only when the index has at least {DEFAULT_ANN_MIN_CHUNKS} chunks)."
+        ),
+    )
 
     semantic_search_parser = subparsers.add_parser(
         "semantic-search",
@@ -275,6 +438,107 @@ def build_parser() -> argparse.ArgumentParser:
         default=DEFAULT_MODEL_CACHE_PATH,
         help=f"Model cache directory (default: {DEFAULT_MODEL_CACHE_PATH}).",
     )
+    semantic_search_parser.add_argument(
+        "--exact",
+        action="store_true",
+        help="Score every chunk even when the index has an ANN structure.",
+    )
+    semantic_search_parser.add_argument(
+        "--n-probe",
+        type=int,
+        default=None,
+        help="ANN lists to probe per query (default: value stored in the index).",
+    )
+    semantic_search_parser.add_argument(
+        "--query-cache",
+        action="store_true",
+        help=f"Reuse query embeddings persisted at {DEFAULT_QUERY_CACHE_PATH}.",
+    )
+    _add_semantic_filter_arguments(semantic_search_parser)
+
+    hybrid_search_parser = subparsers.add_parser(
+        "hybrid-search",
+        help="Search the semantic index with BM25 + vector rank fusion.",
+    )
+    hybrid_search_parser.add_argument(
+        "--project-root",
+        type=Path,
+        default=Path(__file__).resolve().parents[1],
+        help="Repository root path.",
+    )
+    hybrid_search_parser.add_argument(
+        "--index-path",
+        default=DEFAULT_INDEX_PATH,
+        help=f"Index path to search (default: {DEFAULT_INDEX_PATH}).",
+    )
+    hybrid_search_parser.add_argument(
+        "--query",
+        required=True,
+        help="Search query; exact names and keywords match through the lexical index.",
+    )
+    hybrid_search_parser.add_argument(
+        "--limit",
+        type=int,
+        default=8,
+        help="Maximum number of results to return.",
+    )
+    hybrid_search_parser.add_argument(
+        "--candidate-limit",
+        type=int,
+        default=None,
+        help="Candidates taken from each ranking before fusion (default: 5x limit).",
+    )
+    hybrid_search_parser.add_argument(
+        "--rrf-k",
+        type=int,
+        default=DEFAULT_RRF_K,
+        help=f"Reciprocal rank fusion constant (default: {DEFAULT_RRF_K}).",
+    )
+    hybrid_search_parser.add_argument(
+        "--model",
+        default=None,
+        help="Optional embedding model name (default: use model from index metadata).",
+    )
+    hybrid_search_parser.add_argument(
+        "--cache-dir",
+        default=DEFAULT_MODEL_CACHE_PATH,
+        help=f"Model cache directory (default: {DEFAULT_MODEL_CACHE_PATH}).",
+    )
+    _add_semantic_filter_arguments(hybrid_search_parser)
+
+    semantic_benchmark_parser = subparsers.add_parser(
+        "semantic-benchmark",
+        help="Measure exact vs ANN query latency and recall@k using stored chunk vectors as queries.",
+    )
+    semantic_benchmark_parser.add_argument(
+        "--project-root",
+        type=Path,
+        default=Path(__file__).resolve().parents[1],
+        help="Repository root path.",
+    )
+    semantic_benchmark_parser.add_argument(
+        "--index-path",
+        default=DEFAULT_INDEX_PATH,
+        help=f"Index path to benchmark (default: {DEFAULT_INDEX_PATH}).",
+    )
+    semantic_benchmark_parser.add_argument(
+        "--queries",
+        type=int,
+        default=100,
+        help="Number of sampled queries.",
+    )
+    semantic_benchmark_parser.add_argument(
+        "--limit",
+        type=int,
+        default=10,
+        help="k for recall@k.",
+    )
+    semantic_benchmark_parser.add_argument(
+        "--n-probe",
+        type=int,
+        default=None,
+        help="ANN lists to probe per query (default: value stored in the index).",
+    )
 
     bootstrap_session_parser = subparsers.add_parser(
         "bootstrap-session",
@@ -510,6 +774,8 @@ def run_validate(args: argparse.Namespace) -> int:
         data_root=data_root,
         scope_paths=scope_paths,
         scope_label=scope_label,
+        cache_path=None if args.no_cache else project_root / DEFAULT_VALIDATION_CACHE_PATH,
+        jobs=args.jobs,
     )
 
     if args.pretty:
@@ -527,6 +793,14 @@ def run_sync_edges(args: argparse.Namespace) -> int:
     return 0 if result["ok"] else 1
 
 
+def derive_scope_entity_dirs(args: argparse.Namespace, *, project_root: Path, data_root: Path) -> set[str] | None:
+    if args.paths:
+        return changed_entity_dirs(data_root, normalize_scope_paths(project_root, args.paths))
+    if args.changed:
+        return changed_entity_dirs(data_root, collect_changed_paths(project_root, data_root))
+    return None
+
+
 def run_derive_employment_edges(args: argparse.Namespace) -> int:
     project_root = args.project_root.resolve()
     data_root = infer_data_root(project_root, args.data_root)
@@ -535,6 +809,7 @@ def run_derive_employment_edges(args: argparse.Namespace) -> int:
         project_root=project_root,
         data_root=data_root,
         as_of=args.as_of,
+        changed_entity_dirs=derive_scope_entity_dirs(args, project_root=project_root, data_root=data_root),
     )
 
     output: dict[str, object] = {"derive": derive_result}
@@ -557,6 +832,7 @@ def run_derive_citation_edges(args: argparse.Namespace) -> int:
         project_root=project_root,
         data_root=data_root,
         as_of=args.as_of,
+        changed_entity_dirs=derive_scope_entity_dirs(args, project_root=project_root, data_root=data_root),
     )
 
     output: dict[str, object] = {"derive": derive_result}
@@ -571,6 +847,25 @@ def run_derive_citation_edges(args: argparse.Namespace) -> int:
     return 0 if ok else 1
 
 
+def run_edges(args: argparse.Namespace) -> int:
+    project_root = args.project_root.resolve()
+    data_root = infer_data_root(project_root, args.data_root)
+    index = open_edge_index(project_root=project_root, data_root=data_root, rebuild=args.rebuild)
+    edges = index.query(from_entity=args.from_entity, to_entity=args.to_entity, relation=args.relation)
+    result = {
+        "ok": True,
+        "edge_index": DEFAULT_EDGE_INDEX_PATH,
+        "indexed_edges": len(index.edges),
+        "count": len(edges),
+        "edges": edges,
+    }
+    if args.pretty:
+        print(json.dumps(result, indent=2, sort_keys=True))
+    else:
+        print(json.dumps(result, sort_keys=True))
+    return 0
+
+
 def run_mcp_server(args: argparse.Namespace) -> int:
     project_root = args.project_root.resolve()
     data_root = infer_data_root(project_root, args.data_root)
@@ -594,7 +889,13 @@ def run_semantic_index(args: argparse.Namespace) -> int:
     backend = FastEmbedBackend(
         model_name=args.model,
         cache_dir=cache_dir,
+        batch_size=args.batch_size,
+        parallel=args.parallel,
     )
+
+    def report_progress(done: int, total: int) -> None:
+        print(f"embedded {done}/{total} chunks", file=sys.stderr, flush=True)
+
     result = build_semantic_index(
         project_root=project_root,
         data_root=data_root,
@@ -603,6 +904,10 @@ def run_semantic_index(args: argparse.Namespace) -> int:
         max_chars=args.max_chars,
         min_chars=args.min_chars,
         overlap_chars=args.overlap_chars,
+        incremental=not args.full,
+        batch_size=args.batch_size,
+        progress=report_progress if args.progress else None,
+        ann=args.ann,
     )
     print(json.dumps(result, sort_keys=True))
     return 0 if result["ok"] else 1
@@ -620,12 +925,56 @@ def run_semantic_search(args: argparse.Namespace) -> int:
         model_name=model_name,
         cache_dir=cache_dir,
     )
+    query_cache = None
+    if args.query_cache:
+        query_cache = QueryEmbeddingCache(persist_path=resolve_runtime_path(project_root, DEFAULT_QUERY_CACHE_PATH))
     result = search_semantic_index(
         index_payload=index_payload,
         query=args.query,
         embedding_backend=backend,
         limit=args.limit,
         min_score=args.min_score,
+        exact=args.exact,
+        n_probe=args.n_probe,
+        query_cache=query_cache,
+        semantic_filter=_semantic_filter_from_args(args),
+    )
+    print(json.dumps(result, sort_keys=True))
+    return 0 if result["ok"] else 1
+
+
+def run_hybrid_search(args: argparse.Namespace) -> int:
+    project_root = args.project_root.resolve()
+    index_path = resolve_runtime_path(project_root, args.index_path)
+    index_payload = load_semantic_index(index_path)
+
+    model_payload = index_payload.get("model") or {}
+    model_name = args.model or str(model_payload.get("name") or DEFAULT_MODEL_NAME)
+    backend = FastEmbedBackend(
+        model_name=model_name,
+        cache_dir=resolve_runtime_path(project_root, args.cache_dir),
+    )
+    result = hybrid_search_index(
+        index_payload=index_payload,
+        query=args.query,
+        embedding_backend=backend,
+        limit=args.limit,
+        candidate_limit=args.candidate_limit,
+        rrf_k=args.rrf_k,
+        semantic_filter=_semantic_filter_from_args(args),
+    )
+    print(json.dumps(result, sort_keys=True))
+    return 0 if result["ok"] else 1
+
+
+def run_semantic_benchmark(args: argparse.Namespace) -> int:
+    project_root = args.project_root.resolve()
+    index_path = resolve_runtime_path(project_root, args.index_path)
+    result = benchmark_semantic_index(
+        load_semantic_index(index_path),
+        query_count=args.queries,
+        limit=args.limit,
+        n_probe=args.n_probe,
     )
     print(json.dumps(result, sort_keys=True))
     return 0 if result["ok"] else 1
@@ -1330,12 +1679,18 @@ def main() -> int:
         return run_derive_employment_edges(args)
     if args.command == "derive-citation-edges":
         return run_derive_citation_edges(args)
+    if args.command == "edges":
+        return run_edges(args)
     if args.command == "mcp-server":
         return run_mcp_server(args)
     if args.command == "semantic-index":
         return run_semantic_index(args)
     if args.command == "semantic-search":
         return run_semantic_search(args)
+    if args.command == "hybrid-search":
+        return run_hybrid_search(args)
+    if args.command == "semantic-benchmark":
+        return run_semantic_benchmark(args)
     if args.command == "bootstrap-session":
         return run_bootstrap_session(args)
     if args.command == "export-session":
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable
+
+from pydantic import ValidationError
+
+from kb.schemas import EdgeRecord
+
+EDGE_INDEX_VERSION = 2
+DEFAULT_EDGE_INDEX_PATH = ".build/edges/index.json"
+ADJACENCY_KEYS = {"from": "by_from", "to": "by_to", "relation": "by_relation"}
+
+
+def edge_index_path(project_root: Path) -> Path:
+    return project_root / DEFAULT_EDGE_INDEX_PATH
+
+
+def edge_index_entry(edge_record: EdgeRecord, *, edge_path: Path, project_root: Path) -> dict[str, Any]:
+    path = _project_path(project_root, edge_path)
+    payload = edge_record.model_dump(mode="json", by_alias=True)
+    return {
+        "id": payload["id"],
+        "path": path,
+        "relation": payload["relation"],
+        "directed": payload["directed"],
+        "from": payload["from"],
+        "to": payload["to"],
+        "valid_from": payload["valid_from"],
+        "valid_to": payload["valid_to"],
+    }
+
+
+def edge_file_stamp(edge_path: Path) -> list[int] | None:
+    try:
+        stat = edge_path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+class EdgeIndex:
+    def __init__(self, *, data_root: str) -> None:
+        self.data_root = data_root
+        self.edges: dict[str, dict[str, Any]] = {}
+        self.adjacency: dict[str, dict[str, list[str]]] = {key: {} for key in ADJACENCY_KEYS.values()}
+        # Edge file path -> [mtime_ns, size, indexed edge id or None when the file did not index].
+        self.files: dict[str, list[Any]] = {}
+
+    def upsert(self, entry: dict[str, Any]) -> None:
+        edge_id = entry["id"]
+        self.remove(edge_id)
+        self.edges[edge_id] = entry
+        for field, key in ADJACENCY_KEYS.items():
+            self.adjacency[key].setdefault(entry[field], []).append(edge_id)
+
+    def remove(self, edge_id: str) -> None:
+        entry = self.edges.pop(edge_id, None)
+        if entry is None:
+            return
+        for field, key in ADJACENCY_KEYS.items():
+            ids = self.adjacency[key].get(entry[field])
+            if ids is None:
+                continue
+            ids.remove(edge_id)
+            if not ids:
+                del self.adjacency[key][entry[field]]
+
+    def add_file(self, edge_path: Path, edge_record: EdgeRecord, *, project_root: Path) -> None:
+        stamp = edge_file_stamp(edge_path)
+        if stamp is None:
+            return
+        entry = edge_index_entry(edge_record, edge_path=edge_path, project_root=project_root)
+        self.forget_file(entry["path"])
+        existing = self.edges.get(entry["id"])
+        if existing is not None and existing["path"] != entry["path"] and existing["path"] in self.files:
+            self.files[entry["path"]] = [*stamp, None]
+            return
+        self.upsert(entry)
+        self.files[entry["path"]] = [*stamp, entry["id"]]
+
+    def forget_file(self, path: str) -> None:
+        stamp = self.files.pop(path, None)
+        if stamp is None or stamp[2] is None:
+            return
+        entry = self.edges.get(stamp[2])
+        if entry is not None and entry["path"] == path:
+            self.remove(stamp[2])
+
+    def refresh(self, *, project_root: Path, data_root: Path) -> bool:
+        changed = False
+        seen: set[str] = set()
+        edge_root = data_root / "edge"
+        edge_paths = sorted(edge_root.rglob("edge@*.json")) if edge_root.exists() else []
+        for edge_path in edge_paths:
+            path = _project_path(project_root, edge_path)
+            seen.add(path)
+            stamp = edge_file_stamp(edge_path)
+            known = self.files.get(path)
+            if stamp is None or (known is not None and known[:2] == stamp):
+                continue
+            changed = True
+            try:
+                edge_record = EdgeRecord.model_validate(json.loads(edge_path.read_text(encoding="utf-8")))
+            except (OSError, json.JSONDecodeError, ValidationError, ValueError):
+                self.forget_file(path)
+                self.files[path] = [*stamp, None]
+                continue
+            self.add_file(edge_path, edge_record, project_root=project_root)
+        for path in sorted(set(self.files) - seen):
+            changed = True
+            self.forget_file(path)
+        return changed
+
+    def query(
+        self,
+        *,
+        from_entity: str | None = None,
+        to_entity: str | None = None,
+        relation: str | None = None,
+    ) -> list[dict[str, Any]]:
+        filters = {"by_from": from_entity, "by_to": to_entity, "by_relation": relation}
+        candidate_sets = [
+            self.adjacency[key].get(value, []) for key, value in filters.items() if value is not None
+        ]
+        if not candidate_sets:
+            edge_ids: Iterable[str] = self.edges
+        else:
+            smallest, *others = sorted(candidate_sets, key=len)
+            other_sets = [set(ids) for ids in others]
+            edge_ids = [edge_id for edge_id in smallest if all(edge_id in ids for ids in other_sets)]
+        return [self.edges[edge_id] for edge_id in sorted(edge_ids)]
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "version": EDGE_INDEX_VERSION,
+            "data_root": self.data_root,
+            "edges": {edge_id: self.edges[edge_id] for edge_id in sorted(self.edges)},
+            "files": {path: self.files[path] for path in sorted(self.files)},
+            **{
+                key: {value: sorted(ids) for value, ids in sorted(self.adjacency[key].items())}
+                for key in ADJACENCY_KEYS.values()
+            },
+        }
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(self.as_dict(), separators=(",", ":")), encoding="utf-8")
+        temp_path.replace(path)
+
+
+def load_edge_index(path: Path, *, data_root: str) -> EdgeIndex | None:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(payload, dict):
+        return None
+    if payload.get("version") != EDGE_INDEX_VERSION or payload.get("data_root") != data_root:
+        return None
+    edges = payload.get("edges")
+    files = payload.get("files")
+    if not isinstance(edges, dict) or not isinstance(files, dict):
+        return None
+
+    index = EdgeIndex(data_root=data_root)
+    index.edges = edges
+    index.files = files
+    for key in ADJACENCY_KEYS.values():
+        adjacency = payload.get(key)
+        if not isinstance(adjacency, dict):
+            return None
+        index.adjacency[key] = {value: list(ids) for value, ids in adjacency.items()}
+    return index
+
+
+def build_edge_index(*, project_root: Path, data_root: Path) -> EdgeIndex:
+    index = EdgeIndex(data_root=_data_root_key(project_root, data_root))
+    index.refresh(project_root=project_root, data_root=data_root)
+    return index
+
+
+def update_edge_index(
+    *,
+    project_root: Path,
+    data_root: Path,
+    upserts: Iterable[tuple[Path, EdgeRecord]] = (),
+    removed_ids: Iterable[str] = (),
+) -> EdgeIndex:
+    path = edge_index_path(project_root)
+    index = load_edge_index(path, data_root=_data_root_key(project_root, data_root))
+    if index is None:
+        index = build_edge_index(project_root=project_root, data_root=data_root)
+    else:
+        for edge_id in removed_ids:
+            entry = index.edges.get(edge_id)
+            if entry is not None:
+                index.forget_file(entry["path"])
+        for edge_path, edge_record in upserts:
+            index.add_file(edge_path, edge_record, project_root=project_root)
+        index.refresh(project_root=project_root, data_root=data_root)
+    index.save(path)
+    return index
+
+
+def invalidate_edge_index(project_root: Path) -> None:
+    edge_index_path(project_root).unlink(missing_ok=True)
+
+
+def open_edge_index(*, project_root: Path, data_root: Path, rebuild: bool = False) -> EdgeIndex:
+    path = edge_index_path(project_root)
+    index = None if rebuild else load_edge_index(path, data_root=_data_root_key(project_root, data_root))
+    if index is None:
+        index = build_edge_index(project_root=project_root, data_root=data_root)
+        index.save(path)
+    elif index.refresh(project_root=project_root, data_root=data_root):
+        index.save(path)
+    return index
+
+
+def _project_path(project_root: Path, path: Path) -> str:
+    try:
+        return path.relative_to(project_root).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def _data_root_key(project_root: Path, data_root: Path) -> str:
+    return _project_path(project_root, data_root)
@@ -5,11 +5,13 @@ import json
 import os
 import re
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 import yaml
 from pydantic import ValidationError
 
+from kb.edge_index import EdgeIndex, edge_index_path, update_edge_index
+from kb.entity_files import extract_citation_keys, load_entity, load_jsonl
 from kb.schemas import (
     EdgeRecord,
     EmploymentHistoryRow,
@@ -17,11 +19,12 @@ from kb.schemas import (
     parse_partial_date,
     partial_date_sort_key,
 )
-from kb.validate import gather_edge_files, gather_entities, gather_source_files
+from kb.validate import EntityRecord, ScopeIndex, gather_edge_files, gather_entities, gather_source_files
+from kb.write_journal import record_write
 
+ENTITY_KINDS = ("person", "org", "source")
 EDGE_ID_SANITIZE_RE = re.compile(r"[^a-z0-9]+")
 FRONTMATTER_RE = re.compile(r"\A---\s*\n(.*?)\n---\s*\n?", re.DOTALL)
-FOOTNOTE_REF_RE = re.compile(r"\[\^([^\]]+)\](?!:)")
 
 
 def relpath(path: Path, project_root: Path) -> str:
@@ -54,21 +57,6 @@ def relation_for_citation() -> str:
     return "cites"
 
 
-def extract_citation_keys(text: str | None) -> list[str]:
-    if not text:
-        return []
-
-    seen: set[str] = set()
-    ordered: list[str] = []
-    for match in FOOTNOTE_REF_RE.finditer(text):
-        key = match.group(1).strip()
-        if not key or key in seen:
-            continue
-        seen.add(key)
-        ordered.append(key)
-    return ordered
-
-
 def parse_frontmatter(path: Path) -> dict[str, Any]:
     text = path.read_text(encoding="utf-8")
     match = FRONTMATTER_RE.match(text)
@@ -116,44 +104,134 @@ def load_source_lookup(data_root: Path, project_root: Path) -> tuple[dict[str, s
     return source_by_citation_key, issues
 
 
-def load_employment_rows(path: Path, project_root: Path) -> tuple[list[EmploymentHistoryRow], list[dict[str, Any]]]:
-    rows: list[EmploymentHistoryRow] = []
-    issues: list[dict[str, Any]] = []
+def load_source_lookup_for_keys(
+    data_root: Path,
+    project_root: Path,
+    citation_keys: Iterable[str],
+) -> tuple[dict[str, str], list[dict[str, Any]]]:
+    source_by_citation_key: dict[str, str] = {}
+    for citation_key in sorted(set(citation_keys)):
+        source_dir = data_root / "source" / shard_for_value(citation_key) / f"source@{citation_key}"
+        index_path = source_dir / "index.md"
+        record = None
+        if index_path.is_file():
+            try:
+                record = SourceRecord.model_validate(parse_frontmatter(index_path))
+            except ValidationError:
+                record = None
+        if record is None or record.citation_key != citation_key:
+            return load_source_lookup(data_root, project_root)
+        source_by_citation_key[citation_key] = source_dir.relative_to(data_root).as_posix()
+    return source_by_citation_key, []
+
+
+def entity_record_for_dir(data_root: Path, rel_dir: str) -> EntityRecord | None:
+    directory = data_root / rel_dir
+    kind = rel_dir.split("/", 1)[0]
+    index_path = directory / "index.md"
+    if kind not in ENTITY_KINDS or not directory.name.startswith(f"{kind}@") or not index_path.is_file():
+        return None
+    return EntityRecord(
+        kind=kind,
+        entity_id=directory.name.split("@", 1)[1],
+        rel_dir=rel_dir,
+        directory=directory,
+        index_path=index_path,
+    )
 
-    if not path.exists():
-        return rows, issues
 
-    with path.open("r", encoding="utf-8") as handle:
-        for line_number, line in enumerate(handle, start=1):
-            text = line.strip()
-            if not text:
-                continue
-            try:
-                payload = json.loads(text)
-            except json.JSONDecodeError as exc:
-                issues.append(
-                    {
-                        "code": "invalid_jsonl",
-                        "path": relpath(path, project_root),
-                        "line": line_number,
-                        "message": f"JSON parse error: {exc.msg}",
-                    }
-                )
-                continue
-            try:
-                row = EmploymentHistoryRow.model_validate(payload)
-            except ValidationError as exc:
-                issues.append(
-                    {
-                        "code": "schema_error",
-                        "path": relpath(path, project_root),
-                        "line": line_number,
-                        "message": exc.errors()[0]["msg"],
-                    }
-                )
-                continue
-            rows.append(row)
-    return rows, issues
+def changed_entity_dirs(data_root: Path, paths: Iterable[Path]) -> set[str]:
+    data_root_abs = Path(os.path.abspath(data_root))
+    changed: set[str] = set()
+    broad_paths: list[Path] = []
+    for path in paths:
+        absolute = Path(os.path.abspath(path))
+        try:
+            parts = absolute.relative_to(data_root_abs).parts
+        except ValueError:
+            continue
+        if parts and parts[0] not in ENTITY_KINDS:
+            continue
+        entity_parts = next(
+            (parts[: index + 1] for index, part in enumerate(parts[1:], start=1) if part.startswith(f"{parts[0]}@")),
+            None,
+        )
+        if entity_parts is not None:
+            changed.add("/".join(entity_parts))
+        else:
+            broad_paths.append(absolute)
+
+    if broad_paths:
+        scope = ScopeIndex(broad_paths)
+        for rel_dir in gather_entities(data_root):
+            if scope.covers(data_root_abs / rel_dir):
+                changed.add(rel_dir)
+    return changed
+
+
+def derivation_entities(
+    data_root: Path,
+    changed_dirs: Iterable[str] | None,
+) -> tuple[dict[str, EntityRecord], set[str], dict[str, EntityRecord] | None]:
+    if changed_dirs is None:
+        entities = gather_entities(data_root)
+        return entities, set(), entities
+
+    scanned: dict[str, EntityRecord] = {}
+    removed: set[str] = set()
+    for rel_dir in sorted(set(changed_dirs)):
+        entity = entity_record_for_dir(data_root, rel_dir)
+        if entity is None:
+            removed.add(rel_dir)
+        else:
+            scanned[rel_dir] = entity
+    return scanned, removed, None
+
+
+def derived_edge_candidates(edge_root: Path, id_prefix: str) -> dict[str, Path]:
+    shard_dir = edge_root / shard_for_value(id_prefix)
+    return {
+        path.name[len("edge@") : -len(".json")]: path
+        for path in sorted(shard_dir.glob(f"edge@{id_prefix}*.json"))
+    }
+
+
+def remove_stale_derived_edges(
+    *,
+    candidates: dict[str, Path],
+    keep_ids: set[str],
+    relation: str,
+    owner_refs: set[str],
+    project_root: Path,
+) -> dict[str, str]:
+    removed_paths: dict[str, str] = {}
+    for edge_id, edge_path in sorted(candidates.items()):
+        if edge_id in keep_ids:
+            continue
+        try:
+            record = read_edge_record(edge_path)
+        except (OSError, json.JSONDecodeError, ValidationError, ValueError):
+            continue
+        if record.relation != relation or record.from_entity not in owner_refs:
+            continue
+        edge_path.unlink()
+        record_write(edge_path)
+        removed_paths[edge_id] = relpath(edge_path, project_root)
+    return removed_paths
+
+
+def load_employment_rows(path: Path, project_root: Path) -> tuple[list[EmploymentHistoryRow], list[dict[str, Any]]]:
+    loaded = load_jsonl(path, EmploymentHistoryRow)
+    issues = [
+        {
+            "code": error.code,
+            "path": relpath(path, project_root),
+            "line": error.line,
+            "message": f"JSON parse error: {error.message}" if error.code == "invalid_jsonl" else error.message,
+        }
+        for error in loaded.errors
+    ]
+    return loaded.records(), issues
 
 
 def resolve_citation_source_refs(
@@ -201,94 +279,113 @@ def index_existing_edges(data_root: Path) -> tuple[dict[str, Path], set[str]]:
     return edge_path_by_id, duplicate_existing_ids
 
 
-def _merge_existing_edge_dates(
-    *,
-    edge_id: str,
-    candidate_payload: dict[str, Any],
-    edge_path_by_id: dict[str, Path],
-    project_root: Path,
-    issues: list[dict[str, Any]],
-    effective_as_of: str,
-) -> tuple[str, str]:
-    existing_path = edge_path_by_id.get(edge_id)
-    if existing_path is None or not existing_path.exists():
-        return effective_as_of, effective_as_of
+def render_edge_record(edge_record: EdgeRecord) -> str:
+    return json.dumps(edge_record.model_dump(by_alias=True), indent=2, sort_keys=True) + "\n"
 
-    try:
-        existing_record = read_edge_record(existing_path)
-    except (json.JSONDecodeError, ValidationError, ValueError) as exc:
-        issues.append(
-            {
-                "code": "schema_error",
-                "path": relpath(existing_path, project_root),
-                "message": str(exc),
-            }
-        )
-        return effective_as_of, effective_as_of
 
-    existing_payload = existing_record.model_dump(mode="json", by_alias=True)
-    existing_without_dates = {
-        key: value
-        for key, value in existing_payload.items()
-        if key not in {"first_noted_at", "last_verified_at"}
-    }
-    candidate_without_dates = {
-        key: value
-        for key, value in candidate_payload.items()
-        if key not in {"first_noted_at", "last_verified_at"}
-    }
-    if candidate_without_dates == existing_without_dates:
-        return existing_record.first_noted_at, existing_record.last_verified_at
+def _without_dates(payload: dict[str, Any]) -> dict[str, Any]:
+    return {key: value for key, value in payload.items() if key not in {"first_noted_at", "last_verified_at"}}
 
-    return (
-        existing_record.first_noted_at,
-        max(existing_record.last_verified_at, effective_as_of, key=partial_date_sort_key),
-    )
 
+class EdgeStore:
+    def __init__(self, *, edge_root: Path, project_root: Path, edge_path_by_id: dict[str, Path]) -> None:
+        self.edge_root = edge_root
+        self.project_root = project_root
+        self.edge_path_by_id = edge_path_by_id
+        self._existing: dict[str, tuple[str | None, dict[str, Any] | None]] = {}
+        self._dirty: dict[str, tuple[str, EdgeRecord]] = {}
+        self._created: set[str] = set()
+        self.flushed: list[tuple[Path, EdgeRecord]] = []
 
-def write_edge_record(
-    *,
-    edge_record: EdgeRecord,
-    edge_root: Path,
-    project_root: Path,
-    edge_path_by_id: dict[str, Path],
-    created_paths: list[str],
-    updated_paths: list[str],
-    issues: list[dict[str, Any]],
-) -> bool:
-    edge_id = edge_record.id
-    edge_path = edge_root / shard_for_value(edge_id) / f"edge@{edge_id}.json"
-    edge_path.parent.mkdir(parents=True, exist_ok=True)
-    rendered = json.dumps(edge_record.model_dump(by_alias=True), indent=2, sort_keys=True) + "\n"
-
-    existing_path = edge_path_by_id.get(edge_id)
-    if existing_path is not None and existing_path != edge_path:
-        issues.append(
-            {
-                "code": "edge_path_conflict",
-                "path": relpath(existing_path, project_root),
-                "message": (
-                    f"edge id {edge_id} exists at {relpath(existing_path, project_root)}; "
-                    f"expected {relpath(edge_path, project_root)}"
-                ),
-            }
-        )
-        return False
+    def edge_path(self, edge_id: str) -> Path:
+        return self.edge_root / shard_for_value(edge_id) / f"edge@{edge_id}.json"
 
-    if edge_path.exists():
-        current = edge_path.read_text(encoding="utf-8")
-        if current == rendered:
-            return False
+    def load(self, edge_id: str, issues: list[dict[str, Any]]) -> tuple[str | None, dict[str, Any] | None]:
+        cached = self._existing.get(edge_id)
+        if cached is not None:
+            return cached
 
-    edge_path.write_text(rendered, encoding="utf-8")
-    edge_path_by_id[edge_id] = edge_path
+        text: str | None = None
+        payload: dict[str, Any] | None = None
+        existing_path = self.edge_path_by_id.get(edge_id, self.edge_path(edge_id))
+        try:
+            text = existing_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            pass
+        if text is not None:
+            try:
+                payload = parse_edge_record(text).model_dump(mode="json", by_alias=True)
+            except (json.JSONDecodeError, ValidationError, ValueError) as exc:
+                issues.append(
+                    {
+                        "code": "schema_error",
+                        "path": relpath(existing_path, self.project_root),
+                        "message": str(exc),
+                    }
+                )
+        self._existing[edge_id] = (text, payload)
+        return text, payload
+
+    def merge_dates(
+        self,
+        *,
+        candidate_payload: dict[str, Any],
+        issues: list[dict[str, Any]],
+        effective_as_of: str,
+    ) -> tuple[str, str]:
+        _, existing_payload = self.load(candidate_payload["id"], issues)
+        if existing_payload is None:
+            return effective_as_of, effective_as_of
+        if _without_dates(candidate_payload) == _without_dates(existing_payload):
+            return existing_payload["first_noted_at"], existing_payload["last_verified_at"]
+        return (
+            existing_payload["first_noted_at"],
+            max(existing_payload["last_verified_at"], effective_as_of, key=partial_date_sort_key),
+        )
 
-    rel = relpath(edge_path, project_root)
-    if existing_path is None:
-        created_paths.append(rel)
-    else:
-        updated_paths.append(rel)
-    return True
+    def stage(self, edge_record: EdgeRecord, issues: list[dict[str, Any]]) -> str:
+        edge_id = edge_record.id
+        edge_path = self.edge_path(edge_id)
+        existing_path = self.edge_path_by_id.get(edge_id)
+        if existing_path is not None and existing_path != edge_path:
+            issues.append(
+                {
+                    "code": "edge_path_conflict",
+                    "path": relpath(existing_path, self.project_root),
+                    "message": (
+                        f"edge id {edge_id} exists at {relpath(existing_path, self.project_root)}; "
+                        f"expected {relpath(edge_path, self.project_root)}"
+                    ),
+                }
+            )
+            return "conflict"
+
+        rendered = render_edge_record(edge_record)
+        current, _ = self.load(edge_id, issues)
+        if current == rendered:
+            return "unchanged"
+
+        self._existing[edge_id] = (rendered, edge_record.model_dump(mode="json", by_alias=True))
+        self._dirty[edge_id] = (rendered, edge_record)
+        if existing_path is None:
+            self._created.add(edge_id)
+            self.edge_path_by_id[edge_id] = edge_path
+        return "changed"
+
+    def flush(self) -> tuple[list[str], list[str]]:
+        created_paths: list[str] = []
+        updated_paths: list[str] = []
+        for edge_id, (rendered, edge_record) in sorted(self._dirty.items()):
+            edge_path = self.edge_path(edge_id)
+            edge_path.parent.mkdir(parents=True, exist_ok=True)
+            edge_path.write_text(rendered, encoding="utf-8")
+            record_write(edge_path)
+            self.flushed.append((edge_path, edge_record))
+            rel = relpath(edge_path, self.project_root)
+            (created_paths if edge_id in self._created else updated_paths).append(rel)
+        self._dirty.clear()
+        self._created.clear()
+        return sorted(created_paths), sorted(updated_paths)
 
 
 def derive_employment_edges(
@@ -296,22 +393,57 @@ def derive_employment_edges(
     project_root: Path,
     data_root: Path,
     as_of: str | None = None,
+    changed_entity_dirs: Iterable[str] | None = None,
 ) -> dict[str, Any]:
     effective_as_of = parse_partial_date(as_of or dt.date.today().isoformat())
-    entities = gather_entities(data_root)
+    entities, removed_dirs, known_entities = derivation_entities(data_root, changed_entity_dirs)
     edge_root = data_root / "edge"
     edge_root.mkdir(parents=True, exist_ok=True)
 
-    source_by_citation_key, source_issues = load_source_lookup(data_root, project_root)
+    person_rows: list[tuple[EntityRecord, Path, list[EmploymentHistoryRow], bool]] = []
+    row_issues_by_entity: list[dict[str, Any]] = []
+    for rel_dir in sorted(entities):
+        entity = entities[rel_dir]
+        if entity.kind != "person":
+            continue
+        employment_path = entity.directory / "employment-history.jsonl"
+        rows, row_issues = load_employment_rows(employment_path, project_root)
+        row_issues_by_entity.extend(row_issues)
+        person_rows.append((entity, employment_path, rows, not row_issues))
+
+    if known_entities is None:
+        source_by_citation_key, source_issues = load_source_lookup_for_keys(
+            data_root,
+            project_root,
+            (key for _, _, rows, _ in person_rows for row in rows for key in extract_citation_keys(row.source)),
+        )
+        edge_path_by_id: dict[str, Path] = {}
+        duplicate_existing_ids: set[str] = set()
+        for rel_dir in sorted({entity.rel_dir for entity, _, _, _ in person_rows} | removed_dirs):
+            entity_id = rel_dir.rsplit("@", 1)[1]
+            edge_path_by_id.update(
+                derived_edge_candidates(edge_root, sanitize_fragment(f"employment-{entity_id}") + "-")
+            )
+    else:
+        source_by_citation_key, source_issues = load_source_lookup(data_root, project_root)
+        edge_path_by_id, duplicate_existing_ids = index_existing_edges(data_root)
+
+    def entity_exists(ref: str) -> bool:
+        if known_entities is not None:
+            return ref in known_entities
+        return ref in entities or entity_record_for_dir(data_root, ref) is not None
 
-    edge_path_by_id, duplicate_existing_ids = index_existing_edges(data_root)
-    created_paths: list[str] = []
-    updated_paths: list[str] = []
-    issues: list[dict[str, Any]] = [*source_issues]
+    stale_candidates = {
+        edge_id: path for edge_id, path in edge_path_by_id.items() if edge_id.startswith("employment-")
+    }
+    store = EdgeStore(edge_root=edge_root, project_root=project_root, edge_path_by_id=edge_path_by_id)
+    issues: list[dict[str, Any]] = [*source_issues, *row_issues_by_entity]
     person_entities_scanned = 0
     employment_rows_scanned = 0
     candidate_rows = 0
     unchanged_existing = 0
+    derived_ids: set[str] = set()
+    owner_refs: set[str] = set(removed_dirs)
 
     for edge_id in sorted(duplicate_existing_ids):
         issues.append(
@@ -322,23 +454,20 @@ def derive_employment_edges(
             }
         )
 
-    for rel_dir in sorted(entities):
-        entity = entities[rel_dir]
-        if entity.kind != "person":
-            continue
+    for entity, employment_path, rows, rows_clean in person_rows:
         person_entities_scanned += 1
-
-        employment_path = entity.directory / "employment-history.jsonl"
-        rows, row_issues = load_employment_rows(employment_path, project_root)
-        issues.extend(row_issues)
         employment_rows_scanned += len(rows)
+        if rows_clean:
+            owner_refs.add(entity.rel_dir)
 
         for row in rows:
             if not row.organization_ref:
                 continue
             candidate_rows += 1
+            edge_id = sanitize_fragment(f"employment-{entity.entity_id}-{row.id}")
+            derived_ids.add(edge_id)
 
-            if row.organization_ref not in entities:
+            if not entity_exists(row.organization_ref):
                 issues.append(
                     {
                         "code": "invalid_reference",
@@ -368,7 +497,6 @@ def derive_employment_edges(
                 )
                 continue
 
-            edge_id = sanitize_fragment(f"employment-{entity.entity_id}-{row.id}")
             payload = {
                 "id": edge_id,
                 "relation": relation_for_employment(),
@@ -383,11 +511,8 @@ def derive_employment_edges(
                 "notes": build_edge_notes(row),
                 "strength": None,
             }
-            first_noted_at, last_verified_at = _merge_existing_edge_dates(
-                edge_id=edge_id,
+            first_noted_at, last_verified_at = store.merge_dates(
                 candidate_payload=payload,
-                edge_path_by_id=edge_path_by_id,
-                project_root=project_root,
                 issues=issues,
                 effective_as_of=effective_as_of,
             )
@@ -398,90 +523,92 @@ def derive_employment_edges(
                 payload
             )
 
-            changed = write_edge_record(
-                edge_record=edge_record,
-                edge_root=edge_root,
-                project_root=project_root,
-                edge_path_by_id=edge_path_by_id,
-                created_paths=created_paths,
-                updated_paths=updated_paths,
-                issues=issues,
-            )
-            if not changed and edge_id in edge_path_by_id:
-                edge_path = edge_root / shard_for_value(edge_id) / f"edge@{edge_id}.json"
-                if edge_path.exists() and edge_path.read_text(encoding="utf-8") == (
-                    json.dumps(edge_record.model_dump(by_alias=True), indent=2, sort_keys=True) + "\n"
-                ):
-                    unchanged_existing += 1
-
-    created_paths.sort()
-    updated_paths.sort()
+            if store.stage(edge_record, issues) == "unchanged":
+                unchanged_existing += 1
+
+    created_paths, updated_paths = store.flush()
+    removed = remove_stale_derived_edges(
+        candidates=stale_candidates,
+        keep_ids=derived_ids,
+        relation=relation_for_employment(),
+        owner_refs=owner_refs,
+        project_root=project_root,
+    )
+    removed_paths = sorted(removed.values())
+    update_edge_index(
+        project_root=project_root,
+        data_root=data_root,
+        upserts=store.flushed,
+        removed_ids=removed,
+    )
+
     return {
         "ok": len(issues) == 0,
         "data_root": relpath(data_root, project_root),
         "as_of": effective_as_of,
+        "scope": "full" if known_entities is not None else "changed",
         "person_entities_scanned": person_entities_scanned,
         "employment_rows_scanned": employment_rows_scanned,
         "candidate_rows_with_org_ref": candidate_rows,
         "created_edge_files": len(created_paths),
         "updated_edge_files": len(updated_paths),
+        "removed_edge_files": len(removed_paths),
         "unchanged_existing": unchanged_existing,
         "issue_count": len(issues),
         "issues": issues,
         "created_paths": created_paths,
         "updated_paths": updated_paths,
+        "removed_paths": removed_paths,
     }
 
 
-def read_citations_from_jsonl(path: Path) -> set[str]:
-    citations: set[str] = set()
-    if not path.exists():
-        return citations
-
-    with path.open("r", encoding="utf-8") as handle:
-        for line in handle:
-            text = line.strip()
-            if not text:
-                continue
-            try:
-                payload = json.loads(text)
-            except json.JSONDecodeError:
-                continue
-            if not isinstance(payload, dict):
-                continue
-            for value in payload.values():
-                if isinstance(value, str):
-                    citations.update(extract_citation_keys(value))
-
-    return citations
-
-
-def read_citations_from_markdown(path: Path) -> set[str]:
-    if not path.exists():
-        return set()
-    return set(extract_citation_keys(path.read_text(encoding="utf-8")))
-
-
 def derive_citation_edges(
     *,
     project_root: Path,
     data_root: Path,
     as_of: str | None = None,
+    changed_entity_dirs: Iterable[str] | None = None,
 ) -> dict[str, Any]:
     effective_as_of = parse_partial_date(as_of or dt.date.today().isoformat())
-    entities = gather_entities(data_root)
+    entities, removed_dirs, known_entities = derivation_entities(data_root, changed_entity_dirs)
     edge_root = data_root / "edge"
     edge_root.mkdir(parents=True, exist_ok=True)
 
-    source_by_citation_key, source_issues = load_source_lookup(data_root, project_root)
+    entity_citations: list[tuple[EntityRecord, set[str], bool]] = []
+    for rel_dir in sorted(entities):
+        entity = entities[rel_dir]
+        loaded = load_entity(entity.directory, entity.kind)
+        clean = not any(jsonl.errors for jsonl in loaded.jsonl.values())
+        entity_citations.append((entity, loaded.citation_keys(), clean))
+
+    if known_entities is None:
+        source_by_citation_key, source_issues = load_source_lookup_for_keys(
+            data_root,
+            project_root,
+            (key for _, citation_keys, _ in entity_citations for key in citation_keys),
+        )
+        edge_path_by_id: dict[str, Path] = {}
+        duplicate_existing_ids: set[str] = set()
+        for rel_dir in sorted({entity.rel_dir for entity, _, _ in entity_citations} | removed_dirs):
+            kind = rel_dir.split("/", 1)[0]
+            entity_id = rel_dir.rsplit("@", 1)[1]
+            edge_path_by_id.update(
+                derived_edge_candidates(edge_root, sanitize_fragment(f"citation-{kind}-{entity_id}") + "-")
+            )
+    else:
+        source_by_citation_key, source_issues = load_source_lookup(data_root, project_root)
+        edge_path_by_id, duplicate_existing_ids = index_existing_edges(data_root)
 
-    edge_path_by_id, duplicate_existing_ids = index_existing_edges(data_root)
-    created_paths: list[str] = []
-    updated_paths: list[str] = []
+    stale_candidates = {
+        edge_id: path for edge_id, path in edge_path_by_id.items() if edge_id.startswith("citation-")
+    }
+    store = EdgeStore(edge_root=edge_root, project_root=project_root, edge_path_by_id=edge_path_by_id)
     issues: list[dict[str, Any]] = [*source_issues]
     entities_scanned = 0
     citation_links_scanned = 0
     unchanged_existing = 0
+    derived_ids: set[str] = set()
+    owner_refs: set[str] = set(removed_dirs)
 
     for edge_id in sorted(duplicate_existing_ids):
         issues.append(
@@ -492,22 +619,19 @@ def derive_citation_edges(
             }
         )
 
-    for rel_dir in sorted(entities):
-        entity = entities[rel_dir]
+    for entity, citation_keys, clean in entity_citations:
         entities_scanned += 1
-        citation_keys = read_citations_from_markdown(entity.index_path)
-
-        if entity.kind == "person":
-            citation_keys.update(read_citations_from_jsonl(entity.directory / "employment-history.jsonl"))
-            citation_keys.update(read_citations_from_jsonl(entity.directory / "looking-for.jsonl"))
-            citation_keys.update(read_citations_from_jsonl(entity.directory / "changelog.jsonl"))
-        elif entity.kind == "org":
-            citation_keys.update(read_citations_from_jsonl(entity.directory / "changelog.jsonl"))
+        if clean:
+            owner_refs.add(entity.rel_dir)
 
         for citation_key in sorted(citation_keys):
             citation_links_scanned += 1
+            edge_id = sanitize_fragment(
+                f"citation-{entity.kind}-{entity.entity_id}-{citation_key}"
+            )
             target_source_rel = source_by_citation_key.get(citation_key)
             if target_source_rel is None:
+                derived_ids.add(edge_id)
                 issues.append(
                     {
                         "code": "unresolved_citation",
@@ -520,9 +644,7 @@ def derive_citation_edges(
             if target_source_rel == entity.rel_dir:
                 continue
 
-            edge_id = sanitize_fragment(
-                f"citation-{entity.kind}-{entity.entity_id}-{citation_key}"
-            )
+            derived_ids.add(edge_id)
             payload = {
                 "id": edge_id,
                 "relation": relation_for_citation(),
@@ -540,11 +662,8 @@ def derive_citation_edges(
                 ),
                 "strength": None,
             }
-            first_noted_at, last_verified_at = _merge_existing_edge_dates(
-                edge_id=edge_id,
+            first_noted_at, last_verified_at = store.merge_dates(
                 candidate_payload=payload,
-                edge_path_by_id=edge_path_by_id,
-                project_root=project_root,
                 issues=issues,
                 effective_as_of=effective_as_of,
             )
@@ -554,53 +673,66 @@ def derive_citation_edges(
                 payload
             )
 
-            changed = write_edge_record(
-                edge_record=edge_record,
-                edge_root=edge_root,
-                project_root=project_root,
-                edge_path_by_id=edge_path_by_id,
-                created_paths=created_paths,
-                updated_paths=updated_paths,
-                issues=issues,
-            )
-            if not changed and edge_id in edge_path_by_id:
-                edge_path = edge_root / shard_for_value(edge_id) / f"edge@{edge_id}.json"
-                if edge_path.exists() and edge_path.read_text(encoding="utf-8") == (
-                    json.dumps(edge_record.model_dump(by_alias=True), indent=2, sort_keys=True) + "\n"
-                ):
-                    unchanged_existing += 1
-
-    created_paths.sort()
-    updated_paths.sort()
+            if store.stage(edge_record, issues) == "unchanged":
+                unchanged_existing += 1
+
+    created_paths, updated_paths = store.flush()
+    removed = remove_stale_derived_edges(
+        candidates=stale_candidates,
+        keep_ids=derived_ids,
+        relation=relation_for_citation(),
+        owner_refs=owner_refs,
+        project_root=project_root,
+    )
+    removed_paths = sorted(removed.values())
+    update_edge_index(
+        project_root=project_root,
+        data_root=data_root,
+        upserts=store.flushed,
+        removed_ids=removed,
+    )
+
     return {
         "ok": len(issues) == 0,
         "data_root": relpath(data_root, project_root),
         "as_of": effective_as_of,
+        "scope": "full" if known_entities is not None else "changed",
         "entities_scanned": entities_scanned,
         "citation_links_scanned": citation_links_scanned,
         "created_edge_files": len(created_paths),
         "updated_edge_files": len(updated_paths),
+        "removed_edge_files": len(removed_paths),
         "unchanged_existing": unchanged_existing,
         "issue_count": len(issues),
         "issues": issues,
         "created_paths": created_paths,
         "updated_paths": updated_paths,
+        "removed_paths": removed_paths,
     }
 
 
-def read_edge_record(path: Path) -> EdgeRecord:
-    payload = json.loads(path.read_text(encoding="utf-8"))
+def parse_edge_record(text: str) -> EdgeRecord:
+    payload = json.loads(text)
     if not isinstance(payload, dict):
         raise ValueError("expected top-level JSON object")
     return EdgeRecord.model_validate(payload)
 
 
+def read_edge_record(path: Path) -> EdgeRecord:
+    return parse_edge_record(path.read_text(encoding="utf-8"))
+
+
+def backlink_target(*, link_path: Path, target_path: Path) -> str:
+    return os.path.relpath(target_path, start=link_path.parent).replace(os.sep, "/")
+
+
 def sync_edge_backlinks(*, project_root: Path, data_root: Path) -> dict[str, Any]:
     entities = gather_entities(data_root)
     edge_files = gather_edge_files(data_root)
 
     issues: list[dict[str, Any]] = []
     planned_links: dict[Path, Path] = {}
+    edge_index = EdgeIndex(data_root=relpath(data_root, project_root))
     seen_edge_ids: dict[str, Path] = {}
     valid_edge_files = 0
 
@@ -649,6 +781,7 @@ def sync_edge_backlinks(*, project_root: Path, data_root: Path) -> dict[str, Any
             )
             continue
         seen_edge_ids[edge_record.id] = edge_file.path
+        edge_index.add_file(edge_file.path, edge_record, project_root=project_root)
 
         from_entity = entities.get(edge_record.from_entity)
         to_entity = entities.get(edge_record.to_entity)
@@ -690,12 +823,16 @@ def sync_edge_backlinks(*, project_root: Path, data_root: Path) -> dict[str, Any
             planned_links[link_path] = edge_file.path
 
     links_removed = 0
+    links_retargeted = 0
+    links_unchanged = 0
+    handled_links: set[Path] = set()
     for entity in entities.values():
         edges_dir = entity.directory / "edges"
         edges_dir.mkdir(parents=True, exist_ok=True)
         gitkeep = edges_dir / ".gitkeep"
         if not gitkeep.exists():
             gitkeep.write_text("", encoding="utf-8")
+            record_write(gitkeep)
 
         for existing in sorted(edges_dir.glob("edge@*.json"), key=lambda path: path.as_posix()):
             if existing.is_dir():
@@ -707,15 +844,40 @@ def sync_edge_backlinks(*, project_root: Path, data_root: Path) -> dict[str, Any
                     }
                 )
                 continue
+
+            target_path = planned_links.get(existing)
+            if target_path is None:
+                existing.unlink()
+                record_write(existing)
+                links_removed += 1
+                continue
+
+            handled_links.add(existing)
+            relative_target = backlink_target(link_path=existing, target_path=target_path)
+            try:
+                current_target = os.readlink(existing)
+            except OSError:
+                current_target = None
+            if current_target == relative_target:
+                links_unchanged += 1
+                continue
+
             existing.unlink()
-            links_removed += 1
+            os.symlink(relative_target, existing)
+            record_write(existing)
+            links_retargeted += 1
 
     links_created = 0
     for link_path, target_path in sorted(planned_links.items(), key=lambda item: item[0].as_posix()):
-        relative_target = os.path.relpath(target_path, start=link_path.parent).replace(os.sep, "/")
-        os.symlink(relative_target, link_path)
+        if link_path in handled_links:
+            continue
+        os.symlink(backlink_target(link_path=link_path, target_path=target_path), link_path)
+        record_write(link_path)
         links_created += 1
 
+    index_path = edge_index_path(project_root)
+    edge_index.save(index_path)
+
     return {
         "ok": len(issues) == 0,
         "data_root": relpath(data_root, project_root),
@@ -724,6 +886,10 @@ def sync_edge_backlinks(*, project_root: Path, data_root: Path) -> dict[str, Any
         "planned_backlinks": len(planned_links),
         "links_removed": links_removed,
         "links_created": links_created,
+        "links_retargeted": links_retargeted,
+        "links_unchanged": links_unchanged,
+        "edge_index": relpath(index_path, project_root),
+        "indexed_edges": len(edge_index.edges),
         "issue_count": len(issues),
         "issues": issues,
     }
@@ -28,7 +28,7 @@ from kb.enrichment_config import ConfidenceLevel, EnrichmentConfig, SupportedSou
 from kb.enrichment_linkedin_adapter import LinkedInSourceAdapter
 from kb.enrichment_runtime_logging import runtime_log
 from kb.enrichment_skool_adapter import SkoolSourceAdapter
-from kb.edges import derive_citation_edges, derive_employment_edges, sync_edge_backlinks
+from kb.edges import changed_entity_dirs, derive_citation_edges, derive_employment_edges, sync_edge_backlinks
 from kb.schemas import (
     EmploymentHistoryRow,
     KBBaseModel,
@@ -2399,6 +2399,7 @@ def _run_validate_changed(*, project_root: Path) -> dict[str, Any]:
 
 def _run_validation_auto_remediation(*, project_root: Path, as_of: str) -> list[dict[str, Any]]:
     data_root = infer_data_root(project_root, None)
+    entity_dirs = changed_entity_dirs(data_root, collect_changed_paths(project_root, data_root))
     return [
         _run_remediation_step(
             step_name="derive-employment-edges",
@@ -2406,6 +2407,7 @@ def _run_validation_auto_remediation(*, project_root: Path, as_of: str) -> list[
                 project_root=project_root,
                 data_root=data_root,
                 as_of=as_of,
+                changed_entity_dirs=entity_dirs,
             ),
         ),
         _run_remediation_step(
@@ -2414,6 +2416,7 @@ def _run_validation_auto_remediation(*, project_root: Path, as_of: str) -> list[
                 project_root=project_root,
                 data_root=data_root,
                 as_of=as_of,
+                changed_entity_dirs=entity_dirs,
             ),
         ),
         _run_remediation_step(
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import yaml
+from pydantic import ValidationError
+
+from kb.schemas import ChangelogRow, EmploymentHistoryRow, LookingForRow
+
+FRONTMATTER_RE = re.compile(r"\A---\s*\n(.*?)\n---\s*\n?", re.DOTALL)
+FOOTNOTE_REF_RE = re.compile(r"\[\^([^\]]+)\](?!:)")
+
+
+@dataclass(frozen=True)
+class JsonlLineError:
+    line: int
+    code: str
+    message: str
+
+
+@dataclass(frozen=True)
+class LoadedJsonl:
+    path: Path
+    exists: bool
+    rows: list[tuple[int, Any]]
+    errors: list[JsonlLineError]
+    citation_keys: list[str]
+
+    def records(self) -> list[Any]:
+        return [record for _, record in self.rows]
+
+    def raise_for_errors(self) -> None:
+        if not self.errors:
+            return
+        error = self.errors[0]
+        label = "JSON parse error" if error.code == "invalid_jsonl" else "schema error"
+        raise ValueError(f"{self.path.as_posix()}:{error.line} {label}: {error.message}")
+
+
+@dataclass(frozen=True)
+class LoadedMarkdown:
+    path: Path
+    exists: bool
+    has_frontmatter: bool
+    frontmatter: Any
+    frontmatter_error: str | None
+    body: str
+    citation_keys: list[str]
+
+    def metadata(self) -> dict[str, Any]:
+        return self.frontmatter if isinstance(self.frontmatter, dict) else {}
+
+
+@dataclass(frozen=True)
+class LoadedEntity:
+    kind: str
+    directory: Path
+    index: LoadedMarkdown
+    jsonl: dict[str, LoadedJsonl]
+
+    def citation_keys(self) -> set[str]:
+        keys = set(self.index.citation_keys)
+        for loaded in self.jsonl.values():
+            keys.update(loaded.citation_keys)
+        return keys
+
+
+def extract_citation_keys(text: str | None) -> list[str]:
+    if not text:
+        return []
+
+    seen: set[str] = set()
+    ordered: list[str] = []
+    for match in FOOTNOTE_REF_RE.finditer(text):
+        key = match.group(1).strip()
+        if not key or key in seen:
+            continue
+        seen.add(key)
+        ordered.append(key)
+    return ordered
+
+
+def entity_jsonl_files(kind: str) -> list[tuple[str, str, type]]:
+    jsonl_files: list[tuple[str, str, type]] = []
+    if kind in {"person", "org"}:
+        jsonl_files.append(("changelog", "changelog.jsonl", ChangelogRow))
+    if kind == "person":
+        jsonl_files.append(("employment", "employment-history.jsonl", EmploymentHistoryRow))
+        jsonl_files.append(("looking_for", "looking-for.jsonl", LookingForRow))
+    return jsonl_files
+
+
+def load_jsonl(path: Path, model_cls: type) -> LoadedJsonl:
+    rows: list[tuple[int, Any]] = []
+    errors: list[JsonlLineError] = []
+    citation_keys: dict[str, None] = {}
+    try:
+        handle = path.open("r", encoding="utf-8")
+    except FileNotFoundError:
+        return LoadedJsonl(path=path, exists=False, rows=rows, errors=errors, citation_keys=[])
+
+    with handle:
+        for line_number, line in enumerate(handle, start=1):
+            text = line.strip()
+            if not text:
+                continue
+            try:
+                payload = json.loads(text)
+            except json.JSONDecodeError as exc:
+                errors.append(JsonlLineError(line=line_number, code="invalid_jsonl", message=exc.msg))
+                continue
+
+            if isinstance(payload, dict):
+                for value in payload.values():
+                    if isinstance(value, str):
+                        citation_keys.update(dict.fromkeys(extract_citation_keys(value)))
+
+            try:
+                rows.append((line_number, model_cls.model_validate(payload)))
+            except ValidationError as exc:
+                errors.append(JsonlLineError(line=line_number, code="schema_error", message=exc.errors()[0]["msg"]))
+
+    return LoadedJsonl(path=path, exists=True, rows=rows, errors=errors, citation_keys=list(citation_keys))
+
+
+def load_markdown(path: Path) -> LoadedMarkdown:
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return LoadedMarkdown(
+            path=path,
+            exists=False,
+            has_frontmatter=False,
+            frontmatter=None,
+            frontmatter_error=None,
+            body="",
+            citation_keys=[],
+        )
+
+    frontmatter: Any = None
+    frontmatter_error: str | None = None
+    body = text
+    match = FRONTMATTER_RE.match(text)
+    if match:
+        try:
+            frontmatter = yaml.safe_load(match.group(1)) or {}
+        except yaml.YAMLError as exc:
+            frontmatter_error = str(exc)
+        body = text[match.end() :].lstrip("\n")
+
+    return LoadedMarkdown(
+        path=path,
+        exists=True,
+        has_frontmatter=match is not None,
+        frontmatter=frontmatter,
+        frontmatter_error=frontmatter_error,
+        body=body,
+        citation_keys=extract_citation_keys(text),
+    )
+
+
+def load_entity(directory: Path, kind: str) -> LoadedEntity:
+    return LoadedEntity(
+        kind=kind,
+        directory=directory,
+        index=load_markdown(directory / "index.md"),
+        jsonl={
+            group: load_jsonl(directory / filename, model_cls)
+            for group, filename, model_cls in entity_jsonl_files(kind)
+        },
+    )
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import heapq
+import json
+import math
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+LEXICAL_INDEX_VERSION = 1
+BM25_K1 = 1.2
+BM25_B = 0.75
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> list[str]:
+    return [token for token in TOKEN_RE.findall(text.lower()) if len(token) > 1 or token.isdigit()]
+
+
+def build_lexical_index(texts: list[str]) -> dict[str, Any]:
+    doc_lengths: list[int] = []
+    postings: dict[str, tuple[list[int], list[int]]] = {}
+    for row, text in enumerate(texts):
+        counts = Counter(tokenize(text))
+        doc_lengths.append(sum(counts.values()))
+        for term, frequency in counts.items():
+            rows, frequencies = postings.setdefault(term, ([], []))
+            rows.append(row)
+            frequencies.append(frequency)
+
+    doc_count = len(doc_lengths)
+    return {
+        "version": LEXICAL_INDEX_VERSION,
+        "doc_count": doc_count,
+        "avg_doc_length": (sum(doc_lengths) / doc_count) if doc_count else 0.0,
+        "doc_lengths": doc_lengths,
+        "postings": postings,
+    }
+
+
+def write_lexical_index(path: Path, lexical_index: dict[str, Any]) -> None:
+    payload = {
+        **lexical_index,
+        "postings": {
+            term: [rows, frequencies]
+            for term, (rows, frequencies) in sorted(lexical_index["postings"].items())
+        },
+    }
+    temp_path = path.with_suffix(f"{path.suffix}.tmp")
+    temp_path.write_text(json.dumps(payload, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    temp_path.replace(path)
+
+
+def load_lexical_index(path: Path) -> dict[str, Any]:
+    if not path.is_file():
+        raise ValueError(f"invalid semantic index payload: missing {path.name}")
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if int(payload.get("version") or -1) != LEXICAL_INDEX_VERSION:
+        raise ValueError(
+            f"unsupported lexical index version: {payload.get('version')} (expected {LEXICAL_INDEX_VERSION})"
+        )
+    postings = payload.get("postings")
+    if not isinstance(postings, dict):
+        raise ValueError("invalid lexical index payload: postings missing")
+    payload["postings"] = {term: (pair[0], pair[1]) for term, pair in postings.items()}
+    return payload
+
+
+def score_lexical_index(
+    lexical_index: dict[str, Any],
+    query: str,
+    *,
+    allowed_rows: set[int] | None = None,
+) -> dict[int, float]:
+    doc_count = int(lexical_index.get("doc_count") or 0)
+    if doc_count == 0:
+        return {}
+    avg_doc_length = float(lexical_index.get("avg_doc_length") or 0.0) or 1.0
+    doc_lengths = lexical_index["doc_lengths"]
+    postings = lexical_index["postings"]
+
+    scores: dict[int, float] = {}
+    for term in set(tokenize(query)):
+        posting = postings.get(term)
+        if posting is None:
+            continue
+        rows, frequencies = posting
+        idf = math.log(1.0 + (doc_count - len(rows) + 0.5) / (len(rows) + 0.5))
+        for row, frequency in zip(rows, frequencies):
+            if allowed_rows is not None and row not in allowed_rows:
+                continue
+            norm = BM25_K1 * (1.0 - BM25_B + BM25_B * doc_lengths[row] / avg_doc_length)
+            scores[row] = scores.get(row, 0.0) + idf * frequency * (BM25_K1 + 1.0) / (frequency + norm)
+    return scores
+
+
+def rank_lexical_rows(
+    lexical_index: dict[str, Any],
+    query: str,
+    *,
+    limit: int,
+    allowed_rows: set[int] | None = None,
+) -> list[tuple[int, float]]:
+    scores = score_lexical_index(lexical_index, query, allowed_rows=allowed_rows)
+    return heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
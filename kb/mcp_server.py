@@ -1,18 +1,17 @@
 from __future__ import annotations
 
-import fcntl
-import fnmatch
 import json
 import os
 import re
 import secrets
 import subprocess
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from contextlib import contextmanager
 from datetime import date as _date
 from pathlib import Path
-from typing import Any, Callable, Literal
+from typing import Any, Callable, Iterator, Literal
 
 from fastmcp import FastMCP
 from fastmcp.server.auth import AuthProvider, JWTVerifier, OAuthProvider, RemoteAuthProvider
@@ -28,18 +27,26 @@ from fastmcp.server.auth.providers.in_memory import (
 )
 from mcp.server.auth.settings import ClientRegistrationOptions
 from mcp.types import ToolAnnotations
-from pydantic import AnyHttpUrl, BaseModel, ConfigDict, Field, ValidationError
+from pydantic import AnyHttpUrl, BaseModel, ConfigDict, Field, ValidationError, field_validator
 from starlette.requests import Request
 from starlette.responses import RedirectResponse, Response
 import yaml
 
+from kb.edge_index import invalidate_edge_index
 from kb.edges import sync_edge_backlinks
 from kb.semantic import (
     DEFAULT_INDEX_PATH,
     DEFAULT_MODEL_CACHE_PATH,
     DEFAULT_MODEL_NAME,
+    DEFAULT_QUERY_CACHE_PATH,
+    DEFAULT_RRF_K,
+    EmbeddingBackend,
+    EmbeddingBackendPool,
     FastEmbedBackend,
-    load_semantic_index,
+    QueryEmbeddingCache,
+    SemanticFilter,
+    SemanticIndexCache,
+    hybrid_search_index,
     resolve_runtime_path as semantic_resolve_runtime_path,
     search_semantic_index,
 )
@@ -52,7 +59,12 @@ from kb.schemas import (
     shard_for_slug,
     validate_entity_rel_path,
 )
+from kb.push_queue import PushQueue, PushQueueRegistry
+from kb.reference_graph import ReferenceGraph, ReferenceGraphRegistry
+from kb.text_index import DataTextIndexRegistry
 from kb.validate import infer_data_root, run_validation
+from kb.write_journal import WriteJournal, record_write, recording
+from kb.write_queue import FairWriteQueue, FairWriteQueueRegistry, WriteQueueTimeout
 
 SLUG_RE = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
 LOCK_FILENAME = ".kb-write.lock"
@@ -68,11 +80,20 @@ EXTERNAL_JWT_AUDIENCE_ENV_VAR = "KB_MCP_EXTERNAL_JWT_AUDIENCE"
 EXTERNAL_JWT_ALGORITHM_ENV_VAR = "KB_MCP_EXTERNAL_JWT_ALGORITHM"
 EXTERNAL_REQUIRED_SCOPES_ENV_VAR = "KB_MCP_EXTERNAL_REQUIRED_SCOPES"
 EXTERNAL_SCOPES_SUPPORTED_ENV_VAR = "KB_MCP_EXTERNAL_SCOPES_SUPPORTED"
+PERSIST_QUERY_CACHE_ENV_VAR = "KB_MCP_PERSIST_QUERY_CACHE"
+WRITE_COALESCE_MS_ENV_VAR = "KB_MCP_WRITE_COALESCE_MS"
+PUSH_MODE_ENV_VAR = "KB_MCP_PUSH_MODE"
+PUSH_MODE_SYNC = {"sync", "inline", "blocking"}
+PUSH_SHUTDOWN_FLUSH_SECONDS = 30.0
+WRITE_LOCK_TIMEOUT_ENV_VAR = "KB_MCP_WRITE_LOCK_TIMEOUT_SECONDS"
+DEFAULT_WRITE_LOCK_TIMEOUT_SECONDS = 30.0
+MAX_WRITE_BATCH_OPERATIONS = 500
+MAX_TRAVERSAL_DEPTH = 4
 DEFAULT_HTTP_OAUTH_MODE = "in-memory"
 OAUTH_MODE_DISABLED = {"off", "none", "disabled", "false", "0"}
 OAUTH_MODE_IN_MEMORY = {"in-memory", "memory"}
 OAUTH_MODE_EXTERNAL_JWT = {"external-jwt", "external_jwt"}
-TEXT_FILE_SUFFIXES = {".md", ".json", ".jsonl", ".txt", ".yaml", ".yml", ".csv"}
+ENV_FLAG_ENABLED = {"1", "true", "yes", "on"}
 SEARCH_FILE_TYPE_GLOBS: dict[str, str | None] = {
     "all": None,
     "md": "*.md",
@@ -131,6 +152,14 @@ READ_ONLY_TOOL_ANNOTATIONS = ToolAnnotations(
 )
 
 
+SEMANTIC_INDEX_CACHE = SemanticIndexCache()
+EMBEDDING_BACKEND_POOL = EmbeddingBackendPool()
+DATA_TEXT_INDEXES = DataTextIndexRegistry()
+REFERENCE_GRAPHS = ReferenceGraphRegistry()
+PUSH_QUEUES = PushQueueRegistry()
+WRITE_QUEUES = FairWriteQueueRegistry()
+
+
 class BusyLockError(RuntimeError):
     pass
 
@@ -269,6 +298,71 @@ class ApplySourcedChangesInput(BaseModel):
     commit_message: str | None = None
 
 
+class UpsertEntityOperationInput(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    op: Literal["upsert_entity"]
+    kind: Literal["person", "org"]
+    slug: str = Field(pattern=r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
+    frontmatter: dict[str, Any] = Field(default_factory=dict)
+    body: str = ""
+
+
+class UpsertSourceOperationInput(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    op: Literal["upsert_source"]
+    slug: str = Field(pattern=r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
+    source_type: str = SourceType.document.value
+    note_type: str | None = None
+    frontmatter: dict[str, Any] = Field(default_factory=dict)
+    body: str = ""
+
+
+class UpsertNoteOperationInput(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    op: Literal["upsert_note"]
+    slug: str = Field(pattern=r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
+    frontmatter: dict[str, Any] = Field(default_factory=dict)
+    body: str = ""
+
+
+class UpsertEdgeOperationInput(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    op: Literal["upsert_edge"]
+    edge: dict[str, Any]
+
+
+class WorksAtRelationOperationInput(WorksAtRelationUpsertInput):
+    op: Literal["upsert_works_at_relation"]
+
+
+class KnowsRelationOperationInput(KnowsRelationUpsertInput):
+    op: Literal["upsert_knows_relation"]
+
+
+class CitesRelationOperationInput(CitesRelationUpsertInput):
+    op: Literal["upsert_cites_relation"]
+
+
+class RelationUpdateOperationInput(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    op: Literal["update_relation"]
+    relation: Literal["works_at", "knows", "cites"]
+    edge_id: str = Field(pattern=r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
+    patch: dict[str, Any]
+
+
+class ApplyWriteBatchInput(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    operations: list[dict[str, Any]] = Field(min_length=1, max_length=MAX_WRITE_BATCH_OPERATIONS)
+    commit_message: str | None = None
+
+
 class ReadDataFileInput(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -284,6 +378,17 @@ class ListDataFilesInput(BaseModel):
     limit: int = Field(default=200, ge=1, le=10_000)
 
 
+class TraverseGraphInput(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    start: str
+    max_depth: int = Field(default=2, ge=1, le=MAX_TRAVERSAL_DEPTH)
+    relations: list[Literal["works_at", "knows", "cites"]] | None = None
+    direction: Literal["out", "in", "both"] = "both"
+    as_of: str | None = None
+    limit: int = Field(default=100, ge=1, le=2000)
+
+
 class SearchDataInput(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -295,9 +400,35 @@ class SearchDataInput(BaseModel):
     max_results: int = Field(default=100, ge=1, le=2000)
 
 
-class SemanticSearchInput(BaseModel):
+class SemanticFilterInput(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
+    kinds: list[str] | None = None
+    path_prefix: str | None = None
+    entity: str | None = None
+    source_type: str | None = None
+    date_field: Literal["created-at", "updated-at", "retrieved-at", "last-contacted-at"] = "updated-at"
+    date_from: str | None = None
+    date_to: str | None = None
+
+    @field_validator("date_from", "date_to")
+    @classmethod
+    def validate_date_bound(cls, value: str | None) -> str | None:
+        return parse_partial_date(value) if value is not None else None
+
+    def semantic_filter(self) -> SemanticFilter:
+        return SemanticFilter(
+            kinds=tuple(self.kinds or ()),
+            path_prefix=self.path_prefix,
+            entity=self.entity,
+            source_type=self.source_type,
+            date_field=self.date_field,
+            date_from=self.date_from,
+            date_to=self.date_to,
+        )
+
+
+class SemanticSearchInput(SemanticFilterInput):
     query: str = Field(min_length=1)
     limit: int = Field(default=8, ge=1, le=200)
     min_score: float | None = None
@@ -305,6 +436,21 @@ class SemanticSearchInput(BaseModel):
     model: str | None = None
     cache_dir: str = DEFAULT_MODEL_CACHE_PATH
     allow_model_mismatch: bool = False
+    exact: bool = False
+    n_probe: int | None = Field(default=None, ge=1, le=4096)
+
+
+class HybridSearchInput(SemanticFilterInput):
+    query: str = Field(min_length=1)
+    limit: int = Field(default=8, ge=1, le=200)
+    candidate_limit: int | None = Field(default=None, ge=1, le=2000)
+    rrf_k: int = Field(default=DEFAULT_RRF_K, ge=1, le=1000)
+    index_path: str = DEFAULT_INDEX_PATH
+    model: str | None = None
+    cache_dir: str = DEFAULT_MODEL_CACHE_PATH
+    allow_model_mismatch: bool = False
+    exact: bool = False
+    n_probe: int | None = Field(default=None, ge=1, le=4096)
 
 
 def normalize_http_path(path: str | None) -> str:
@@ -788,6 +934,16 @@ def list_scoped_data_files(
     return paths, truncated, total
 
 
+def list_path_changes(project_root: Path, paths: list[str]) -> set[str]:
+    if not paths:
+        return set()
+    result = run_git(
+        project_root,
+        ["status", "--porcelain", "--untracked-files=all", "--", *paths],
+    )
+    return parse_porcelain_paths(result.stdout)
+
+
 def list_repo_changes(project_root: Path) -> set[str]:
     result = run_git(
         project_root,
@@ -802,197 +958,136 @@ def is_path_within_data_root(path: str, data_root_rel: str) -> bool:
     return normalized == base or normalized.startswith(f"{base}/")
 
 
-def parse_rg_json_matches(stdout: str) -> tuple[list[dict[str, Any]], dict[str, Any]]:
-    matches: list[dict[str, Any]] = []
-    summary_stats: dict[str, Any] = {}
-    for line in stdout.splitlines():
-        raw = line.strip()
-        if not raw:
-            continue
+def resolve_git_dir(project_root: Path) -> Path | None:
+    dot_git = project_root / ".git"
+    if dot_git.is_dir():
+        return dot_git
+    try:
+        pointer = dot_git.read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    if not pointer.startswith("gitdir: "):
+        return None
+    git_dir = Path(pointer[len("gitdir: ") :])
+    return git_dir if git_dir.is_absolute() else project_root / git_dir
+
+
+def read_head_commit(project_root: Path) -> str | None:
+    git_dir = resolve_git_dir(project_root)
+    if git_dir is None:
+        return None
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    if not head.startswith("ref: "):
+        return head or None
+    ref = head[len("ref: ") :]
+    common_dir = git_dir
+    try:
+        common_dir = git_dir / (git_dir / "commondir").read_text(encoding="utf-8").strip()
+    except OSError:
+        pass
+    for ref_dir in (git_dir, common_dir):
         try:
-            event = json.loads(raw)
-        except json.JSONDecodeError:
+            return (ref_dir / ref).read_text(encoding="utf-8").strip() or None
+        except OSError:
             continue
-        event_type = str(event.get("type") or "")
-        data = event.get("data") or {}
-        if event_type == "match":
-            path = str(((data.get("path") or {}).get("text") or "")).replace("\\", "/")
-            line_number = int(data.get("line_number") or 0)
-            line_text = str(((data.get("lines") or {}).get("text") or "")).rstrip("\n")
-            submatches_payload = data.get("submatches") or []
-            submatches: list[dict[str, Any]] = []
-            for sub in submatches_payload:
-                if not isinstance(sub, dict):
-                    continue
-                match_payload = sub.get("match") or {}
-                submatches.append(
-                    {
-                        "start": sub.get("start"),
-                        "end": sub.get("end"),
-                        "text": str(match_payload.get("text") or ""),
-                    }
-                )
-            matches.append(
-                {
-                    "path": path,
-                    "line_number": line_number,
-                    "line": line_text,
-                    "submatches": submatches,
-                }
-            )
-        elif event_type == "summary":
-            stats = data.get("stats")
-            if isinstance(stats, dict):
-                summary_stats = stats
-    return matches, summary_stats
+    try:
+        packed_refs = (common_dir / "packed-refs").read_text(encoding="utf-8")
+    except OSError:
+        return None
+    for line in packed_refs.splitlines():
+        sha, _, name = line.partition(" ")
+        if name == ref:
+            return sha
+    return None
 
 
-def search_data_with_ripgrep(
+def current_reference_graph(project_root: Path, data_root: Path) -> ReferenceGraph:
+    graph = REFERENCE_GRAPHS.get(project_root=project_root, data_root=data_root)
+    head = read_head_commit(project_root)
+    if graph.is_built and head is not None and graph.head == head:
+        return graph
+    # HEAD moved or could not be read from the git dir: let git resolve it under the lock.
+    with repo_write_lock(project_root):
+        return sync_reference_graph(project_root, data_root)
+
+
+def traverse_reference_graph(
     *,
     project_root: Path,
     data_root: Path,
-    payload: SearchDataInput,
-) -> dict[str, Any]:
-    args = [
-        "rg",
-        "--json",
-        "--line-number",
-        "--color",
-        "never",
-    ]
-    if not payload.case_sensitive:
-        args.append("-i")
-    if payload.fixed_strings:
-        args.append("-F")
-    file_glob = SEARCH_FILE_TYPE_GLOBS[payload.file_type]
-    if file_glob:
-        args.extend(["--glob", file_glob])
-    if payload.glob:
-        args.extend(["--glob", payload.glob])
-    args.extend([payload.query, relpath(data_root, project_root)])
-
-    completed = subprocess.run(
-        args,
-        cwd=project_root,
-        text=True,
-        capture_output=True,
-        check=False,
+    payload: TraverseGraphInput,
+) -> dict[str, Any] | None:
+    start = validate_entity_rel_path(payload.start)
+    as_of = parse_partial_date(payload.as_of) if payload.as_of is not None else None
+    graph = current_reference_graph(project_root, data_root)
+    if start not in graph.entities:
+        return None
+    return graph.traverse(
+        start,
+        max_depth=payload.max_depth,
+        relations=payload.relations,
+        direction=payload.direction,
+        as_of=as_of,
+        limit=payload.limit,
     )
-    if completed.returncode not in {0, 1}:
-        error_text = completed.stderr.strip() or completed.stdout.strip() or "ripgrep query failed"
-        if "regex parse error" in error_text.lower():
-            raise ValueError(error_text)
-        raise RuntimeError(error_text)
-
-    raw_matches, summary = parse_rg_json_matches(completed.stdout)
-    truncated = len(raw_matches) > payload.max_results
-    return {
-        "engine": "ripgrep",
-        "query": payload.query,
-        "matches": raw_matches[: payload.max_results],
-        "match_count": len(raw_matches),
-        "truncated": truncated,
-        "summary": summary,
-    }
 
 
-def search_data_with_python_fallback(
+def search_data_with_text_index(
     *,
     project_root: Path,
     data_root: Path,
     payload: SearchDataInput,
 ) -> dict[str, Any]:
-    file_glob = SEARCH_FILE_TYPE_GLOBS[payload.file_type]
-    pattern: re.Pattern[str] | None = None
-    needle = payload.query
-    if payload.fixed_strings:
-        if not payload.case_sensitive:
-            needle = needle.lower()
-    else:
-        flags = 0 if payload.case_sensitive else re.IGNORECASE
-        try:
-            pattern = re.compile(payload.query, flags)
-        except re.error as exc:
-            raise ValueError(f"invalid regex: {exc}") from exc
+    text_index = DATA_TEXT_INDEXES.get(project_root=project_root, data_root=data_root)
+    return text_index.search(
+        query=payload.query,
+        file_glob=SEARCH_FILE_TYPE_GLOBS[payload.file_type],
+        glob=payload.glob,
+        case_sensitive=payload.case_sensitive,
+        fixed_strings=payload.fixed_strings,
+        max_results=payload.max_results,
+    )
 
-    matches: list[dict[str, Any]] = []
-    truncated = False
 
-    for path in sorted(data_root.rglob("*"), key=lambda candidate: candidate.as_posix()):
-        if not path.is_file():
-            continue
-        if path.suffix.lower() not in TEXT_FILE_SUFFIXES:
-            continue
-        rel_from_data = path.relative_to(data_root).as_posix()
-        rel_from_project = relpath(path, project_root)
-        if file_glob and not fnmatch.fnmatch(rel_from_data, file_glob):
-            continue
-        if payload.glob and not fnmatch.fnmatch(rel_from_data, payload.glob):
-            continue
+def write_lock_timeout_seconds() -> float:
+    raw = (os.getenv(WRITE_LOCK_TIMEOUT_ENV_VAR) or "").strip()
+    if not raw:
+        return DEFAULT_WRITE_LOCK_TIMEOUT_SECONDS
+    try:
+        return max(float(raw), 0.0)
+    except ValueError as exc:
+        raise ValueError(f"{WRITE_LOCK_TIMEOUT_ENV_VAR} must be a number of seconds") from exc
 
-        lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
-        for line_number, line in enumerate(lines, start=1):
-            submatches: list[dict[str, Any]] = []
-            if payload.fixed_strings:
-                haystack = line if payload.case_sensitive else line.lower()
-                start = haystack.find(needle)
-                while start >= 0:
-                    end = start + len(needle)
-                    submatches.append({"start": start, "end": end, "text": line[start:end]})
-                    start = haystack.find(needle, end)
-            else:
-                assert pattern is not None
-                for match in pattern.finditer(line):
-                    submatches.append(
-                        {"start": match.start(), "end": match.end(), "text": match.group(0)}
-                    )
 
-            if not submatches:
-                continue
+def repo_write_queue(project_root: Path) -> FairWriteQueue:
+    return WRITE_QUEUES.get(lock_path=project_root / LOCK_FILENAME)
 
-            matches.append(
-                {
-                    "path": rel_from_project,
-                    "line_number": line_number,
-                    "line": line,
-                    "submatches": submatches,
-                }
-            )
 
-            if len(matches) > payload.max_results:
-                truncated = True
-                break
-        if truncated:
-            break
+@contextmanager
+def repo_write_lock(project_root: Path, *, timeout: float | None = None):
+    wait_seconds = write_lock_timeout_seconds() if timeout is None else timeout
+    try:
+        with repo_write_queue(project_root).acquire(timeout=wait_seconds) as lock_path:
+            yield lock_path
+    except WriteQueueTimeout as exc:
+        raise BusyLockError(f"write lock is already held ({exc})") from exc
 
-    return {
-        "engine": "python-fallback",
-        "query": payload.query,
-        "matches": matches[: payload.max_results],
-        "match_count": len(matches) if not truncated else payload.max_results + 1,
-        "truncated": truncated,
-        "summary": {},
-    }
 
+def create_query_embedding_cache(project_root: Path) -> QueryEmbeddingCache:
+    persist = (os.getenv(PERSIST_QUERY_CACHE_ENV_VAR) or "").strip().lower() in ENV_FLAG_ENABLED
+    persist_path = semantic_resolve_runtime_path(project_root, DEFAULT_QUERY_CACHE_PATH) if persist else None
+    return QueryEmbeddingCache(persist_path=persist_path)
 
-@contextmanager
-def repo_write_lock(project_root: Path):
-    lock_path = project_root / LOCK_FILENAME
-    lock_path.parent.mkdir(parents=True, exist_ok=True)
-    handle = lock_path.open("w", encoding="utf-8")
-    try:
-        fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-    except BlockingIOError as exc:
-        handle.close()
-        raise BusyLockError("write lock is already held") from exc
 
-    try:
-        yield lock_path
-    finally:
-        try:
-            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
-        finally:
-            handle.close()
+def pooled_embedding_backend(*, model_name: str, cache_dir: Path | None) -> EmbeddingBackend:
+    return EMBEDDING_BACKEND_POOL.get(
+        model_name=model_name,
+        cache_dir=cache_dir,
+        factory=FastEmbedBackend,
+    )
 
 
 def title_from_slug(slug: str) -> str:
@@ -1023,15 +1118,8 @@ def rollback_changed_paths(project_root: Path, changed_paths: list[str]) -> None
     if not scoped:
         return
 
-    tracked: list[str] = []
-    for path in scoped:
-        probe = run_git(
-            project_root,
-            ["ls-files", "--error-unmatch", "--", path],
-            check=False,
-        )
-        if probe.returncode == 0:
-            tracked.append(path)
+    listed = run_git(project_root, ["ls-files", "-z", "--", *scoped], check=False)
+    tracked = sorted({path for path in listed.stdout.split("\0") if path})
 
     if tracked:
         run_git(
@@ -1060,6 +1148,26 @@ def unauthorized_error(message: str) -> dict[str, Any]:
     return {"ok": False, "error": {"code": "unauthorized", "retryable": False, "message": message}}
 
 
+def sync_reference_graph(
+    project_root: Path,
+    data_root: Path,
+    dirty_paths: set[str] | None = None,
+) -> ReferenceGraph:
+    graph = REFERENCE_GRAPHS.get(project_root=project_root, data_root=data_root)
+    head = run_git(project_root, ["rev-parse", "HEAD"], check=False).stdout.strip() or None
+    if dirty_paths is None:
+        # Reuse the dirty-path snapshot from the last sync while HEAD is unchanged.
+        if graph.is_built and head is not None and graph.head == head:
+            return graph
+        dirty_paths = list_data_changes(project_root, data_root)
+    if not graph.is_built or graph.head != head:
+        graph.build(head=head)
+    elif dirty_paths or graph.dirty_paths:
+        graph.refresh(project_root / rel for rel in dirty_paths | graph.dirty_paths)
+    graph.dirty_paths = set(dirty_paths)
+    return graph
+
+
 def run_transaction(
     *,
     project_root: Path,
@@ -1068,28 +1176,49 @@ def run_transaction(
     apply_changes: Callable[[], dict[str, Any]],
     push: bool = True,
     validate_full: bool = False,
+    push_queue: PushQueue | None = None,
+    journaled: bool = False,
 ) -> dict[str, Any]:
     with repo_write_lock(project_root):
         data_root_rel = relpath(data_root, project_root)
-        before_repo = list_repo_changes(project_root)
-        before = list_data_changes(project_root, data_root)
+        if journaled:
+            before_repo: set[str] = set()
+            graph = sync_reference_graph(project_root, data_root)
+            before = set(graph.dirty_paths)
+        else:
+            before_repo = list_repo_changes(project_root)
+            before = list_data_changes(project_root, data_root)
+            graph = sync_reference_graph(project_root, data_root, before)
+        journal = WriteJournal(project_root=project_root)
         try:
-            apply_meta = apply_changes()
+            with recording(journal):
+                apply_meta = apply_changes()
         except Exception:
+            invalidate_edge_index(project_root)
             try:
-                after_failed_apply = list_repo_changes(project_root)
-                rollback_changed_paths(project_root, sorted(after_failed_apply - before_repo))
+                if journaled:
+                    written = [path for path in journal.paths() if path not in before]
+                    rollback_changed_paths(project_root, written)
+                    graph.refresh(project_root / rel for rel in written)
+                else:
+                    after_failed_apply = list_repo_changes(project_root)
+                    rollback_changed_paths(project_root, sorted(after_failed_apply - before_repo))
+                    graph.invalidate()
             except Exception:
-                pass
+                graph.invalidate()
             raise
 
-        after_repo = list_repo_changes(project_root)
-        repo_delta = sorted(after_repo - before_repo)
+        if journaled:
+            repo_delta = [path for path in journal.paths() if path not in before]
+        else:
+            repo_delta = sorted(list_repo_changes(project_root) - before_repo)
         non_data_delta = sorted(
             path for path in repo_delta if not is_path_within_data_root(path, data_root_rel)
         )
         if non_data_delta:
             rollback_changed_paths(project_root, repo_delta)
+            graph.refresh(project_root / rel for rel in repo_delta)
+            invalidate_edge_index(project_root)
             return {
                 "ok": False,
                 "error": {
@@ -1105,7 +1234,10 @@ def run_transaction(
                 "pushed": False,
             }
 
-        after = list_data_changes(project_root, data_root)
+        if journaled:
+            after = list_path_changes(project_root, repo_delta)
+        else:
+            after = list_data_changes(project_root, data_root)
 
         delta = sorted(after - before)
         if not delta:
@@ -1118,7 +1250,15 @@ def run_transaction(
                 "validation": None,
             }
 
-        scope_paths = None if validate_full else {(project_root / rel).absolute() for rel in delta}
+        delta_paths = [(project_root / rel).absolute() for rel in delta]
+
+        def rollback_delta() -> None:
+            rollback_changed_paths(project_root, delta)
+            graph.refresh(delta_paths)
+            invalidate_edge_index(project_root)
+
+        affected_paths = graph.refresh(delta_paths)
+        scope_paths = None if validate_full else affected_paths
         scope_label = "mcp-transaction-full" if validate_full else "mcp-transaction"
         try:
             validation_result = run_validation(
@@ -1126,13 +1266,14 @@ def run_transaction(
                 data_root=data_root,
                 scope_paths=scope_paths,
                 scope_label=scope_label,
+                graph=None if validate_full else graph,
             )
         except Exception:
-            rollback_changed_paths(project_root, delta)
+            rollback_delta()
             raise
 
         if not validation_result["ok"]:
-            rollback_changed_paths(project_root, delta)
+            rollback_delta()
             return {
                 "ok": False,
                 "error": {
@@ -1155,11 +1296,11 @@ def run_transaction(
                 check=False,
             )
         except Exception:
-            rollback_changed_paths(project_root, delta)
+            rollback_delta()
             raise
 
         if commit.returncode != 0:
-            rollback_changed_paths(project_root, delta)
+            rollback_delta()
             return {
                 "ok": False,
                 "error": {
@@ -1175,6 +1316,20 @@ def run_transaction(
             }
 
         commit_sha = run_git(project_root, ["rev-parse", "HEAD"]).stdout.strip()
+        graph.head = commit_sha
+        graph.dirty_paths.difference_update(delta)
+        DATA_TEXT_INDEXES.refresh_paths(project_root=project_root, data_root=data_root, paths=delta)
+        if push and push_queue is not None:
+            return {
+                "ok": True,
+                "committed": True,
+                "pushed": False,
+                "push": push_queue.enqueue(commit_sha),
+                "commit": commit_sha,
+                "changed_paths": delta,
+                "apply": apply_meta,
+                "validation": validation_result,
+            }
         if push:
             push_result = run_git(project_root, ["push"], check=False)
             if push_result.returncode != 0:
@@ -1358,6 +1513,7 @@ def update_relation_edge_file(
     relation: Literal["works_at", "knows", "cites"],
     edge_id: str,
     patch: dict[str, Any],
+    sync_backlinks: bool = True,
 ) -> tuple[Path, dict[str, Any]]:
     edge_path = edge_path_for_id(data_root=data_root, edge_id=edge_id)
     if not edge_path.exists():
@@ -1381,6 +1537,7 @@ def update_relation_edge_file(
         project_root=project_root,
         data_root=data_root,
         edge_payload=updated_record.model_dump(by_alias=True),
+        sync_backlinks=sync_backlinks,
     )
 
 
@@ -1399,24 +1556,29 @@ def upsert_entity_file(
     metadata[title_key] = str(metadata.get(title_key) or title_from_slug(slug)).strip()
     index_path = entity_dir / "index.md"
     index_path.write_text(render_markdown(metadata, payload.body), encoding="utf-8")
+    record_write(index_path)
 
     edges_dir = entity_dir / "edges"
     edges_dir.mkdir(parents=True, exist_ok=True)
     gitkeep = edges_dir / ".gitkeep"
     if not gitkeep.exists():
         gitkeep.write_text("", encoding="utf-8")
+        record_write(gitkeep)
 
     changelog = entity_dir / "changelog.jsonl"
     if not changelog.exists():
         changelog.write_text("", encoding="utf-8")
+        record_write(changelog)
 
     if payload.kind == "person":
         employment = entity_dir / "employment-history.jsonl"
         if not employment.exists():
             employment.write_text("", encoding="utf-8")
+            record_write(employment)
         looking_for = entity_dir / "looking-for.jsonl"
         if not looking_for.exists():
             looking_for.write_text("", encoding="utf-8")
+            record_write(looking_for)
 
     return index_path, {"kind": payload.kind, "slug": slug, "index_path": relpath(index_path, project_root)}
 
@@ -1485,21 +1647,35 @@ def source_catalog_aliases(entry: SourceCatalogEntry) -> set[str]:
     return {alias for alias in aliases if alias}
 
 
-def load_source_catalog(data_root: Path) -> dict[str, SourceCatalogEntry]:
-    by_alias: dict[str, SourceCatalogEntry] = {}
+def iter_source_records(data_root: Path, graph: ReferenceGraph | None = None) -> Iterator[SourceRecord]:
+    if graph is not None:
+        for rel_dir in sorted({*graph.source_records, *graph.invalid_source_records}):
+            error = graph.invalid_source_records.get(rel_dir)
+            if error is not None:
+                raise ValueError(f"invalid source record {rel_dir}: {error}")
+            yield graph.source_records[rel_dir]
+        return
+
     source_root = data_root / "source"
     if not source_root.exists():
-        return by_alias
-
+        return
     for index_path in sorted(source_root.rglob("index.md"), key=lambda path: path.as_posix()):
         parent = index_path.parent
         if not parent.name.startswith("source@"):
             continue
+        rel_dir = parent.relative_to(data_root).as_posix()
         frontmatter = parse_frontmatter_payload(index_path.read_text(encoding="utf-8"))
-        record = SourceRecord.model_validate(frontmatter)
-        entry = source_catalog_entry_from_record(record)
-        for alias in source_catalog_aliases(entry):
-            by_alias[alias] = entry
+        try:
+            record = SourceRecord.model_validate(frontmatter)
+        except ValidationError as exc:
+            raise ValueError(f"invalid source record {rel_dir}: {exc}") from exc
+        yield record
+
+
+def load_source_catalog(data_root: Path, graph: ReferenceGraph | None = None) -> dict[str, SourceCatalogEntry]:
+    by_alias: dict[str, SourceCatalogEntry] = {}
+    for record in iter_source_records(data_root, graph):
+        register_source_catalog_entry(by_alias, source_catalog_entry_from_record(record))
     return by_alias
 
 
@@ -1709,6 +1885,7 @@ def append_paragraph_to_entity_section(
     else:
         rendered = rendered_body
     entity_index_path.write_text(rendered, encoding="utf-8")
+    record_write(entity_index_path)
 
     return {
         "section": section if target_index is None else sections[target_index][0],
@@ -1732,10 +1909,9 @@ def append_changelog_row(
         }
     )
     changelog_path.parent.mkdir(parents=True, exist_ok=True)
-    if not changelog_path.exists():
-        changelog_path.write_text("", encoding="utf-8")
     with changelog_path.open("a", encoding="utf-8") as handle:
         handle.write(json.dumps(row.model_dump(by_alias=True), sort_keys=True) + "\n")
+    record_write(changelog_path)
     return {"date": row.date, "note": row.note}
 
 
@@ -1754,11 +1930,13 @@ def upsert_source_file(
 
     index_path = source_dir / "index.md"
     index_path.write_text(render_markdown(metadata, payload.body), encoding="utf-8")
+    record_write(index_path)
     edges_dir = source_dir / "edges"
     edges_dir.mkdir(parents=True, exist_ok=True)
     gitkeep = edges_dir / ".gitkeep"
     if not gitkeep.exists():
         gitkeep.write_text("", encoding="utf-8")
+        record_write(gitkeep)
     return index_path, {"slug": slug, "index_path": relpath(index_path, project_root)}
 
 
@@ -1788,6 +1966,7 @@ def upsert_edge_file(
     project_root: Path,
     data_root: Path,
     edge_payload: dict[str, Any],
+    sync_backlinks: bool = True,
 ) -> tuple[Path, dict[str, Any]]:
     record = EdgeRecord.model_validate(edge_payload)
     edge_path = edge_path_for_id(data_root=data_root, edge_id=record.id)
@@ -1796,12 +1975,19 @@ def upsert_edge_file(
         json.dumps(record.model_dump(by_alias=True), sort_keys=True, indent=2) + "\n",
         encoding="utf-8",
     )
+    record_write(edge_path)
+
+    meta: dict[str, Any] = {"edge_id": record.id, "edge_path": relpath(edge_path, project_root)}
+    if sync_backlinks:
+        meta["sync"] = sync_edge_backlinks_or_raise(project_root=project_root, data_root=data_root)
+    return edge_path, meta
 
+
+def sync_edge_backlinks_or_raise(*, project_root: Path, data_root: Path) -> dict[str, Any]:
     sync_result = sync_edge_backlinks(project_root=project_root, data_root=data_root)
     if not sync_result["ok"]:
         raise RuntimeError(json.dumps(sync_result, sort_keys=True))
-
-    return edge_path, {"edge_id": record.id, "edge_path": relpath(edge_path, project_root), "sync": sync_result}
+    return sync_result
 
 
 def append_entity_section_paragraph_file(
@@ -1899,6 +2085,263 @@ def parse_sourced_change_operations(
     return parsed_ops, preview_created_sources
 
 
+WRITE_OPERATION_MODELS: dict[str, type[BaseModel]] = {
+    "upsert_entity": UpsertEntityOperationInput,
+    "upsert_source": UpsertSourceOperationInput,
+    "upsert_note": UpsertNoteOperationInput,
+    "upsert_edge": UpsertEdgeOperationInput,
+    "upsert_works_at_relation": WorksAtRelationOperationInput,
+    "upsert_knows_relation": KnowsRelationOperationInput,
+    "upsert_cites_relation": CitesRelationOperationInput,
+    "update_relation": RelationUpdateOperationInput,
+    "append_entity_section_paragraph": AppendEntitySectionParagraphOperationInput,
+}
+RELATION_RECORD_BUILDERS: dict[type[BaseModel], Callable[[Any], EdgeRecord]] = {
+    WorksAtRelationOperationInput: build_works_at_relation_record,
+    KnowsRelationOperationInput: build_knows_relation_record,
+    CitesRelationOperationInput: build_cites_relation_record,
+}
+
+EDGE_WRITE_OPERATIONS = (
+    UpsertEdgeOperationInput,
+    WorksAtRelationOperationInput,
+    KnowsRelationOperationInput,
+    CitesRelationOperationInput,
+    RelationUpdateOperationInput,
+)
+
+
+def parse_write_operations(operations: list[dict[str, Any]]) -> list[BaseModel]:
+    parsed_ops: list[BaseModel] = []
+    for index, raw_operation in enumerate(operations):
+        op_name = str(raw_operation.get("op") or "").strip()
+        model_cls = WRITE_OPERATION_MODELS.get(op_name)
+        if model_cls is None:
+            raise ValueError(f"unsupported operation at index {index}: '{op_name}'")
+        parsed_ops.append(model_cls.model_validate(raw_operation))
+    return parsed_ops
+
+
+def apply_write_operation(
+    *,
+    project_root: Path,
+    data_root: Path,
+    operation: BaseModel,
+    source_catalog: dict[str, SourceCatalogEntry],
+) -> dict[str, Any]:
+    if isinstance(operation, UpsertEntityOperationInput):
+        _, meta = upsert_entity_file(
+            project_root=project_root,
+            data_root=data_root,
+            payload=EntityUpsertInput(
+                kind=operation.kind,
+                slug=operation.slug,
+                frontmatter=operation.frontmatter,
+                body=operation.body,
+            ),
+        )
+        return meta
+
+    if isinstance(operation, UpsertSourceOperationInput | UpsertNoteOperationInput):
+        source_payload = SourceUpsertInput(
+            slug=operation.slug,
+            source_type=(
+                SourceType.note
+                if isinstance(operation, UpsertNoteOperationInput)
+                else SourceType(str(operation.source_type).strip())
+            ),
+            note_type="note" if isinstance(operation, UpsertNoteOperationInput) else operation.note_type,
+            frontmatter=operation.frontmatter,
+            body=operation.body,
+        )
+        _, meta = upsert_source_file(project_root=project_root, data_root=data_root, payload=source_payload)
+        register_source_catalog_entry(
+            source_catalog,
+            source_catalog_entry_from_record(source_record_from_upsert_payload(source_payload)),
+        )
+        return meta
+
+    if isinstance(operation, UpsertEdgeOperationInput):
+        _, meta = upsert_edge_file(
+            project_root=project_root,
+            data_root=data_root,
+            edge_payload=operation.edge,
+            sync_backlinks=False,
+        )
+        return meta
+
+    builder = RELATION_RECORD_BUILDERS.get(type(operation))
+    if builder is not None:
+        _, meta = upsert_edge_file(
+            project_root=project_root,
+            data_root=data_root,
+            edge_payload=builder(operation).model_dump(by_alias=True),
+            sync_backlinks=False,
+        )
+        return meta
+
+    if isinstance(operation, RelationUpdateOperationInput):
+        _, meta = update_relation_edge_file(
+            project_root=project_root,
+            data_root=data_root,
+            relation=operation.relation,
+            edge_id=operation.edge_id,
+            patch=operation.patch,
+            sync_backlinks=False,
+        )
+        return meta
+
+    if isinstance(operation, AppendEntitySectionParagraphOperationInput):
+        return append_entity_section_paragraph_file(
+            project_root=project_root,
+            data_root=data_root,
+            entity_ref=operation.entity_ref,
+            section=operation.section,
+            paragraph=operation.paragraph,
+            changelog_note=operation.changelog_note,
+            source_refs=operation.source_refs,
+            changelog_date=operation.changelog_date,
+            create_section_if_missing=operation.create_section_if_missing,
+            source_catalog=source_catalog,
+        )
+
+    raise ValueError(f"unsupported parsed operation type: {type(operation).__name__}")
+
+
+def background_push_enabled() -> bool:
+    return (os.getenv(PUSH_MODE_ENV_VAR) or "").strip().lower() not in PUSH_MODE_SYNC
+
+
+def write_coalesce_window_seconds() -> float:
+    raw = (os.getenv(WRITE_COALESCE_MS_ENV_VAR) or "").strip()
+    if not raw:
+        return 0.0
+    try:
+        return max(float(raw), 0.0) / 1000.0
+    except ValueError as exc:
+        raise ValueError(f"{WRITE_COALESCE_MS_ENV_VAR} must be a number of milliseconds") from exc
+
+
+@dataclass
+class PendingWrite:
+    commit_message: str
+    apply_changes: Callable[[], dict[str, Any]]
+    push: bool
+    done: threading.Event = field(default_factory=threading.Event)
+    result: dict[str, Any] | None = None
+    error: BaseException | None = None
+
+
+class WriteCoalescer:
+    def __init__(
+        self,
+        *,
+        project_root: Path,
+        data_root: Path,
+        window_seconds: float = 0.0,
+        push_queue: PushQueue | None = None,
+    ) -> None:
+        self.project_root = project_root
+        self.data_root = data_root
+        self.window_seconds = window_seconds
+        self.push_queue = push_queue
+        self._pending: list[PendingWrite] = []
+        self._collecting = False
+        self._lock = threading.Lock()
+        self._run_lock = threading.Lock()
+
+    def submit(
+        self,
+        *,
+        commit_message: str,
+        apply_changes: Callable[[], dict[str, Any]],
+        push: bool = True,
+    ) -> dict[str, Any]:
+        if self.window_seconds <= 0:
+            return run_transaction(
+                project_root=self.project_root,
+                data_root=self.data_root,
+                commit_message=commit_message,
+                apply_changes=apply_changes,
+                push=push,
+                push_queue=self.push_queue,
+                journaled=True,
+            )
+
+        pending = PendingWrite(commit_message=commit_message, apply_changes=apply_changes, push=push)
+        with self._lock:
+            self._pending.append(pending)
+            leader = not self._collecting
+            self._collecting = True
+
+        if leader:
+            time.sleep(self.window_seconds)
+            with self._run_lock:
+                with self._lock:
+                    group, self._pending = self._pending, []
+                    self._collecting = False
+                for push_flag in (True, False):
+                    members = [member for member in group if member.push is push_flag]
+                    if members:
+                        self._run_group(members, push=push_flag)
+
+        pending.done.wait()
+        if pending.error is not None:
+            raise pending.error
+        assert pending.result is not None
+        return pending.result
+
+    def _run_single(self, member: PendingWrite) -> None:
+        try:
+            member.result = run_transaction(
+                project_root=self.project_root,
+                data_root=self.data_root,
+                commit_message=member.commit_message,
+                apply_changes=member.apply_changes,
+                push=member.push,
+                push_queue=self.push_queue,
+                journaled=True,
+            )
+        except BaseException as exc:
+            member.error = exc
+        finally:
+            member.done.set()
+
+    def _run_group(self, members: list[PendingWrite], *, push: bool) -> None:
+        if len(members) == 1:
+            self._run_single(members[0])
+            return
+
+        def apply() -> dict[str, Any]:
+            return {"coalesced": [member.apply_changes() for member in members]}
+
+        message = "\n".join(
+            [f"mcp(kbv2): coalesced {len(members)} writes", "", *(member.commit_message for member in members)]
+        )
+        try:
+            result = run_transaction(
+                project_root=self.project_root,
+                data_root=self.data_root,
+                commit_message=message,
+                apply_changes=apply,
+                push=push,
+                push_queue=self.push_queue,
+                journaled=True,
+            )
+        except Exception:
+            result = None
+
+        if result is None or (not result["ok"] and not result.get("committed")):
+            for member in members:
+                self._run_single(member)
+            return
+
+        applied = (result.get("apply") or {}).get("coalesced") or [None] * len(members)
+        for member, apply_meta in zip(members, applied):
+            member.result = {**result, "apply": apply_meta, "coalesced_writes": len(members)}
+            member.done.set()
+
+
 def create_mcp_server(
     *,
     project_root: Path,
@@ -1916,6 +2359,14 @@ def create_mcp_server(
     )
     if isinstance(auth_provider, OAuthProvider):
         register_oauth_discovery_alias_routes(server, mcp_path=oauth_discovery_mcp_path)
+    query_cache = create_query_embedding_cache(project_root)
+    push_queue = PUSH_QUEUES.get(project_root=project_root) if background_push_enabled() else None
+    write_coalescer = WriteCoalescer(
+        project_root=project_root,
+        data_root=data_root,
+        window_seconds=write_coalesce_window_seconds(),
+        push_queue=push_queue,
+    )
 
     @server.tool
     def upsert_entity(
@@ -1961,9 +2412,7 @@ def create_mcp_server(
             return apply_meta
 
         try:
-            result = run_transaction(
-                project_root=project_root,
-                data_root=data_root,
+            result = write_coalescer.submit(
                 commit_message=message,
                 apply_changes=apply,
                 push=push,
@@ -2059,13 +2508,10 @@ def create_mcp_server(
             return apply_meta
 
         try:
-            result = run_transaction(
-                project_root=project_root,
-                data_root=data_root,
+            result = write_coalescer.submit(
                 commit_message=message,
                 apply_changes=apply,
                 push=push,
-                validate_full=True,
             )
         except BusyLockError:
             return {
@@ -2116,9 +2562,7 @@ def create_mcp_server(
             return apply_meta
 
         try:
-            result = run_transaction(
-                project_root=project_root,
-                data_root=data_root,
+            result = write_coalescer.submit(
                 commit_message=message,
                 apply_changes=apply,
                 push=push,
@@ -2166,7 +2610,10 @@ def create_mcp_server(
         message = payload.commit_message or "mcp(kbv2): append-entity-section-paragraph"
 
         def apply() -> dict[str, Any]:
-            source_catalog = load_source_catalog(data_root)
+            source_catalog = load_source_catalog(
+                data_root,
+                REFERENCE_GRAPHS.get(project_root=project_root, data_root=data_root),
+            )
             apply_meta = append_entity_section_paragraph_file(
                 project_root=project_root,
                 data_root=data_root,
@@ -2182,13 +2629,10 @@ def create_mcp_server(
             return apply_meta
 
         try:
-            result = run_transaction(
-                project_root=project_root,
-                data_root=data_root,
+            result = write_coalescer.submit(
                 commit_message=message,
                 apply_changes=apply,
                 push=push,
-                validate_full=True,
             )
         except BusyLockError:
             return {
@@ -2226,7 +2670,10 @@ def create_mcp_server(
         message = payload.commit_message or "mcp(kbv2): apply-sourced-changes"
 
         def apply() -> dict[str, Any]:
-            source_catalog = load_source_catalog(data_root)
+            source_catalog = load_source_catalog(
+                data_root,
+                REFERENCE_GRAPHS.get(project_root=project_root, data_root=data_root),
+            )
             for preview in preview_sources:
                 register_source_catalog_entry(source_catalog, preview)
 
@@ -2302,13 +2749,74 @@ def create_mcp_server(
             }
 
         try:
-            result = run_transaction(
-                project_root=project_root,
-                data_root=data_root,
+            result = write_coalescer.submit(
+                commit_message=message,
+                apply_changes=apply,
+                push=push,
+            )
+        except BusyLockError:
+            return {
+                "ok": False,
+                "error": {"code": "busy", "retryable": True, "message": "write lock is currently held"},
+            }
+        except FileNotFoundError as exc:
+            return {"ok": False, "error": {"code": "not_found", "retryable": False, "message": str(exc)}}
+        except (ValidationError, ValueError) as exc:
+            return {"ok": False, "error": {"code": "invalid_input", "retryable": False, "message": str(exc)}}
+        except Exception as exc:
+            return {"ok": False, "error": {"code": "write_failed", "retryable": False, "message": str(exc)}}
+
+        return result
+
+    @server.tool
+    def apply_write_batch(
+        operations: list[dict[str, Any]],
+        commit_message: str | None = None,
+        push: bool = True,
+        auth_token: str | None = None,
+    ) -> dict[str, Any]:
+        try:
+            verify_auth_token(auth_token)
+            payload = ApplyWriteBatchInput(
+                operations=operations,
+                commit_message=commit_message,
+            )
+            parsed_operations = parse_write_operations(payload.operations)
+        except PermissionError as exc:
+            return unauthorized_error(str(exc))
+        except (ValidationError, ValueError) as exc:
+            return {"ok": False, "error": {"code": "invalid_input", "retryable": False, "message": str(exc)}}
+
+        message = payload.commit_message or "mcp(kbv2): apply-write-batch"
+
+        def apply() -> dict[str, Any]:
+            source_catalog = load_source_catalog(
+                data_root,
+                REFERENCE_GRAPHS.get(project_root=project_root, data_root=data_root),
+            )
+            operation_results: list[dict[str, Any]] = []
+            for operation in parsed_operations:
+                operation_meta = apply_write_operation(
+                    project_root=project_root,
+                    data_root=data_root,
+                    operation=operation,
+                    source_catalog=source_catalog,
+                )
+                operation_results.append({"op": operation.op, **operation_meta})
+
+            apply_meta: dict[str, Any] = {
+                "operations": operation_results,
+                "operation_count": len(operation_results),
+            }
+            if any(isinstance(operation, EDGE_WRITE_OPERATIONS) for operation in parsed_operations):
+                apply_meta["sync"] = sync_edge_backlinks_or_raise(project_root=project_root, data_root=data_root)
+            return apply_meta
+
+        try:
+            result = write_coalescer.submit(
                 commit_message=message,
                 apply_changes=apply,
                 push=push,
-                validate_full=True,
             )
         except BusyLockError:
             return {
@@ -2347,9 +2855,7 @@ def create_mcp_server(
 
         message = commit_message or "mcp(kbv2): upsert-edge"
         try:
-            result = run_transaction(
-                project_root=project_root,
-                data_root=data_root,
+            result = write_coalescer.submit(
                 commit_message=message,
                 apply_changes=apply,
                 push=push,
@@ -2417,9 +2923,7 @@ def create_mcp_server(
             return apply_meta
 
         try:
-            result = run_transaction(
-                project_root=project_root,
-                data_root=data_root,
+            result = write_coalescer.submit(
                 commit_message=message,
                 apply_changes=apply,
                 push=push,
@@ -2487,9 +2991,7 @@ def create_mcp_server(
             return apply_meta
 
         try:
-            result = run_transaction(
-                project_root=project_root,
-                data_root=data_root,
+            result = write_coalescer.submit(
                 commit_message=message,
                 apply_changes=apply,
                 push=push,
@@ -2555,9 +3057,7 @@ def create_mcp_server(
             return apply_meta
 
         try:
-            result = run_transaction(
-                project_root=project_root,
-                data_root=data_root,
+            result = write_coalescer.submit(
                 commit_message=message,
                 apply_changes=apply,
                 push=push,
@@ -2607,9 +3107,7 @@ def create_mcp_server(
             return apply_meta
 
         try:
-            result = run_transaction(
-                project_root=project_root,
-                data_root=data_root,
+            result = write_coalescer.submit(
                 commit_message=message,
                 apply_changes=apply,
                 push=push,
@@ -2663,9 +3161,7 @@ def create_mcp_server(
             return apply_meta
 
         try:
-            result = run_transaction(
-                project_root=project_root,
-                data_root=data_root,
+            result = write_coalescer.submit(
                 commit_message=message,
                 apply_changes=apply,
                 push=push,
@@ -2719,9 +3215,7 @@ def create_mcp_server(
             return apply_meta
 
         try:
-            result = run_transaction(
-                project_root=project_root,
-                data_root=data_root,
+            result = write_coalescer.submit(
                 commit_message=message,
                 apply_changes=apply,
                 push=push,
@@ -2778,6 +3272,87 @@ def create_mcp_server(
             "suffix": payload.suffix,
         }
 
+    @server.tool(annotations=READ_ONLY_TOOL_ANNOTATIONS)
+    def traverse_graph(
+        start: str,
+        max_depth: int = 2,
+        relations: list[Literal["works_at", "knows", "cites"]] | None = None,
+        direction: Literal["out", "in", "both"] = "both",
+        as_of: str | None = None,
+        limit: int = 100,
+        auth_token: str | None = None,
+    ) -> dict[str, Any]:
+        try:
+            verify_auth_token(auth_token)
+            payload = TraverseGraphInput(
+                start=start,
+                max_depth=max_depth,
+                relations=relations,
+                direction=direction,
+                as_of=as_of,
+                limit=limit,
+            )
+        except PermissionError as exc:
+            return unauthorized_error(str(exc))
+        except ValidationError as exc:
+            return {"ok": False, "error": {"code": "invalid_input", "retryable": False, "message": str(exc)}}
+
+        try:
+            result = traverse_reference_graph(project_root=project_root, data_root=data_root, payload=payload)
+        except BusyLockError:
+            return {
+                "ok": False,
+                "error": {"code": "busy", "retryable": True, "message": "write lock is currently held"},
+            }
+        except ValueError as exc:
+            return {"ok": False, "error": {"code": "invalid_input", "retryable": False, "message": str(exc)}}
+        except Exception as exc:
+            return {"ok": False, "error": {"code": "query_failed", "retryable": False, "message": str(exc)}}
+
+        if result is None:
+            return {
+                "ok": False,
+                "error": {
+                    "code": "not_found",
+                    "retryable": False,
+                    "message": f"entity not found: {payload.start}",
+                },
+            }
+        return {
+            "ok": True,
+            "max_depth": payload.max_depth,
+            "direction": payload.direction,
+            "relations": payload.relations,
+            "as_of": payload.as_of,
+            **result,
+        }
+
+    @server.tool(annotations=READ_ONLY_TOOL_ANNOTATIONS)
+    def push_status(auth_token: str | None = None) -> dict[str, Any]:
+        try:
+            verify_auth_token(auth_token)
+        except PermissionError as exc:
+            return unauthorized_error(str(exc))
+
+        if push_queue is None:
+            return {"ok": True, "push": {"mode": "sync"}}
+        return {"ok": True, "push": push_queue.status()}
+
+    @server.tool(annotations=READ_ONLY_TOOL_ANNOTATIONS)
+    def write_queue_status(auth_token: str | None = None) -> dict[str, Any]:
+        try:
+            verify_auth_token(auth_token)
+        except PermissionError as exc:
+            return unauthorized_error(str(exc))
+
+        return {
+            "ok": True,
+            "write_queue": {
+                **repo_write_queue(project_root).status(),
+                "timeout_seconds": write_lock_timeout_seconds(),
+            },
+        }
+
     @server.tool(annotations=READ_ONLY_TOOL_ANNOTATIONS)
     def read_data_file(
         path: str,
@@ -2844,28 +3419,11 @@ def create_mcp_server(
             return {"ok": False, "error": {"code": "invalid_input", "retryable": False, "message": str(exc)}}
 
         try:
-            result = search_data_with_ripgrep(
+            result = search_data_with_text_index(
                 project_root=project_root,
                 data_root=data_root,
                 payload=payload,
             )
-        except FileNotFoundError:
-            try:
-                result = search_data_with_python_fallback(
-                    project_root=project_root,
-                    data_root=data_root,
-                    payload=payload,
-                )
-            except ValueError as exc:
-                return {
-                    "ok": False,
-                    "error": {"code": "invalid_input", "retryable": False, "message": str(exc)},
-                }
-            except Exception as exc:
-                return {
-                    "ok": False,
-                    "error": {"code": "query_failed", "retryable": False, "message": str(exc)},
-                }
         except ValueError as exc:
             return {"ok": False, "error": {"code": "invalid_input", "retryable": False, "message": str(exc)}}
         except Exception as exc:
@@ -2873,6 +3431,26 @@ def create_mcp_server(
 
         return {"ok": True, **result}
 
+    def load_cached_semantic_index(index_file: Path) -> tuple[dict[str, Any], dict[str, Any] | None]:
+        try:
+            return SEMANTIC_INDEX_CACHE.load(index_file), None
+        except FileNotFoundError:
+            return {}, {
+                "ok": False,
+                "error": {
+                    "code": "not_found",
+                    "retryable": False,
+                    "message": (
+                        "semantic index not found; build it first with `kb semantic-index` or "
+                        "`just semantic-index`."
+                    ),
+                },
+            }
+        except ValueError as exc:
+            return {}, {"ok": False, "error": {"code": "invalid_input", "retryable": False, "message": str(exc)}}
+        except Exception as exc:
+            return {}, {"ok": False, "error": {"code": "query_failed", "retryable": False, "message": str(exc)}}
+
     @server.tool(annotations=READ_ONLY_TOOL_ANNOTATIONS)
     def semantic_search_data(
         query: str,
@@ -2882,6 +3460,15 @@ def create_mcp_server(
         model: str | None = None,
         cache_dir: str = DEFAULT_MODEL_CACHE_PATH,
         allow_model_mismatch: bool = False,
+        exact: bool = False,
+        n_probe: int | None = None,
+        kinds: list[str] | None = None,
+        path_prefix: str | None = None,
+        entity: str | None = None,
+        source_type: str | None = None,
+        date_field: str = "updated-at",
+        date_from: str | None = None,
+        date_to: str | None = None,
         auth_token: str | None = None,
     ) -> dict[str, Any]:
         try:
@@ -2894,6 +3481,15 @@ def create_mcp_server(
                 model=model,
                 cache_dir=cache_dir,
                 allow_model_mismatch=allow_model_mismatch,
+                exact=exact,
+                n_probe=n_probe,
+                kinds=kinds,
+                path_prefix=path_prefix,
+                entity=entity,
+                source_type=source_type,
+                date_field=date_field,
+                date_from=date_from,
+                date_to=date_to,
             )
         except PermissionError as exc:
             return unauthorized_error(str(exc))
@@ -2903,37 +3499,109 @@ def create_mcp_server(
         index_file = semantic_resolve_runtime_path(project_root, payload.index_path)
         cache_dir_path = semantic_resolve_runtime_path(project_root, payload.cache_dir)
 
+        index_payload, error = load_cached_semantic_index(index_file)
+        if error is not None:
+            return error
+
+        model_payload = index_payload.get("model") or {}
+        model_name = payload.model or str(model_payload.get("name") or DEFAULT_MODEL_NAME)
+        backend = pooled_embedding_backend(model_name=model_name, cache_dir=cache_dir_path)
+
         try:
-            index_payload = load_semantic_index(index_file)
-        except FileNotFoundError:
-            return {
-                "ok": False,
-                "error": {
-                    "code": "not_found",
-                    "retryable": False,
-                    "message": (
-                        "semantic index not found; build it first with `kb semantic-index` or "
-                        "`just semantic-index`."
-                    ),
-                },
-            }
+            result = search_semantic_index(
+                index_payload=index_payload,
+                query=payload.query,
+                embedding_backend=backend,
+                limit=payload.limit,
+                min_score=payload.min_score,
+                allow_model_mismatch=payload.allow_model_mismatch,
+                exact=payload.exact,
+                n_probe=payload.n_probe,
+                query_cache=query_cache,
+                semantic_filter=payload.semantic_filter(),
+            )
         except ValueError as exc:
             return {"ok": False, "error": {"code": "invalid_input", "retryable": False, "message": str(exc)}}
         except Exception as exc:
             return {"ok": False, "error": {"code": "query_failed", "retryable": False, "message": str(exc)}}
 
+        return {
+            "ok": True,
+            "index_path": relpath(index_file, project_root),
+            **result,
+        }
+
+    @server.tool(annotations=READ_ONLY_TOOL_ANNOTATIONS)
+    def hybrid_search_data(
+        query: str,
+        limit: int = 8,
+        candidate_limit: int | None = None,
+        rrf_k: int = DEFAULT_RRF_K,
+        index_path: str = DEFAULT_INDEX_PATH,
+        model: str | None = None,
+        cache_dir: str = DEFAULT_MODEL_CACHE_PATH,
+        allow_model_mismatch: bool = False,
+        exact: bool = False,
+        n_probe: int | None = None,
+        kinds: list[str] | None = None,
+        path_prefix: str | None = None,
+        entity: str | None = None,
+        source_type: str | None = None,
+        date_field: str = "updated-at",
+        date_from: str | None = None,
+        date_to: str | None = None,
+        auth_token: str | None = None,
+    ) -> dict[str, Any]:
+        try:
+            verify_auth_token(auth_token)
+            payload = HybridSearchInput(
+                query=query,
+                limit=limit,
+                candidate_limit=candidate_limit,
+                rrf_k=rrf_k,
+                index_path=index_path,
+                model=model,
+                cache_dir=cache_dir,
+                allow_model_mismatch=allow_model_mismatch,
+                exact=exact,
+                n_probe=n_probe,
+                kinds=kinds,
+                path_prefix=path_prefix,
+                entity=entity,
+                source_type=source_type,
+                date_field=date_field,
+                date_from=date_from,
+                date_to=date_to,
+            )
+        except PermissionError as exc:
+            return unauthorized_error(str(exc))
+        except ValidationError as exc:
+            return {"ok": False, "error": {"code": "invalid_input", "retryable": False, "message": str(exc)}}
+
+        index_file = semantic_resolve_runtime_path(project_root, payload.index_path)
+        cache_dir_path = semantic_resolve_runtime_path(project_root, payload.cache_dir)
+
+        index_payload, error = load_cached_semantic_index(index_file)
+        if error is not None:
+            return error
+
         model_payload = index_payload.get("model") or {}
         model_name = payload.model or str(model_payload.get("name") or DEFAULT_MODEL_NAME)
-        backend = FastEmbedBackend(model_name=model_name, cache_dir=cache_dir_path)
+        backend = pooled_embedding_backend(model_name=model_name, cache_dir=cache_dir_path)
 
         try:
-            result = search_semantic_index(
+            result = hybrid_search_index(
                 index_payload=index_payload,
                 query=payload.query,
                 embedding_backend=backend,
                 limit=payload.limit,
-                min_score=payload.min_score,
+                candidate_limit=payload.candidate_limit,
+                rrf_k=payload.rrf_k,
                 allow_model_mismatch=payload.allow_model_mismatch,
+                exact=payload.exact,
+                n_probe=payload.n_probe,
+                query_cache=query_cache,
+                semantic_filter=payload.semantic_filter(),
             )
         except ValueError as exc:
             return {"ok": False, "error": {"code": "invalid_input", "retryable": False, "message": str(exc)}}
@@ -2970,13 +3638,18 @@ def run_server(
         auth_provider=auth_provider,
         oauth_discovery_mcp_path=path,
     )
+    sync_reference_graph(project_root, data_root, list_data_changes(project_root, data_root))
     kwargs: dict[str, Any] = {}
     if transport in {"http", "sse", "streamable-http"}:
         kwargs["host"] = host
         kwargs["port"] = port
         if path:
             kwargs["path"] = path
-    server.run(transport=transport, **kwargs)
+    try:
+        server.run(transport=transport, **kwargs)
+    finally:
+        if background_push_enabled():
+            PUSH_QUEUES.get(project_root=project_root).flush(timeout=PUSH_SHUTDOWN_FLUSH_SECONDS)
 
 
 def main() -> int:
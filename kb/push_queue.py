@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import subprocess
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+DEFAULT_RETRY_INITIAL_SECONDS = 1.0
+DEFAULT_RETRY_MAX_SECONDS = 300.0
+
+
+def _timestamp(value: float | None) -> str | None:
+    if value is None:
+        return None
+    return datetime.fromtimestamp(value, tz=timezone.utc).isoformat()
+
+
+class PushQueue:
+    def __init__(
+        self,
+        *,
+        project_root: Path,
+        retry_initial_seconds: float = DEFAULT_RETRY_INITIAL_SECONDS,
+        retry_max_seconds: float = DEFAULT_RETRY_MAX_SECONDS,
+    ) -> None:
+        self.project_root = project_root
+        self.retry_initial_seconds = retry_initial_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self._condition = threading.Condition()
+        self._pending: list[tuple[str, float]] = []
+        self._worker: threading.Thread | None = None
+        self._in_flight = False
+        self._retry_at: float | None = None
+        self.last_enqueued_commit: str | None = None
+        self.last_pushed_commit: str | None = None
+        self.last_pushed_at: float | None = None
+        self.last_error: str | None = None
+        self.consecutive_failures = 0
+        self.pushes = 0
+        self.pushed_commits = 0
+
+    def enqueue(self, commit_sha: str) -> dict[str, Any]:
+        with self._condition:
+            self._pending.append((commit_sha, time.time()))
+            self.last_enqueued_commit = commit_sha
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="kb-push-queue", daemon=True)
+                self._worker.start()
+            self._condition.notify_all()
+            return {"queued": True, "commit": commit_sha, "pending_commits": len(self._pending)}
+
+    def _push(self) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            ["git", "-C", str(self.project_root), "push"],
+            text=True,
+            capture_output=True,
+            check=False,
+        )
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending or (self._retry_at is not None and time.time() < self._retry_at):
+                    if not self._pending:
+                        self._condition.wait()
+                    else:
+                        self._condition.wait(timeout=max(self._retry_at - time.time(), 0.0))
+                batch_size = len(self._pending)
+                target = self._pending[-1][0]
+                self._in_flight = True
+
+            try:
+                completed = self._push()
+                error = None
+                if completed.returncode != 0:
+                    error = completed.stderr.strip() or completed.stdout.strip() or "git push failed"
+            except Exception as exc:
+                error = str(exc)
+
+            with self._condition:
+                self._in_flight = False
+                if error is None:
+                    del self._pending[:batch_size]
+                    self.last_pushed_commit = target
+                    self.last_pushed_at = time.time()
+                    self.last_error = None
+                    self.consecutive_failures = 0
+                    self._retry_at = None
+                    self.pushes += 1
+                    self.pushed_commits += batch_size
+                else:
+                    self.last_error = error
+                    self.consecutive_failures += 1
+                    delay = min(
+                        self.retry_initial_seconds * (2 ** (self.consecutive_failures - 1)),
+                        self.retry_max_seconds,
+                    )
+                    self._retry_at = time.time() + delay
+                self._condition.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._pending:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(timeout=remaining)
+            return True
+
+    def status(self) -> dict[str, Any]:
+        with self._condition:
+            oldest = self._pending[0][1] if self._pending else None
+            return {
+                "mode": "background",
+                "pending_commits": len(self._pending),
+                "in_flight": self._in_flight,
+                "lag_seconds": round(time.time() - oldest, 3) if oldest is not None else 0.0,
+                "oldest_pending_at": _timestamp(oldest),
+                "last_enqueued_commit": self.last_enqueued_commit,
+                "last_pushed_commit": self.last_pushed_commit,
+                "last_pushed_at": _timestamp(self.last_pushed_at),
+                "last_error": self.last_error,
+                "consecutive_failures": self.consecutive_failures,
+                "next_retry_at": _timestamp(self._retry_at) if self._pending else None,
+                "pushes": self.pushes,
+                "pushed_commits": self.pushed_commits,
+            }
+
+
+class PushQueueRegistry:
+    def __init__(self) -> None:
+        self._queues: dict[str, PushQueue] = {}
+        self._lock = threading.Lock()
+
+    def get(self, *, project_root: Path) -> PushQueue:
+        key = str(project_root.resolve())
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue is None:
+                queue = PushQueue(project_root=project_root)
+                self._queues[key] = queue
+            return queue
+
+    def clear(self) -> None:
+        with self._lock:
+            self._queues.clear()
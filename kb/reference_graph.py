@@ -0,0 +1,416 @@
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+from pydantic import ValidationError
+
+from kb.entity_files import load_entity
+from kb.schemas import EdgeRecord, SourceRecord, partial_date_sort_key
+from kb.validate import (
+    EdgeFile,
+    EntityRecord,
+    ScopeIndex,
+    SourceFile,
+    gather_edge_files,
+    gather_entities,
+    gather_source_files,
+)
+
+ENTITY_KINDS = ("person", "org", "source")
+TRAVERSAL_DIRECTIONS = ("out", "in", "both")
+TRAVERSAL_EDGE_FIELDS = {"id", "relation", "directed", "from_entity", "to_entity", "valid_from", "valid_to", "strength"}
+
+
+@dataclass(frozen=True)
+class EdgeRefs:
+    edge_id: str
+    from_entity: str
+    to_entity: str
+    sources: tuple[str, ...]
+    record: EdgeRecord | None = None
+
+    def entities(self) -> set[str]:
+        return {self.from_entity, self.to_entity, *self.sources} - {""}
+
+
+def _add(index: dict[str, set[str]], key: str, value: str) -> None:
+    if key:
+        index.setdefault(key, set()).add(value)
+
+
+def _discard(index: dict[str, set[str]], key: str, value: str) -> None:
+    holders = index.get(key)
+    if holders is None:
+        return
+    holders.discard(value)
+    if not holders:
+        del index[key]
+
+
+def edge_valid_at(record: EdgeRecord, as_of: str) -> bool:
+    point = partial_date_sort_key(as_of)
+    precision = len(as_of.split("-"))
+    if record.valid_from is not None:
+        start_precision = min(precision, len(record.valid_from.split("-")))
+        if point[:start_precision] < partial_date_sort_key(record.valid_from)[:start_precision]:
+            return False
+    if record.valid_to is not None:
+        end_precision = min(precision, len(record.valid_to.split("-")))
+        if point[:end_precision] > partial_date_sort_key(record.valid_to)[:end_precision]:
+            return False
+    return True
+
+
+def read_edge_refs(path: Path) -> EdgeRefs | None:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(payload, dict):
+        return None
+    try:
+        record = EdgeRecord.model_validate(payload)
+    except ValidationError:
+        record = None
+    if record is not None:
+        return EdgeRefs(
+            edge_id=record.id,
+            from_entity=record.from_entity,
+            to_entity=record.to_entity,
+            sources=tuple(ref.split("#", 1)[0] for ref in record.sources),
+            record=record,
+        )
+    raw_sources = payload.get("sources") if isinstance(payload.get("sources"), list) else []
+    return EdgeRefs(
+        edge_id=str(payload.get("id") or ""),
+        from_entity=str(payload.get("from") or ""),
+        to_entity=str(payload.get("to") or ""),
+        sources=tuple(ref.split("#", 1)[0] for ref in raw_sources if isinstance(ref, str)),
+    )
+
+
+class ReferenceGraph:
+    def __init__(self, *, project_root: Path, data_root: Path) -> None:
+        self.project_root = project_root
+        self.data_root = data_root
+        self._lock = threading.RLock()
+        self.version = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        self.head: str | None = None
+        self.dirty_paths: set[str] = set()
+        self.source_records: dict[str, SourceRecord] = {}
+        self.invalid_source_records: dict[str, ValidationError] = {}
+        self.entities: dict[str, EntityRecord] = {}
+        self.sources: dict[str, SourceFile] = {}
+        self.edge_files: dict[str, EdgeFile] = {}
+        self._edges: dict[str, EdgeRefs] = {}
+        self._citation_keys: dict[str, frozenset[str]] = {}
+        self._org_refs: dict[str, frozenset[str]] = {}
+        self._source_citation_key: dict[str, str] = {}
+        self.sources_by_citation_key: dict[str, set[str]] = {}
+        self.edge_paths_by_id: dict[str, set[str]] = {}
+        self._citing_entities: dict[str, set[str]] = {}
+        self._org_referrers: dict[str, set[str]] = {}
+        self._edges_by_entity: dict[str, set[str]] = {}
+        self._outgoing: dict[str, set[str]] = {}
+        self._incoming: dict[str, set[str]] = {}
+        self._built = False
+
+    @property
+    def is_built(self) -> bool:
+        return self._built
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._built = False
+
+    def edge_file_list(self) -> list[EdgeFile]:
+        return [self.edge_files[rel_path] for rel_path in sorted(self.edge_files)]
+
+    def edge_record(self, rel_path: str) -> EdgeRecord | None:
+        refs = self._edges.get(rel_path)
+        return refs.record if refs is not None else None
+
+    def edges_from(self, entity: str) -> list[str]:
+        return sorted(self._outgoing.get(entity, ()))
+
+    def edges_to(self, entity: str) -> list[str]:
+        return sorted(self._incoming.get(entity, ()))
+
+    def build(self, *, head: str | None = None) -> None:
+        with self._lock:
+            self._reset()
+            sources = gather_source_files(self.data_root)
+            for rel_dir in gather_entities(self.data_root):
+                self._load_entity(rel_dir, sources.get(rel_dir))
+            for edge_file in gather_edge_files(self.data_root):
+                self._load_edge(edge_file.rel_path)
+            self.head = head
+            self.version += 1
+            self._built = True
+
+    def _record_key(self, path: Path) -> tuple[str, str] | None:
+        try:
+            parts = path.relative_to(self.data_root).parts
+        except ValueError:
+            return None
+        if not parts:
+            return None
+        if parts[0] == "edge":
+            if len(parts) > 1 and path.name.startswith("edge@") and path.suffix == ".json":
+                return "edge", "/".join(parts)
+            return None
+        if parts[0] not in ENTITY_KINDS:
+            return None
+        for index, part in enumerate(parts[1:], start=1):
+            if part.startswith(f"{parts[0]}@"):
+                return "entity", "/".join(parts[: index + 1])
+        return None
+
+    def _keys_for_path(self, path: Path) -> set[tuple[str, str]]:
+        key = self._record_key(path)
+        if key is not None:
+            return {key}
+        keys: set[tuple[str, str]] = set()
+        scope = ScopeIndex({path})
+        for rel_dir, entity in self.entities.items():
+            if scope.covers(entity.directory):
+                keys.add(("entity", rel_dir))
+        for rel_path, edge_file in self.edge_files.items():
+            if scope.covers(edge_file.path):
+                keys.add(("edge", rel_path))
+        if path.is_dir():
+            for index_path in path.rglob("index.md"):
+                entity_key = self._record_key(index_path)
+                if entity_key is not None and self.data_root / entity_key[1] == index_path.parent:
+                    keys.add(entity_key)
+            for edge_path in path.rglob("edge@*.json"):
+                edge_key = self._record_key(edge_path)
+                if edge_key is not None and edge_key[0] == "edge":
+                    keys.add(edge_key)
+        return keys
+
+    def _dependents(self, key: tuple[str, str]) -> set[tuple[str, str]]:
+        kind, rel = key
+        dependents: set[tuple[str, str]] = {key}
+        if kind == "edge":
+            refs = self._edges.get(rel)
+            if refs is not None:
+                dependents.update(("entity", entity) for entity in (refs.from_entity, refs.to_entity) if entity)
+            return dependents
+
+        dependents.update(("edge", edge_rel) for edge_rel in self._edges_by_entity.get(rel, ()))
+        dependents.update(("entity", referrer) for referrer in self._org_referrers.get(rel, ()))
+        citation_key = self._source_citation_key.get(rel)
+        if citation_key:
+            dependents.update(("entity", citing) for citing in self._citing_entities.get(citation_key, ()))
+            dependents.update(("entity", other) for other in self.sources_by_citation_key.get(citation_key, ()))
+        return dependents
+
+    def refresh(self, paths: Iterable[Path]) -> set[Path]:
+        with self._lock:
+            keys: set[tuple[str, str]] = set()
+            for path in paths:
+                keys.update(self._keys_for_path(path))
+
+            affected: set[tuple[str, str]] = set()
+            for key in keys:
+                affected.update(self._dependents(key))
+            for kind, rel in sorted(keys):
+                if kind == "edge":
+                    self._load_edge(rel)
+                else:
+                    self._load_entity(rel)
+            for key in keys:
+                affected.update(self._dependents(key))
+            if keys:
+                self.version += 1
+
+            return {self.data_root / rel for _, rel in affected | keys}
+
+    def _unload_entity(self, rel_dir: str) -> None:
+        self.entities.pop(rel_dir, None)
+        self.sources.pop(rel_dir, None)
+        self.source_records.pop(rel_dir, None)
+        self.invalid_source_records.pop(rel_dir, None)
+        for citation_key in self._citation_keys.pop(rel_dir, frozenset()):
+            _discard(self._citing_entities, citation_key, rel_dir)
+        for org_ref in self._org_refs.pop(rel_dir, frozenset()):
+            _discard(self._org_referrers, org_ref, rel_dir)
+        source_key = self._source_citation_key.pop(rel_dir, None)
+        if source_key is not None:
+            _discard(self.sources_by_citation_key, source_key, rel_dir)
+
+    def _load_entity(self, rel_dir: str, source_file: SourceFile | None = None) -> None:
+        self._unload_entity(rel_dir)
+        directory = self.data_root / rel_dir
+        kind = rel_dir.split("/", 1)[0]
+        index_path = directory / "index.md"
+        if kind not in ENTITY_KINDS or not directory.name.startswith(f"{kind}@") or not index_path.is_file():
+            return
+
+        self.entities[rel_dir] = EntityRecord(
+            kind=kind,
+            entity_id=directory.name.split("@", 1)[1],
+            rel_dir=rel_dir,
+            directory=directory,
+            index_path=index_path,
+        )
+        loaded = load_entity(directory, kind)
+        citation_keys = frozenset(loaded.citation_keys())
+        self._citation_keys[rel_dir] = citation_keys
+        for citation_key in citation_keys:
+            _add(self._citing_entities, citation_key, rel_dir)
+
+        employment = loaded.jsonl.get("employment")
+        org_refs = frozenset(
+            str(row.organization_ref) for row in (employment.records() if employment else []) if row.organization_ref
+        )
+        self._org_refs[rel_dir] = org_refs
+        for org_ref in org_refs:
+            _add(self._org_referrers, org_ref, rel_dir)
+
+        if kind == "source":
+            self.sources[rel_dir] = source_file or SourceFile(
+                source_id=directory.name,
+                rel_dir=rel_dir,
+                directory=directory,
+                index_path=index_path,
+            )
+            metadata = loaded.index.metadata()
+            try:
+                self.source_records[rel_dir] = SourceRecord.model_validate(metadata)
+            except ValidationError as exc:
+                self.invalid_source_records[rel_dir] = exc
+            source_key = str(metadata.get("citation-key") or "").strip()
+            if source_key:
+                self._source_citation_key[rel_dir] = source_key
+                _add(self.sources_by_citation_key, source_key, rel_dir)
+
+    def _load_edge(self, rel_path: str) -> None:
+        previous = self._edges.pop(rel_path, None)
+        if previous is not None:
+            _discard(self.edge_paths_by_id, previous.edge_id, rel_path)
+            for entity in previous.entities():
+                _discard(self._edges_by_entity, entity, rel_path)
+            _discard(self._outgoing, previous.from_entity, rel_path)
+            _discard(self._incoming, previous.to_entity, rel_path)
+        self.edge_files.pop(rel_path, None)
+
+        path = self.data_root / rel_path
+        if not path.is_file():
+            return
+        self.edge_files[rel_path] = EdgeFile(path=path, rel_path=rel_path)
+        refs = read_edge_refs(path)
+        if refs is None:
+            return
+        self._edges[rel_path] = refs
+        _add(self.edge_paths_by_id, refs.edge_id, rel_path)
+        for entity in refs.entities():
+            _add(self._edges_by_entity, entity, rel_path)
+        _add(self._outgoing, refs.from_entity, rel_path)
+        _add(self._incoming, refs.to_entity, rel_path)
+
+    def traverse(
+        self,
+        start: str,
+        *,
+        max_depth: int,
+        relations: Iterable[str] | None = None,
+        direction: str = "both",
+        as_of: str | None = None,
+        limit: int = 100,
+    ) -> dict[str, Any]:
+        relation_filter = set(relations) if relations else None
+        with self._lock:
+            depth_by_entity = {start: 0}
+            nodes: list[dict[str, Any]] = []
+            edges: dict[str, dict[str, Any]] = {}
+            frontier = [start]
+            truncated = False
+            for depth in range(1, max_depth + 1):
+                next_frontier: list[str] = []
+                for entity in frontier:
+                    for rel_path in sorted(self._outgoing.get(entity, set()) | self._incoming.get(entity, set())):
+                        record = self.edge_record(rel_path)
+                        if record is None:
+                            continue
+                        if relation_filter is not None and record.relation.value not in relation_filter:
+                            continue
+                        if as_of is not None and not edge_valid_at(record, as_of):
+                            continue
+                        if record.from_entity == entity and (direction != "in" or not record.directed):
+                            neighbor = record.to_entity
+                        elif record.to_entity == entity and (direction != "out" or not record.directed):
+                            neighbor = record.from_entity
+                        else:
+                            continue
+
+                        if neighbor not in depth_by_entity:
+                            if len(nodes) >= limit:
+                                truncated = True
+                                continue
+                            depth_by_entity[neighbor] = depth
+                            next_frontier.append(neighbor)
+                            nodes.append(
+                                {
+                                    "entity": neighbor,
+                                    "kind": neighbor.split("/", 1)[0],
+                                    "depth": depth,
+                                    "parent": entity,
+                                    "via_edge": record.id,
+                                    "exists": neighbor in self.entities,
+                                }
+                            )
+                        if record.id not in edges:
+                            edges[record.id] = {
+                                "path": rel_path,
+                                **record.model_dump(mode="json", by_alias=True, include=TRAVERSAL_EDGE_FIELDS),
+                            }
+                frontier = next_frontier
+                if not frontier:
+                    break
+
+            return {
+                "start": start,
+                "nodes": nodes,
+                "edges": [edges[edge_id] for edge_id in sorted(edges)],
+                "node_count": len(nodes),
+                "edge_count": len(edges),
+                "truncated": truncated,
+                "graph_version": self.version,
+            }
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "entities": len(self.entities),
+            "sources": len(self.sources),
+            "edges": len(self.edge_files),
+            "head": self.head,
+            "version": self.version,
+        }
+
+
+class ReferenceGraphRegistry:
+    def __init__(self) -> None:
+        self._graphs: dict[tuple[str, str], ReferenceGraph] = {}
+        self._lock = threading.Lock()
+
+    def get(self, *, project_root: Path, data_root: Path) -> ReferenceGraph:
+        key = (str(project_root.resolve()), str(data_root.resolve()))
+        with self._lock:
+            graph = self._graphs.get(key)
+            if graph is None:
+                graph = ReferenceGraph(project_root=project_root, data_root=data_root)
+                self._graphs[key] = graph
+            return graph
+
+    def clear(self) -> None:
+        with self._lock:
+            self._graphs.clear()
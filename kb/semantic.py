@@ -1,19 +1,49 @@
 from __future__ import annotations
 
+import bisect
+import calendar
+import hashlib
 import json
 import math
 import re
-from datetime import datetime, timezone
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
 
-INDEX_VERSION = 1
+import yaml
+
+from kb.lexical import build_lexical_index, load_lexical_index, rank_lexical_rows, write_lexical_index
+from kb.schemas import parse_partial_date
+
+INDEX_VERSION = 2
+LEGACY_INDEX_VERSION = 1
+SUPPORTED_INDEX_VERSIONS = (LEGACY_INDEX_VERSION, INDEX_VERSION)
+VECTORS_FILE_SUFFIX = ".vectors.npy"
+CHUNKS_FILE_SUFFIX = ".chunks.jsonl"
+ANN_FILE_SUFFIX = ".ivf.npz"
+LEXICAL_FILE_SUFFIX = ".lexical.json"
+DEFAULT_RRF_K = 60
 DEFAULT_INDEX_PATH = ".build/semantic/index.json"
 DEFAULT_MODEL_NAME = "BAAI/bge-small-en-v1.5"
 DEFAULT_MODEL_CACHE_PATH = ".build/semantic/model-cache"
+DEFAULT_QUERY_CACHE_PATH = ".build/semantic/query-cache.jsonl"
+DEFAULT_QUERY_CACHE_SIZE = 1024
 DEFAULT_MAX_CHARS = 1200
 DEFAULT_MIN_CHARS = 200
 DEFAULT_OVERLAP_CHARS = 120
+DEFAULT_EMBED_BATCH_SIZE = 256
+DEFAULT_ANN_MIN_CHUNKS = 10_000
+DEFAULT_ANN_N_PROBE = 16
+ANN_KMEANS_ITERATIONS = 10
+ANN_KMEANS_SAMPLE_SIZE = 50_000
+ANN_ASSIGN_BATCH_SIZE = 8192
+DATE_METADATA_FIELDS = ("created-at", "updated-at", "retrieved-at", "last-contacted-at")
+DEFAULT_FILTER_DATE_FIELD = "updated-at"
+FRONTMATTER_RE = re.compile(r"\A\ufeff?---\s*\n(.*?)\n---\s*\n?", re.DOTALL)
 
 
 class EmbeddingBackend:
@@ -23,6 +53,15 @@ class EmbeddingBackend:
     def embed_texts(self, texts: list[str]) -> list[list[float]]:
         raise NotImplementedError
 
+    def embed_batches(
+        self,
+        texts: list[str],
+        *,
+        batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
+    ) -> Iterator[Any]:
+        for start in range(0, len(texts), batch_size):
+            yield self.embed_texts(texts[start : start + batch_size])
+
 
 class FastEmbedBackend(EmbeddingBackend):
     backend_id = "fastembed"
@@ -32,36 +71,82 @@ class FastEmbedBackend(EmbeddingBackend):
         *,
         model_name: str = DEFAULT_MODEL_NAME,
         cache_dir: Path | None = None,
+        batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
+        parallel: int | None = None,
     ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
         self.model_name = model_name
         self.cache_dir = cache_dir
+        self.batch_size = batch_size
+        self.parallel = parallel
         self._model = None
+        self._model_lock = threading.Lock()
 
     def _load_model(self):
         if self._model is not None:
             return self._model
-        try:
-            from fastembed import TextEmbedding
-        except Exception as exc:
-            raise RuntimeError(
-                "fastembed is required for semantic indexing/search. "
-                "Install optional dependencies with `uv sync --extra semantic`."
-            ) from exc
-
-        kwargs: dict[str, Any] = {"model_name": self.model_name}
-        if self.cache_dir is not None:
-            kwargs["cache_dir"] = str(self.cache_dir)
-        self._model = TextEmbedding(**kwargs)
+        with self._model_lock:
+            if self._model is not None:
+                return self._model
+            try:
+                from fastembed import TextEmbedding
+            except Exception as exc:
+                raise RuntimeError(
+                    "fastembed is required for semantic indexing/search. "
+                    "Install optional dependencies with `uv sync --extra semantic`."
+                ) from exc
+
+            kwargs: dict[str, Any] = {"model_name": self.model_name}
+            if self.cache_dir is not None:
+                kwargs["cache_dir"] = str(self.cache_dir)
+            self._model = TextEmbedding(**kwargs)
         return self._model
 
     def embed_texts(self, texts: list[str]) -> list[list[float]]:
         if not texts:
             return []
         model = self._load_model()
-        vectors: list[list[float]] = []
-        for embedding in model.embed(texts):
-            vectors.append([float(value) for value in embedding])
-        return vectors
+        return [
+            embedding.tolist()
+            for embedding in model.embed(texts, batch_size=self.batch_size, parallel=self.parallel)
+        ]
+
+    def embed_batches(
+        self,
+        texts: list[str],
+        *,
+        batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
+    ) -> Iterator[Any]:
+        if not texts:
+            return
+        model = self._load_model()
+        batch: list[Any] = []
+        for embedding in model.embed(texts, batch_size=batch_size, parallel=self.parallel):
+            batch.append(embedding)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+def _optional_numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _require_numpy():
+    numpy = _optional_numpy()
+    if numpy is None:
+        raise RuntimeError(
+            "numpy is required for semantic index format v2. "
+            "Install optional dependencies with `uv sync --extra semantic`."
+        )
+    return numpy
 
 
 def resolve_runtime_path(project_root: Path, raw_path: str | Path) -> Path:
@@ -166,15 +251,8 @@ def chunk_text(
     return chunks
 
 
-def collect_markdown_chunks(
-    *,
-    project_root: Path,
-    data_root: Path,
-    max_chars: int = DEFAULT_MAX_CHARS,
-    min_chars: int = DEFAULT_MIN_CHARS,
-    overlap_chars: int = DEFAULT_OVERLAP_CHARS,
-) -> list[dict[str, Any]]:
-    chunks: list[dict[str, Any]] = []
+def iter_markdown_files(data_root: Path) -> list[tuple[Path, str]]:
+    files: list[tuple[Path, str]] = []
     for path in sorted(data_root.rglob("*.md"), key=lambda value: value.as_posix()):
         if not path.is_file():
             continue
@@ -183,28 +261,98 @@ def collect_markdown_chunks(
             data_rel = path.relative_to(data_root).as_posix()
         except ValueError:
             continue
+        files.append((path, data_rel))
+    return files
 
-        content = path.read_text(encoding="utf-8")
-        file_chunks = chunk_text(
-            content,
-            max_chars=max_chars,
-            min_chars=min_chars,
-            overlap_chars=overlap_chars,
-        )
 
-        for index, text in enumerate(file_chunks):
-            chunks.append(
-                {
-                    "id": f"{data_rel}#chunk-{index:04d}",
-                    "path": relpath(path, project_root),
-                    "data_path": data_rel,
-                    "char_count": len(text),
-                    "text": text,
-                }
+def markdown_metadata(content: str, data_rel: str) -> dict[str, Any]:
+    parts = data_rel.split("/")
+    entity = next((part for part in parts[:-1] if "@" in part), None)
+    frontmatter: dict[str, Any] = {}
+    match = FRONTMATTER_RE.match(content)
+    if match:
+        try:
+            loaded = yaml.safe_load(match.group(1))
+        except yaml.YAMLError:
+            loaded = None
+        if isinstance(loaded, dict):
+            frontmatter = loaded
+
+    dates: dict[str, str] = {}
+    for field in DATE_METADATA_FIELDS:
+        value = frontmatter.get(field)
+        if isinstance(value, (date, datetime)):
+            dates[field] = value.isoformat()[:10]
+        elif isinstance(value, str) and value.strip():
+            dates[field] = value.strip()[:10]
+
+    source_type = frontmatter.get("source-type")
+    return {
+        "kind": parts[0] if len(parts) > 1 else None,
+        "entity": entity,
+        "source_type": str(source_type) if source_type else None,
+        "dates": dates,
+    }
+
+
+def chunk_markdown_file(
+    *,
+    content: str,
+    path: Path,
+    data_rel: str,
+    project_root: Path,
+    max_chars: int = DEFAULT_MAX_CHARS,
+    min_chars: int = DEFAULT_MIN_CHARS,
+    overlap_chars: int = DEFAULT_OVERLAP_CHARS,
+) -> list[dict[str, Any]]:
+    file_chunks = chunk_text(
+        content,
+        max_chars=max_chars,
+        min_chars=min_chars,
+        overlap_chars=overlap_chars,
+    )
+    metadata = markdown_metadata(content, data_rel)
+    return [
+        {
+            "id": f"{data_rel}#chunk-{index:04d}",
+            "path": relpath(path, project_root),
+            "data_path": data_rel,
+            "char_count": len(text),
+            "text": text,
+            "metadata": metadata,
+        }
+        for index, text in enumerate(file_chunks)
+    ]
+
+
+def collect_markdown_chunks(
+    *,
+    project_root: Path,
+    data_root: Path,
+    max_chars: int = DEFAULT_MAX_CHARS,
+    min_chars: int = DEFAULT_MIN_CHARS,
+    overlap_chars: int = DEFAULT_OVERLAP_CHARS,
+) -> list[dict[str, Any]]:
+    chunks: list[dict[str, Any]] = []
+    for path, data_rel in iter_markdown_files(data_root):
+        chunks.extend(
+            chunk_markdown_file(
+                content=path.read_text(encoding="utf-8"),
+                path=path,
+                data_rel=data_rel,
+                project_root=project_root,
+                max_chars=max_chars,
+                min_chars=min_chars,
+                overlap_chars=overlap_chars,
             )
+        )
     return chunks
 
 
+def content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
 def _validate_vectors(vectors: list[list[float]], expected_count: int) -> int:
     if len(vectors) != expected_count:
         raise RuntimeError(f"embedding backend returned {len(vectors)} vectors for {expected_count} chunks")
@@ -222,6 +370,28 @@ def _validate_vectors(vectors: list[list[float]], expected_count: int) -> int:
     return embedding_dim
 
 
+def _load_reusable_index(
+    index_path: Path,
+    *,
+    model: dict[str, Any],
+    chunking: dict[str, Any],
+) -> dict[str, Any] | None:
+    if not index_path.exists():
+        return None
+    try:
+        previous = load_semantic_index(index_path)
+    except (OSError, ValueError, RuntimeError):
+        return None
+
+    if int(previous.get("version") or -1) != INDEX_VERSION:
+        return None
+    if previous.get("model") != model or previous.get("chunking") != chunking:
+        return None
+    if not isinstance(previous.get("files"), dict):
+        return None
+    return previous
+
+
 def build_semantic_index(
     *,
     project_root: Path,
@@ -231,78 +401,542 @@ def build_semantic_index(
     max_chars: int = DEFAULT_MAX_CHARS,
     min_chars: int = DEFAULT_MIN_CHARS,
     overlap_chars: int = DEFAULT_OVERLAP_CHARS,
+    incremental: bool = True,
+    batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
+    progress: Callable[[int, int], None] | None = None,
+    ann: bool | None = None,
 ) -> dict[str, Any]:
-    chunks = collect_markdown_chunks(
-        project_root=project_root,
-        data_root=data_root,
-        max_chars=max_chars,
-        min_chars=min_chars,
-        overlap_chars=overlap_chars,
-    )
-    texts = [chunk["text"] for chunk in chunks]
-    vectors = embedding_backend.embed_texts(texts)
-    embedding_dim = _validate_vectors(vectors, len(chunks))
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive")
+    numpy = _optional_numpy()
+    index_version = INDEX_VERSION if numpy is not None else LEGACY_INDEX_VERSION
+    model_payload = {
+        "backend": embedding_backend.backend_id,
+        "name": embedding_backend.model_name,
+    }
+    chunking = {
+        "max_chars": max_chars,
+        "min_chars": min_chars,
+        "overlap_chars": overlap_chars,
+    }
+
+    previous = None
+    if incremental and index_version == INDEX_VERSION:
+        previous = _load_reusable_index(index_path, model=model_payload, chunking=chunking)
+    previous_files: dict[str, Any] = previous["files"] if previous is not None else {}
+    previous_rows: dict[str, list[int]] = {}
+    if previous is not None:
+        for row, chunk in enumerate(previous["chunks"]):
+            previous_rows.setdefault(str(chunk.get("data_path") or ""), []).append(row)
 
     chunk_records: list[dict[str, Any]] = []
-    for chunk, vector in zip(chunks, vectors):
-        chunk_records.append(
-            {
-                "id": chunk["id"],
-                "path": chunk["path"],
-                "data_path": chunk["data_path"],
-                "char_count": chunk["char_count"],
-                "text": chunk["text"],
-                "vector": vector,
-            }
-        )
+    reused_rows: list[tuple[int, int]] = []
+    embed_positions: list[int] = []
+    files: dict[str, dict[str, Any]] = {}
+    file_counts = {"added": 0, "changed": 0, "unchanged": 0, "removed": 0}
 
-    payload = {
-        "version": INDEX_VERSION,
+    for path, data_rel in iter_markdown_files(data_root):
+        content = path.read_text(encoding="utf-8")
+        digest = content_hash(content)
+        previous_entry = previous_files.get(data_rel)
+        rows = previous_rows.get(data_rel, [])
+        if (
+            isinstance(previous_entry, dict)
+            and previous_entry.get("sha256") == digest
+            and int(previous_entry.get("chunk_count") or 0) == len(rows)
+        ):
+            metadata = markdown_metadata(content, data_rel)
+            for row in rows:
+                reused_rows.append((len(chunk_records), row))
+                chunk_records.append({**previous["chunks"][row], "metadata": metadata})
+            files[data_rel] = {"sha256": digest, "chunk_count": len(rows)}
+            file_counts["unchanged"] += 1
+            continue
+
+        file_counts["changed" if data_rel in previous_files else "added"] += 1
+        file_chunks = chunk_markdown_file(
+            content=content,
+            path=path,
+            data_rel=data_rel,
+            project_root=project_root,
+            max_chars=max_chars,
+            min_chars=min_chars,
+            overlap_chars=overlap_chars,
+        )
+        for record in file_chunks:
+            embed_positions.append(len(chunk_records))
+            chunk_records.append(record)
+        files[data_rel] = {"sha256": digest, "chunk_count": len(file_chunks)}
+    file_counts["removed"] = len(set(previous_files) - set(files))
+
+    texts = [chunk_records[position]["text"] for position in embed_positions]
+    embedding_dim = int(previous.get("embedding_dim") or 0) if previous is not None and reused_rows else 0
+    payload: dict[str, Any] = {
+        "version": index_version,
         "created_at": datetime.now(timezone.utc).isoformat(),
         "project_root": str(project_root),
         "data_root": str(data_root),
-        "model": {
-            "backend": embedding_backend.backend_id,
-            "name": embedding_backend.model_name,
-        },
-        "chunking": {
-            "max_chars": max_chars,
-            "min_chars": min_chars,
-            "overlap_chars": overlap_chars,
-        },
-        "embedding_dim": embedding_dim,
-        "chunk_count": len(chunk_records),
-        "chunks": chunk_records,
+        "model": model_payload,
+        "chunking": chunking,
     }
 
     index_path.parent.mkdir(parents=True, exist_ok=True)
-    temp_path = index_path.with_suffix(f"{index_path.suffix}.tmp")
-    temp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
-    temp_path.replace(index_path)
+    if index_version == LEGACY_INDEX_VERSION:
+        started = time.perf_counter()
+        vectors = embedding_backend.embed_texts(texts)
+        embedding_seconds = time.perf_counter() - started
+        embedding_dim = _validate_vectors(vectors, len(texts))
+        if progress is not None and texts:
+            progress(len(texts), len(texts))
+        payload["chunks"] = [
+            {**record, "vector": vector} for record, vector in zip(chunk_records, vectors)
+        ]
+    else:
+        vectors_path, chunks_path = semantic_index_sidecar_paths(index_path)
+        embedding_dim, embedding_seconds = _stream_vector_matrix(
+            numpy,
+            vectors_path=vectors_path,
+            embedding_backend=embedding_backend,
+            texts=texts,
+            embed_positions=embed_positions,
+            reused_rows=reused_rows,
+            previous_vectors=previous["vectors"] if previous is not None else None,
+            row_count=len(chunk_records),
+            embedding_dim=embedding_dim,
+            batch_size=batch_size,
+            progress=progress,
+        )
+        _write_text_atomic(
+            chunks_path,
+            "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in chunk_records),
+        )
+        payload["vectors_file"] = vectors_path.name
+        payload["chunks_file"] = chunks_path.name
+        payload["vector_dtype"] = "float32"
+        payload["normalized"] = True
+        payload["files"] = files
+
+        ann_path = semantic_ann_path(index_path)
+        if ann is None:
+            ann = len(chunk_records) >= DEFAULT_ANN_MIN_CHUNKS
+        if ann and chunk_records:
+            ivf = build_ivf_index(numpy.load(vectors_path, mmap_mode="r", allow_pickle=False))
+            _write_npz_atomic(ann_path, ivf)
+            payload["ann"] = {
+                "type": "ivf",
+                "file": ann_path.name,
+                "n_lists": int(ivf["centroids"].shape[0]),
+                "n_probe": DEFAULT_ANN_N_PROBE,
+            }
+        else:
+            ann_path.unlink(missing_ok=True)
+
+    lexical_path = semantic_lexical_path(index_path)
+    lexical_index = build_lexical_index([record["text"] for record in chunk_records])
+    write_lexical_index(lexical_path, lexical_index)
+    payload["lexical"] = {
+        "type": "bm25",
+        "file": lexical_path.name,
+        "term_count": len(lexical_index["postings"]),
+    }
+
+    payload["embedding_dim"] = embedding_dim
+    payload["chunk_count"] = len(chunk_records)
+    _write_text_atomic(index_path, json.dumps(payload, ensure_ascii=False))
 
     return {
         "ok": True,
         "index_path": relpath(index_path, project_root),
+        "index_version": index_version,
+        "incremental": previous is not None,
         "chunk_count": len(chunk_records),
+        "embedded_chunk_count": len(embed_positions),
+        "reused_chunk_count": len(reused_rows),
+        "files": file_counts,
+        "embedding_seconds": round(embedding_seconds, 3),
+        "chunks_per_second": round(len(embed_positions) / embedding_seconds, 2) if embedding_seconds > 0 else 0.0,
+        "ann": payload.get("ann"),
         "embedding_dim": embedding_dim,
         "model": payload["model"],
         "chunking": payload["chunking"],
     }
 
 
+def _stream_vector_matrix(
+    numpy: Any,
+    *,
+    vectors_path: Path,
+    embedding_backend: EmbeddingBackend,
+    texts: list[str],
+    embed_positions: list[int],
+    reused_rows: list[tuple[int, int]],
+    previous_vectors: Any,
+    row_count: int,
+    embedding_dim: int,
+    batch_size: int,
+    progress: Callable[[int, int], None] | None,
+) -> tuple[int, float]:
+    temp_path = vectors_path.with_suffix(f"{vectors_path.suffix}.tmp")
+    matrix = None
+
+    def open_matrix(dim: int) -> Any:
+        opened = numpy.lib.format.open_memmap(
+            temp_path,
+            mode="w+",
+            dtype=numpy.float32,
+            shape=(row_count, dim),
+        )
+        for start in range(0, len(reused_rows), batch_size):
+            positions, rows = zip(*reused_rows[start : start + batch_size])
+            opened[list(positions)] = previous_vectors[list(rows)]
+        return opened
+
+    embedded = 0
+    started = time.perf_counter()
+    try:
+        if embedding_dim and row_count:
+            matrix = open_matrix(embedding_dim)
+        for batch in embedding_backend.embed_batches(texts, batch_size=batch_size):
+            block = numpy.asarray(batch, dtype=numpy.float32)
+            if block.ndim != 2 or block.shape[1] == 0:
+                raise RuntimeError("embedding backend returned zero-length vectors")
+            if embedded + block.shape[0] > len(texts):
+                raise RuntimeError(f"embedding backend returned more than {len(texts)} vectors")
+            if matrix is None:
+                embedding_dim = int(block.shape[1])
+                matrix = open_matrix(embedding_dim)
+            elif block.shape[1] != embedding_dim:
+                raise RuntimeError(
+                    f"inconsistent embedding dimensions at index {embedded}: {block.shape[1]} vs {embedding_dim}"
+                )
+            matrix[embed_positions[embedded : embedded + block.shape[0]]] = normalize_vector_matrix(block)
+            embedded += block.shape[0]
+            if progress is not None:
+                progress(embedded, len(texts))
+        embedding_seconds = time.perf_counter() - started
+        if embedded != len(texts):
+            raise RuntimeError(f"embedding backend returned {embedded} vectors for {len(texts)} chunks")
+
+        if matrix is None:
+            _write_npy_atomic(vectors_path, numpy.zeros((row_count, embedding_dim), dtype=numpy.float32))
+            return embedding_dim, embedding_seconds
+        matrix.flush()
+        del matrix
+        temp_path.replace(vectors_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return embedding_dim, embedding_seconds
+
+
+def semantic_index_sidecar_paths(index_path: Path) -> tuple[Path, Path]:
+    stem = index_path.with_suffix("").name
+    return (
+        index_path.with_name(f"{stem}{VECTORS_FILE_SUFFIX}"),
+        index_path.with_name(f"{stem}{CHUNKS_FILE_SUFFIX}"),
+    )
+
+
+def semantic_lexical_path(index_path: Path) -> Path:
+    return index_path.with_name(f"{index_path.with_suffix('').name}{LEXICAL_FILE_SUFFIX}")
+
+
+def semantic_ann_path(index_path: Path) -> Path:
+    return index_path.with_name(f"{index_path.with_suffix('').name}{ANN_FILE_SUFFIX}")
+
+
+def _assign_to_centroids(numpy: Any, matrix: Any, centroids: Any) -> Any:
+    assignments = numpy.empty(matrix.shape[0], dtype=numpy.int32)
+    for start in range(0, matrix.shape[0], ANN_ASSIGN_BATCH_SIZE):
+        block = numpy.asarray(matrix[start : start + ANN_ASSIGN_BATCH_SIZE])
+        assignments[start : start + block.shape[0]] = numpy.argmax(block @ centroids.T, axis=1)
+    return assignments
+
+
+def build_ivf_index(
+    matrix: Any,
+    *,
+    n_lists: int | None = None,
+    iterations: int = ANN_KMEANS_ITERATIONS,
+    seed: int = 0,
+) -> dict[str, Any]:
+    numpy = _require_numpy()
+    row_count = int(matrix.shape[0])
+    if row_count == 0:
+        raise ValueError("cannot build an ANN index without vectors")
+    n_lists = min(n_lists or max(1, round(math.sqrt(row_count))), row_count)
+
+    rng = numpy.random.default_rng(seed)
+    sample_rows = numpy.sort(rng.choice(row_count, size=min(row_count, ANN_KMEANS_SAMPLE_SIZE), replace=False))
+    sample = numpy.asarray(matrix[sample_rows], dtype=numpy.float32)
+    centroids = sample[rng.choice(sample.shape[0], size=n_lists, replace=False)].copy()
+    for _ in range(iterations):
+        assignments = _assign_to_centroids(numpy, sample, centroids)
+        sums = numpy.zeros_like(centroids)
+        numpy.add.at(sums, assignments, sample)
+        filled = numpy.bincount(assignments, minlength=n_lists) > 0
+        centroids[filled] = normalize_vector_matrix(sums[filled])
+
+    assignments = _assign_to_centroids(numpy, matrix, centroids)
+    offsets = numpy.zeros(n_lists + 1, dtype=numpy.int64)
+    numpy.cumsum(numpy.bincount(assignments, minlength=n_lists), out=offsets[1:])
+    return {
+        "centroids": centroids,
+        "offsets": offsets,
+        "rows": numpy.argsort(assignments, kind="stable").astype(numpy.int32),
+    }
+
+
+def normalize_vector_matrix(matrix: Any) -> Any:
+    numpy = _require_numpy()
+    norms = numpy.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    return (matrix / norms).astype(numpy.float32, copy=False)
+
+
+def _write_text_atomic(path: Path, content: str) -> None:
+    temp_path = path.with_suffix(f"{path.suffix}.tmp")
+    temp_path.write_text(content, encoding="utf-8")
+    temp_path.replace(path)
+
+
+def _write_npy_atomic(path: Path, matrix: Any) -> None:
+    numpy = _require_numpy()
+    temp_path = path.with_suffix(f"{path.suffix}.tmp")
+    with temp_path.open("wb") as handle:
+        numpy.save(handle, matrix, allow_pickle=False)
+    temp_path.replace(path)
+
+
+def _write_npz_atomic(path: Path, arrays: dict[str, Any]) -> None:
+    numpy = _require_numpy()
+    temp_path = path.with_suffix(f"{path.suffix}.tmp")
+    with temp_path.open("wb") as handle:
+        numpy.savez(handle, **arrays)
+    temp_path.replace(path)
+
+
 def load_semantic_index(index_path: Path) -> dict[str, Any]:
     if not index_path.exists():
         raise FileNotFoundError(f"semantic index file not found: {index_path.as_posix()}")
     payload = json.loads(index_path.read_text(encoding="utf-8"))
-    if int(payload.get("version") or -1) != INDEX_VERSION:
+    version = int(payload.get("version") or -1)
+    if version not in SUPPORTED_INDEX_VERSIONS:
         raise ValueError(
-            f"unsupported semantic index version: {payload.get('version')} (expected {INDEX_VERSION})"
+            f"unsupported semantic index version: {payload.get('version')} "
+            f"(expected one of {', '.join(str(value) for value in SUPPORTED_INDEX_VERSIONS)})"
         )
-    if not isinstance(payload.get("chunks"), list):
-        raise ValueError("invalid semantic index payload: chunks missing")
+    if version == LEGACY_INDEX_VERSION:
+        if not isinstance(payload.get("chunks"), list):
+            raise ValueError("invalid semantic index payload: chunks missing")
+    else:
+        payload = _load_binary_semantic_index(index_path, payload)
+
+    lexical = payload.get("lexical")
+    if isinstance(lexical, dict) and lexical.get("file"):
+        payload["lexical_index"] = load_lexical_index(index_path.parent / str(lexical["file"]))
     return payload
 
 
+def _load_binary_semantic_index(index_path: Path, manifest: dict[str, Any]) -> dict[str, Any]:
+    numpy = _require_numpy()
+    vectors_name = str(manifest.get("vectors_file") or "")
+    chunks_name = str(manifest.get("chunks_file") or "")
+    if not vectors_name or not chunks_name:
+        raise ValueError("invalid semantic index payload: vectors_file/chunks_file missing")
+
+    vectors_path = index_path.parent / vectors_name
+    chunks_path = index_path.parent / chunks_name
+    for sidecar in (vectors_path, chunks_path):
+        if not sidecar.is_file():
+            raise ValueError(f"invalid semantic index payload: missing {sidecar.name}")
+
+    chunks: list[dict[str, Any]] = []
+    with chunks_path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                chunks.append(json.loads(line))
+
+    vectors = numpy.load(vectors_path, mmap_mode="r" if chunks else None, allow_pickle=False)
+    if vectors.ndim != 2 or vectors.shape[0] != len(chunks):
+        raise ValueError(
+            f"invalid semantic index payload: {vectors.shape[0]} vectors for {len(chunks)} chunks"
+        )
+    payload = {**manifest, "chunks": chunks, "vectors": vectors}
+
+    ann = manifest.get("ann")
+    if isinstance(ann, dict) and ann.get("file"):
+        ann_path = index_path.parent / str(ann["file"])
+        if not ann_path.is_file():
+            raise ValueError(f"invalid semantic index payload: missing {ann_path.name}")
+        with numpy.load(ann_path, allow_pickle=False) as arrays:
+            payload["ann_index"] = {name: arrays[name] for name in ("centroids", "offsets", "rows")}
+    return payload
+
+
+def semantic_index_fingerprint(index_path: Path) -> tuple[int, int]:
+    try:
+        stat = index_path.stat()
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(f"semantic index file not found: {index_path.as_posix()}") from exc
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class SemanticIndexCache:
+    def __init__(self, loader: Callable[[Path], dict[str, Any]] | None = None) -> None:
+        self._loader = loader or load_semantic_index
+        self._entries: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, index_path: Path) -> dict[str, Any]:
+        key = index_path.absolute().as_posix()
+        fingerprint = semantic_index_fingerprint(index_path)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == fingerprint:
+                self.hits += 1
+                return cached[1]
+
+        payload = self._loader(index_path)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (fingerprint, payload)
+        return payload
+
+    def invalidate(self, index_path: Path | None = None) -> None:
+        with self._lock:
+            if index_path is None:
+                self._entries.clear()
+                return
+            self._entries.pop(index_path.absolute().as_posix(), None)
+
+
+class EmbeddingBackendPool:
+    def __init__(self) -> None:
+        self._backends: dict[tuple[str, str], EmbeddingBackend] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        *,
+        model_name: str,
+        cache_dir: Path | None,
+        factory: Callable[..., EmbeddingBackend],
+    ) -> EmbeddingBackend:
+        key = (model_name, cache_dir.as_posix() if cache_dir is not None else "")
+        with self._lock:
+            backend = self._backends.get(key)
+            if backend is None:
+                backend = factory(model_name=model_name, cache_dir=cache_dir)
+                self._backends[key] = backend
+        return backend
+
+    def clear(self) -> None:
+        with self._lock:
+            self._backends.clear()
+
+
+class QueryEmbeddingCache:
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_QUERY_CACHE_SIZE,
+        persist_path: Path | None = None,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.persist_path = persist_path
+        self._entries: OrderedDict[tuple[str, str], list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._persisted_lines = 0
+        self.hits = 0
+        self.misses = 0
+        if persist_path is not None:
+            self._load_persisted()
+
+    @staticmethod
+    def cache_key(model_name: str, query: str) -> tuple[str, str]:
+        return (model_name, normalize_text(query))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def embed(self, embedding_backend: EmbeddingBackend, query: str) -> tuple[list[float], bool]:
+        key = self.cache_key(embedding_backend.model_name, query)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached, True
+
+        vectors = embedding_backend.embed_texts([key[1]])
+        vector = [float(value) for value in vectors[0]] if vectors else []
+        with self._lock:
+            self.misses += 1
+            self._store(key, vector)
+            self._append_persisted(key, vector)
+        return vector, False
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            if self.persist_path is not None:
+                self.persist_path.unlink(missing_ok=True)
+                self._persisted_lines = 0
+
+    def _store(self, key: tuple[str, str], vector: list[float]) -> None:
+        self._entries[key] = vector
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _load_persisted(self) -> None:
+        assert self.persist_path is not None
+        if not self.persist_path.is_file():
+            return
+        with self.persist_path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    row = json.loads(line)
+                    key = (str(row["model"]), str(row["query"]))
+                    vector = [float(value) for value in row["vector"]]
+                except (ValueError, KeyError, TypeError):
+                    continue
+                self._store(key, vector)
+                self._persisted_lines += 1
+
+    def _append_persisted(self, key: tuple[str, str], vector: list[float]) -> None:
+        if self.persist_path is None:
+            return
+        self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+        if self._persisted_lines >= 2 * self.max_entries:
+            _write_text_atomic(
+                self.persist_path,
+                "".join(
+                    json.dumps({"model": model, "query": query, "vector": cached}, ensure_ascii=False) + "\n"
+                    for (model, query), cached in self._entries.items()
+                ),
+            )
+            self._persisted_lines = len(self._entries)
+            return
+        with self.persist_path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps({"model": key[0], "query": key[1], "vector": vector}, ensure_ascii=False) + "\n")
+        self._persisted_lines += 1
+
+
 def _cosine_similarity(left: list[float], right: list[float]) -> float:
     if len(left) != len(right):
         raise ValueError("vector dimensions do not match")
@@ -319,6 +953,359 @@ def _cosine_similarity(left: list[float], right: list[float]) -> float:
     return dot / math.sqrt(left_norm * right_norm)
 
 
+def partial_date_period_end(value: str) -> str:
+    parts = [int(part) for part in value.split("-")]
+    if len(parts) == 3:
+        return value
+    month = parts[1] if len(parts) == 2 else 12
+    return date(parts[0], month, calendar.monthrange(parts[0], month)[1]).isoformat()
+
+
+@dataclass(frozen=True)
+class SemanticFilter:
+    kinds: tuple[str, ...] = ()
+    path_prefix: str | None = None
+    entity: str | None = None
+    source_type: str | None = None
+    date_field: str = DEFAULT_FILTER_DATE_FIELD
+    date_from: str | None = None
+    date_to: str | None = None
+
+    def __post_init__(self) -> None:
+        for key in ("date_from", "date_to"):
+            value = getattr(self, key)
+            if value is None:
+                continue
+            try:
+                object.__setattr__(self, key, parse_partial_date(value))
+            except ValueError as exc:
+                raise ValueError(f"invalid {key} {value!r}: {exc}") from exc
+
+    def is_empty(self) -> bool:
+        return not (
+            self.kinds
+            or self.path_prefix
+            or self.entity
+            or self.source_type
+            or self.date_from
+            or self.date_to
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        payload: dict[str, Any] = {}
+        if self.kinds:
+            payload["kinds"] = list(self.kinds)
+        for key in ("path_prefix", "entity", "source_type"):
+            value = getattr(self, key)
+            if value:
+                payload[key] = value
+        if self.date_from or self.date_to:
+            payload["date_field"] = self.date_field
+            payload["date_from"] = self.date_from
+            payload["date_to"] = self.date_to
+        return payload
+
+
+class SemanticMetadataIndex:
+    def __init__(self, chunks: list[dict[str, Any]]) -> None:
+        self.row_count = len(chunks)
+        self.rows_by_kind: dict[str, list[int]] = {}
+        self.rows_by_entity: dict[str, list[int]] = {}
+        self.rows_by_source_type: dict[str, list[int]] = {}
+        paths: list[tuple[str, int]] = []
+        dates: dict[str, list[tuple[str, int]]] = {}
+        for row, chunk in enumerate(chunks):
+            data_path = str(chunk.get("data_path") or "")
+            paths.append((data_path, row))
+            metadata = chunk.get("metadata")
+            if not isinstance(metadata, dict):
+                metadata = markdown_metadata("", data_path)
+            for mapping, key in (
+                (self.rows_by_kind, "kind"),
+                (self.rows_by_entity, "entity"),
+                (self.rows_by_source_type, "source_type"),
+            ):
+                value = metadata.get(key)
+                if value:
+                    mapping.setdefault(str(value), []).append(row)
+            for field, value in (metadata.get("dates") or {}).items():
+                dates.setdefault(field, []).append((str(value), row))
+
+        paths.sort()
+        self._path_keys = [path for path, _ in paths]
+        self._path_rows = [row for _, row in paths]
+        self._date_keys: dict[str, list[str]] = {}
+        self._date_rows: dict[str, list[int]] = {}
+        for field, values in dates.items():
+            values.sort()
+            self._date_keys[field] = [value for value, _ in values]
+            self._date_rows[field] = [row for _, row in values]
+
+    def _prefix_rows(self, prefix: str) -> list[int]:
+        directory = prefix.strip("/")
+        if not directory:
+            return list(self._path_rows)
+        start = bisect.bisect_left(self._path_keys, directory)
+        end = bisect.bisect_left(self._path_keys, directory + "/\uffff", lo=start)
+        return [
+            self._path_rows[position]
+            for position in range(start, end)
+            if self._path_keys[position] == directory or self._path_keys[position].startswith(directory + "/")
+        ]
+
+    def _date_range_rows(self, field: str, date_from: str | None, date_to: str | None) -> list[int]:
+        keys = self._date_keys.get(field, [])
+        start = bisect.bisect_left(keys, date_from) if date_from else 0
+        end = bisect.bisect_right(keys, partial_date_period_end(date_to)) if date_to else len(keys)
+        return self._date_rows.get(field, [])[start:end]
+
+    def rows(self, semantic_filter: SemanticFilter) -> list[int] | None:
+        if semantic_filter.is_empty():
+            return None
+
+        row_sets: list[list[int]] = []
+        if semantic_filter.kinds:
+            row_sets.append(
+                [row for kind in semantic_filter.kinds for row in self.rows_by_kind.get(kind, [])]
+            )
+        if semantic_filter.path_prefix:
+            row_sets.append(self._prefix_rows(semantic_filter.path_prefix))
+        if semantic_filter.entity:
+            row_sets.append(self.rows_by_entity.get(semantic_filter.entity, []))
+        if semantic_filter.source_type:
+            row_sets.append(self.rows_by_source_type.get(semantic_filter.source_type, []))
+        if semantic_filter.date_from or semantic_filter.date_to:
+            row_sets.append(
+                self._date_range_rows(
+                    semantic_filter.date_field,
+                    semantic_filter.date_from,
+                    semantic_filter.date_to,
+                )
+            )
+
+        row_sets.sort(key=len)
+        selected = set(row_sets[0])
+        for rows in row_sets[1:]:
+            if not selected:
+                break
+            selected.intersection_update(rows)
+        return sorted(selected)
+
+
+def semantic_metadata_index(index_payload: dict[str, Any]) -> SemanticMetadataIndex:
+    metadata_index = index_payload.get("metadata_index")
+    if metadata_index is None:
+        metadata_index = SemanticMetadataIndex(index_payload.get("chunks", []))
+        index_payload["metadata_index"] = metadata_index
+    return metadata_index
+
+
+def semantic_index_matrix(index_payload: dict[str, Any]) -> Any | None:
+    matrix = index_payload.get("vectors")
+    if matrix is not None:
+        return matrix
+
+    numpy = _require_numpy()
+    rows: list[list[float]] = []
+    for chunk in index_payload.get("chunks", []):
+        vector = chunk.get("vector")
+        if not isinstance(vector, list):
+            return None
+        rows.append(vector)
+    embedding_dim = len(rows[0]) if rows else int(index_payload.get("embedding_dim") or 0)
+    matrix = normalize_vector_matrix(
+        numpy.asarray(rows, dtype=numpy.float32).reshape(len(rows), embedding_dim)
+    )
+    index_payload["vectors"] = matrix
+    return matrix
+
+
+def rank_semantic_rows(
+    index_payload: dict[str, Any],
+    query_vector: Any,
+    *,
+    limit: int,
+    min_score: float | None = None,
+    exact: bool = False,
+    n_probe: int | None = None,
+    semantic_filter: SemanticFilter | None = None,
+) -> tuple[list[tuple[int, float]], str]:
+    filtered_rows = None
+    if semantic_filter is not None:
+        filtered_rows = semantic_metadata_index(index_payload).rows(semantic_filter)
+
+    numpy = _optional_numpy()
+    matrix = semantic_index_matrix(index_payload) if numpy is not None else None
+    if matrix is None:
+        chunks = index_payload.get("chunks", [])
+        ranked = _rank_rows_with_python(
+            chunks,
+            query_vector,
+            limit=limit,
+            min_score=min_score,
+            rows=filtered_rows,
+        )
+        return ranked, "exact" if filtered_rows is None else "filtered"
+
+    query = _normalized_query(numpy, query_vector)
+    if filtered_rows is not None:
+        ranked = _rank_rows_with_numpy(
+            numpy,
+            matrix,
+            query,
+            limit=limit,
+            min_score=min_score,
+            candidate_rows=numpy.asarray(filtered_rows, dtype=numpy.int64),
+        )
+        return ranked, "filtered"
+
+    ann_index = index_payload.get("ann_index")
+    if exact or ann_index is None:
+        return _rank_rows_with_numpy(numpy, matrix, query, limit=limit, min_score=min_score), "exact"
+
+    ann_payload = index_payload.get("ann") or {}
+    probes = n_probe or int(ann_payload.get("n_probe") or DEFAULT_ANN_N_PROBE)
+    candidate_rows = _ann_candidate_rows(numpy, ann_index, query, n_probe=probes)
+    ranked = _rank_rows_with_numpy(
+        numpy,
+        matrix,
+        query,
+        limit=limit,
+        min_score=min_score,
+        candidate_rows=candidate_rows,
+    )
+    return ranked, "ann"
+
+
+def _normalized_query(numpy: Any, query_vector: Any) -> Any:
+    query = numpy.asarray(query_vector, dtype=numpy.float32)
+    query_norm = float(numpy.linalg.norm(query))
+    if query_norm > 0.0:
+        return query / query_norm
+    return query
+
+
+def _ann_candidate_rows(numpy: Any, ann_index: dict[str, Any], query: Any, *, n_probe: int) -> Any:
+    centroid_scores = ann_index["centroids"] @ query
+    n_probe = min(n_probe, centroid_scores.shape[0])
+    probes = numpy.argpartition(-centroid_scores, n_probe - 1)[:n_probe]
+    offsets = ann_index["offsets"]
+    rows = ann_index["rows"]
+    return numpy.sort(numpy.concatenate([rows[offsets[probe] : offsets[probe + 1]] for probe in probes]))
+
+
+def _rank_rows_with_numpy(
+    numpy: Any,
+    matrix: Any,
+    query: Any,
+    *,
+    limit: int,
+    min_score: float | None,
+    candidate_rows: Any | None = None,
+) -> list[tuple[int, float]]:
+    if matrix.shape[0] == 0:
+        return []
+
+    if candidate_rows is None:
+        rows = numpy.arange(matrix.shape[0])
+        scores = matrix @ query
+    else:
+        rows = candidate_rows
+        scores = matrix[rows] @ query if rows.shape[0] else numpy.zeros(0, dtype=numpy.float32)
+
+    if min_score is not None:
+        keep = scores >= min_score
+        rows = rows[keep]
+        scores = scores[keep]
+    if scores.shape[0] > limit:
+        selected = numpy.argpartition(-scores, limit - 1)[:limit]
+    else:
+        selected = numpy.arange(scores.shape[0])
+    order = selected[numpy.lexsort((rows[selected], -scores[selected]))]
+    return [(int(rows[position]), float(scores[position])) for position in order]
+
+
+def benchmark_semantic_index(
+    index_payload: dict[str, Any],
+    *,
+    query_count: int = 100,
+    limit: int = 10,
+    n_probe: int | None = None,
+    seed: int = 0,
+) -> dict[str, Any]:
+    numpy = _require_numpy()
+    matrix = semantic_index_matrix(index_payload)
+    if matrix is None or matrix.shape[0] == 0:
+        raise ValueError("semantic index has no vectors to benchmark")
+    if query_count < 1 or limit < 1:
+        raise ValueError("query_count and limit must be positive")
+
+    rng = numpy.random.default_rng(seed)
+    query_rows = rng.choice(matrix.shape[0], size=min(query_count, matrix.shape[0]), replace=False)
+    exact_seconds: list[float] = []
+    ann_seconds: list[float] = []
+    recalls: list[float] = []
+    for row in query_rows:
+        query = numpy.asarray(matrix[row], dtype=numpy.float32)
+        started = time.perf_counter()
+        exact_ranked, _ = rank_semantic_rows(index_payload, query, limit=limit, exact=True)
+        exact_seconds.append(time.perf_counter() - started)
+        if index_payload.get("ann_index") is None:
+            continue
+        started = time.perf_counter()
+        ann_ranked, _ = rank_semantic_rows(index_payload, query, limit=limit, n_probe=n_probe)
+        ann_seconds.append(time.perf_counter() - started)
+        expected = {ranked_row for ranked_row, _ in exact_ranked}
+        found = {ranked_row for ranked_row, _ in ann_ranked}
+        recalls.append(len(expected & found) / len(expected) if expected else 1.0)
+
+    def latency_ms(samples: list[float]) -> dict[str, float] | None:
+        if not samples:
+            return None
+        values = numpy.asarray(samples) * 1000.0
+        return {
+            "p50": round(float(numpy.percentile(values, 50)), 3),
+            "p95": round(float(numpy.percentile(values, 95)), 3),
+            "mean": round(float(values.mean()), 3),
+        }
+
+    ann_payload = index_payload.get("ann") or {}
+    return {
+        "ok": True,
+        "chunk_count": int(matrix.shape[0]),
+        "query_count": int(query_rows.shape[0]),
+        "limit": limit,
+        "ann": ann_payload or None,
+        "n_probe": (n_probe or int(ann_payload.get("n_probe") or DEFAULT_ANN_N_PROBE)) if ann_payload else None,
+        "exact_latency_ms": latency_ms(exact_seconds),
+        "ann_latency_ms": latency_ms(ann_seconds),
+        "recall_at_k": round(sum(recalls) / len(recalls), 4) if recalls else None,
+    }
+
+
+def _rank_rows_with_python(
+    chunks: list[dict[str, Any]],
+    query_vector: list[float],
+    *,
+    limit: int,
+    min_score: float | None,
+    rows: list[int] | None = None,
+) -> list[tuple[int, float]]:
+    candidates: list[tuple[int, float]] = []
+    for row in range(len(chunks)) if rows is None else rows:
+        vector = chunks[row].get("vector")
+        if not isinstance(vector, list):
+            continue
+        chunk_vector = [float(value) for value in vector]
+        score = _cosine_similarity(query_vector, chunk_vector)
+        if min_score is not None and score < min_score:
+            continue
+        candidates.append((row, score))
+
+    candidates.sort(key=lambda value: value[1], reverse=True)
+    return candidates[:limit]
+
+
 def _excerpt(text: str, *, max_chars: int = 240) -> str:
     normalized = normalize_text(text)
     if len(normalized) <= max_chars:
@@ -326,18 +1313,14 @@ def _excerpt(text: str, *, max_chars: int = 240) -> str:
     return normalized[: max_chars - 3].rstrip() + "..."
 
 
-def search_semantic_index(
+def _embed_query(
     *,
     index_payload: dict[str, Any],
     query: str,
     embedding_backend: EmbeddingBackend,
-    limit: int = 8,
-    min_score: float | None = None,
-    allow_model_mismatch: bool = False,
-) -> dict[str, Any]:
-    if limit < 1:
-        raise ValueError("limit must be positive")
-
+    allow_model_mismatch: bool,
+    query_cache: QueryEmbeddingCache | None,
+) -> tuple[str, Any, bool | None]:
     model_payload = index_payload.get("model") or {}
     index_model_name = str(model_payload.get("name") or "")
     if index_model_name and embedding_backend.model_name != index_model_name and not allow_model_mismatch:
@@ -346,48 +1329,192 @@ def search_semantic_index(
             f"(index={index_model_name}, query={embedding_backend.model_name})"
         )
 
-    query_text = query.strip()
+    # Normalize before branching so cached and uncached searches embed the same text.
+    query_text = normalize_text(query)
     if not query_text:
         raise ValueError("query must be non-empty")
 
-    query_vectors = embedding_backend.embed_texts([query_text])
+    cache_hit: bool | None = None
+    if query_cache is not None:
+        query_vector, cache_hit = query_cache.embed(embedding_backend, query_text)
+    else:
+        query_vectors = embedding_backend.embed_texts([query_text])
+        query_vector = query_vectors[0] if query_vectors else []
     embedding_dim = int(index_payload.get("embedding_dim") or 0)
-    query_vector = query_vectors[0] if query_vectors else []
     if embedding_dim > 0 and len(query_vector) != embedding_dim:
         raise ValueError(
             f"query embedding dimension mismatch: expected {embedding_dim}, got {len(query_vector)}"
         )
+    return query_text, query_vector, cache_hit
 
-    candidates: list[dict[str, Any]] = []
-    for chunk in index_payload.get("chunks", []):
-        vector = chunk.get("vector")
-        if not isinstance(vector, list):
-            continue
-        chunk_vector = [float(value) for value in vector]
-        score = _cosine_similarity(query_vector, chunk_vector)
-        if min_score is not None and score < min_score:
-            continue
-        candidates.append(
-            {
-                "id": str(chunk.get("id") or ""),
-                "path": str(chunk.get("path") or ""),
-                "data_path": str(chunk.get("data_path") or ""),
-                "score": score,
-                "char_count": int(chunk.get("char_count") or 0),
-                "excerpt": _excerpt(str(chunk.get("text") or "")),
-            }
-        )
-
-    candidates.sort(key=lambda value: value["score"], reverse=True)
-    top = candidates[:limit]
-    for rank, item in enumerate(top, start=1):
-        item["rank"] = rank
 
+def _result_item(chunk: dict[str, Any], *, score: float, rank: int) -> dict[str, Any]:
     return {
+        "id": str(chunk.get("id") or ""),
+        "path": str(chunk.get("path") or ""),
+        "data_path": str(chunk.get("data_path") or ""),
+        "score": score,
+        "char_count": int(chunk.get("char_count") or 0),
+        "excerpt": _excerpt(str(chunk.get("text") or "")),
+        "rank": rank,
+        "metadata": chunk.get("metadata") or {},
+    }
+
+
+def _search_response(
+    *,
+    index_payload: dict[str, Any],
+    query_text: str,
+    limit: int,
+    search_mode: str,
+    results: list[dict[str, Any]],
+    query_cache: QueryEmbeddingCache | None,
+    cache_hit: bool | None,
+    semantic_filter: SemanticFilter | None = None,
+) -> dict[str, Any]:
+    result = {
         "ok": True,
         "query": query_text,
         "limit": limit,
         "chunk_count": int(index_payload.get("chunk_count") or len(index_payload.get("chunks", []))),
-        "model": model_payload,
-        "results": top,
+        "model": index_payload.get("model") or {},
+        "search_mode": search_mode,
+        "results": results,
     }
+    if semantic_filter is not None and not semantic_filter.is_empty():
+        result["filter"] = semantic_filter.as_dict()
+    if query_cache is not None:
+        result["query_cache"] = {"hit": cache_hit, **query_cache.stats()}
+    return result
+
+
+def search_semantic_index(
+    *,
+    index_payload: dict[str, Any],
+    query: str,
+    embedding_backend: EmbeddingBackend,
+    limit: int = 8,
+    min_score: float | None = None,
+    allow_model_mismatch: bool = False,
+    exact: bool = False,
+    n_probe: int | None = None,
+    query_cache: QueryEmbeddingCache | None = None,
+    semantic_filter: SemanticFilter | None = None,
+) -> dict[str, Any]:
+    if limit < 1:
+        raise ValueError("limit must be positive")
+    if n_probe is not None and n_probe < 1:
+        raise ValueError("n_probe must be positive")
+
+    query_text, query_vector, cache_hit = _embed_query(
+        index_payload=index_payload,
+        query=query,
+        embedding_backend=embedding_backend,
+        allow_model_mismatch=allow_model_mismatch,
+        query_cache=query_cache,
+    )
+    chunks = index_payload.get("chunks", [])
+    ranked, search_mode = rank_semantic_rows(
+        index_payload,
+        query_vector,
+        limit=limit,
+        min_score=min_score,
+        exact=exact,
+        n_probe=n_probe,
+        semantic_filter=semantic_filter,
+    )
+
+    return _search_response(
+        index_payload=index_payload,
+        query_text=query_text,
+        limit=limit,
+        search_mode=search_mode,
+        results=[
+            _result_item(chunks[row], score=score, rank=rank)
+            for rank, (row, score) in enumerate(ranked, start=1)
+        ],
+        query_cache=query_cache,
+        cache_hit=cache_hit,
+        semantic_filter=semantic_filter,
+    )
+
+
+def hybrid_search_index(
+    *,
+    index_payload: dict[str, Any],
+    query: str,
+    embedding_backend: EmbeddingBackend,
+    limit: int = 8,
+    candidate_limit: int | None = None,
+    rrf_k: int = DEFAULT_RRF_K,
+    allow_model_mismatch: bool = False,
+    exact: bool = False,
+    n_probe: int | None = None,
+    query_cache: QueryEmbeddingCache | None = None,
+    semantic_filter: SemanticFilter | None = None,
+) -> dict[str, Any]:
+    if limit < 1:
+        raise ValueError("limit must be positive")
+    if rrf_k < 1:
+        raise ValueError("rrf_k must be positive")
+    lexical_index = index_payload.get("lexical_index")
+    if lexical_index is None:
+        raise ValueError("semantic index has no lexical index; rebuild it with `kb semantic-index`")
+
+    query_text, query_vector, cache_hit = _embed_query(
+        index_payload=index_payload,
+        query=query,
+        embedding_backend=embedding_backend,
+        allow_model_mismatch=allow_model_mismatch,
+        query_cache=query_cache,
+    )
+    candidates = max(candidate_limit or limit * 5, limit)
+    semantic_ranked, search_mode = rank_semantic_rows(
+        index_payload,
+        query_vector,
+        limit=candidates,
+        exact=exact,
+        n_probe=n_probe,
+        semantic_filter=semantic_filter,
+    )
+    allowed_rows = None
+    if semantic_filter is not None:
+        filtered_rows = semantic_metadata_index(index_payload).rows(semantic_filter)
+        allowed_rows = set(filtered_rows) if filtered_rows is not None else None
+    lexical_ranked = rank_lexical_rows(
+        lexical_index,
+        query_text,
+        limit=candidates,
+        allowed_rows=allowed_rows,
+    )
+
+    fused: dict[int, dict[str, Any]] = {}
+    for source, ranked in (("semantic", semantic_ranked), ("lexical", lexical_ranked)):
+        for rank, (row, score) in enumerate(ranked, start=1):
+            entry = fused.setdefault(row, {"score": 0.0})
+            entry["score"] += 1.0 / (rrf_k + rank)
+            entry[f"{source}_rank"] = rank
+            entry[f"{source}_score"] = score
+
+    chunks = index_payload.get("chunks", [])
+    ordered = sorted(fused.items(), key=lambda item: (-item[1]["score"], item[0]))[:limit]
+    results: list[dict[str, Any]] = []
+    for rank, (row, entry) in enumerate(ordered, start=1):
+        item = _result_item(chunks[row], score=entry["score"], rank=rank)
+        for source in ("semantic", "lexical"):
+            item[f"{source}_rank"] = entry.get(f"{source}_rank")
+            item[f"{source}_score"] = entry.get(f"{source}_score")
+        results.append(item)
+
+    response = _search_response(
+        index_payload=index_payload,
+        query_text=query_text,
+        limit=limit,
+        search_mode=f"hybrid-{search_mode}",
+        results=results,
+        query_cache=query_cache,
+        cache_hit=cache_hit,
+        semantic_filter=semantic_filter,
+    )
+    response["fusion"] = {"method": "rrf", "k": rrf_k, "candidate_limit": candidates}
+    return response
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import yaml
+
+from kb.edge_index import EDGE_INDEX_VERSION, edge_index_path, load_edge_index, open_edge_index
+from kb.edges import derive_employment_edges, sync_edge_backlinks
+
+
+def _write_markdown_with_frontmatter(path: Path, frontmatter: dict[str, object], body: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    frontmatter_block = yaml.safe_dump(frontmatter, sort_keys=False).strip()
+    path.write_text(f"---\n{frontmatter_block}\n---\n\n{body}", encoding="utf-8")
+
+
+def _write_edge(project_root: Path, edge_id: str, relation: str, from_entity: str, to_entity: str) -> None:
+    edge_path = project_root / f"data/edge/{edge_id[:2]}/edge@{edge_id}.json"
+    edge_path.parent.mkdir(parents=True, exist_ok=True)
+    edge_path.write_text(
+        json.dumps(
+            {
+                "id": edge_id,
+                "relation": relation,
+                "directed": relation != "knows",
+                "from": from_entity,
+                "to": to_entity,
+                "first_noted_at": "2026-02-10",
+                "last_verified_at": "2026-02-10",
+                "valid_from": None,
+                "valid_to": None,
+                "sources": ["source/te/source@test-source"],
+                "notes": "",
+                "strength": 5 if relation == "knows" else None,
+            },
+            indent=2,
+            sort_keys=True,
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+
+
+def _write_graph(project_root: Path) -> None:
+    _write_markdown_with_frontmatter(
+        project_root / "data/source/te/source@test-source/index.md",
+        {
+            "id": "source@test-source",
+            "title": "Test Source",
+            "source-type": "website",
+            "citation-key": "test-source",
+            "source-path": "data/source/te/source@test-source/index.md",
+            "url": "https://example.com/source",
+            "retrieved-at": "2026-02-10",
+        },
+        "# Test Source\n",
+    )
+    _write_markdown_with_frontmatter(project_root / "data/org/ac/org@acme/index.md", {"org": "Acme"}, "# Acme\n")
+    for slug in ("alice", "bob"):
+        _write_markdown_with_frontmatter(project_root / f"data/person/{slug[:2]}/person@{slug}/index.md", {}, "# P\n")
+    _write_edge(project_root, "wa-alice-acme", "works_at", "person/al/person@alice", "org/ac/org@acme")
+    _write_edge(project_root, "wa-bob-acme", "works_at", "person/bo/person@bob", "org/ac/org@acme")
+    _write_edge(project_root, "kn-alice-bob", "knows", "person/al/person@alice", "person/bo/person@bob")
+
+
+def test_sync_edge_backlinks_writes_queryable_adjacency_index(tmp_path: Path) -> None:
+    project_root = tmp_path
+    data_root = project_root / "data"
+    _write_graph(project_root)
+
+    result = sync_edge_backlinks(project_root=project_root, data_root=data_root)
+    assert result["edge_index"] == ".build/edges/index.json"
+    assert result["indexed_edges"] == 3
+
+    index = load_edge_index(edge_index_path(project_root), data_root="data")
+    assert index is not None
+    assert [edge["id"] for edge in index.query(to_entity="org/ac/org@acme")] == ["wa-alice-acme", "wa-bob-acme"]
+    assert [edge["id"] for edge in index.query(from_entity="person/al/person@alice")] == [
+        "kn-alice-bob",
+        "wa-alice-acme",
+    ]
+    assert [
+        edge["id"] for edge in index.query(from_entity="person/al/person@alice", relation="works_at")
+    ] == ["wa-alice-acme"]
+    assert index.query(relation="works_at", to_entity="person/bo/person@bob") == []
+    assert index.query(from_entity="person/zz/person@nobody") == []
+    assert index.query(relation="knows")[0]["path"] == "data/edge/kn/edge@kn-alice-bob.json"
+
+
+def test_derive_updates_index_incrementally_and_stale_versions_rebuild(tmp_path: Path) -> None:
+    project_root = tmp_path
+    data_root = project_root / "data"
+    _write_graph(project_root)
+    sync_edge_backlinks(project_root=project_root, data_root=data_root)
+
+    employment_path = project_root / "data/person/al/person@alice/employment-history.jsonl"
+    employment_path.write_text(
+        json.dumps(
+            {
+                "id": "employment-001",
+                "period": "2024 - Present",
+                "organization": "Acme",
+                "organization_ref": "org/ac/org@acme",
+                "role": "Engineer",
+                "notes": None,
+                "source": "[^test-source]",
+                "source_path": "data/person/al/person@alice/index.md",
+                "source_section": "employment_history_table",
+                "source_row": 1,
+            }
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    derive_employment_edges(project_root=project_root, data_root=data_root, as_of="2026-03-02")
+    index = open_edge_index(project_root=project_root, data_root=data_root)
+    assert [edge["id"] for edge in index.query(to_entity="org/ac/org@acme")] == [
+        "employment-alice-employment-001",
+        "wa-alice-acme",
+        "wa-bob-acme",
+    ]
+
+    employment_path.write_text("", encoding="utf-8")
+    derive_employment_edges(project_root=project_root, data_root=data_root, as_of="2026-03-03")
+    index = open_edge_index(project_root=project_root, data_root=data_root)
+    assert "employment-alice-employment-001" not in index.edges
+    assert [edge["id"] for edge in index.query(to_entity="org/ac/org@acme")] == ["wa-alice-acme", "wa-bob-acme"]
+
+    index_path = edge_index_path(project_root)
+    payload = json.loads(index_path.read_text(encoding="utf-8"))
+    payload["version"] = EDGE_INDEX_VERSION + 1
+    payload["edges"] = {}
+    index_path.write_text(json.dumps(payload), encoding="utf-8")
+    assert load_edge_index(index_path, data_root="data") is None
+    assert len(open_edge_index(project_root=project_root, data_root=data_root).edges) == 3
+
+
+def test_open_edge_index_refreshes_after_external_edge_changes(tmp_path: Path) -> None:
+    project_root = tmp_path
+    data_root = project_root / "data"
+    _write_graph(project_root)
+    assert len(open_edge_index(project_root=project_root, data_root=data_root).edges) == 3
+
+    _write_edge(project_root, "wa-alice-acme", "works_at", "person/bo/person@bob", "org/ac/org@acme")
+    edited = project_root / "data/edge/wa/edge@wa-alice-acme.json"
+    stat = edited.stat()
+    os.utime(edited, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    (project_root / "data/edge/wa/edge@wa-bob-acme.json").unlink()
+    _write_edge(project_root, "kn-bob-alice", "knows", "person/bo/person@bob", "person/al/person@alice")
+
+    index = open_edge_index(project_root=project_root, data_root=data_root)
+    assert sorted(index.edges) == ["kn-alice-bob", "kn-bob-alice", "wa-alice-acme"]
+    assert [edge["id"] for edge in index.query(to_entity="org/ac/org@acme")] == ["wa-alice-acme"]
+    assert [edge["id"] for edge in index.query(from_entity="person/bo/person@bob")] == [
+        "kn-bob-alice",
+        "wa-alice-acme",
+    ]
+
+    reloaded = load_edge_index(edge_index_path(project_root), data_root="data")
+    assert reloaded is not None
+    assert reloaded.refresh(project_root=project_root, data_root=data_root) is False
+    assert sorted(reloaded.files) == [
+        "data/edge/kn/edge@kn-alice-bob.json",
+        "data/edge/kn/edge@kn-bob-alice.json",
+        "data/edge/wa/edge@wa-alice-acme.json",
+    ]
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
+import pytest
 import yaml
 
-from kb.edges import derive_citation_edges, derive_employment_edges
+from kb.edges import changed_entity_dirs, derive_citation_edges, derive_employment_edges, sync_edge_backlinks
 
 
 def _write_markdown_with_frontmatter(path: Path, frontmatter: dict[str, object], body: str) -> None:
@@ -159,3 +161,223 @@ def test_derive_employment_edges_preserves_existing_dates_for_unchanged_edges(tm
     edge_payload = _read_edge(edge_path)
     assert edge_payload["first_noted_at"] == "2026-02-10"
     assert edge_payload["last_verified_at"] == "2026-02-10"
+
+
+def _write_employment_rows(project_root: Path, slug: str, row_ids: list[str]) -> Path:
+    employment_path = project_root / f"data/person/{slug[:2]}/person@{slug}/employment-history.jsonl"
+    employment_path.write_text(
+        "".join(
+            json.dumps(
+                {
+                    "id": row_id,
+                    "period": "2024 - Present",
+                    "organization": "Acme",
+                    "organization_ref": "org/ac/org@acme",
+                    "role": "Engineer",
+                    "notes": None,
+                    "source": "[^test-source]",
+                    "source_path": f"data/person/{slug[:2]}/person@{slug}/index.md",
+                    "source_section": "employment_history_table",
+                    "source_row": index,
+                },
+                sort_keys=True,
+            )
+            + "\n"
+            for index, row_id in enumerate(row_ids, start=1)
+        ),
+        encoding="utf-8",
+    )
+    return employment_path
+
+
+def test_derive_edges_for_changed_entities_only_and_remove_stale_edges(tmp_path: Path) -> None:
+    project_root = tmp_path
+    data_root = project_root / "data"
+    _write_source_record(project_root)
+    _write_markdown_with_frontmatter(project_root / "data/org/ac/org@acme/index.md", {"org": "Acme"}, "# Acme\n")
+    for slug in ("alice", "alice-smith"):
+        _write_markdown_with_frontmatter(
+            project_root / f"data/person/al/person@{slug}/index.md",
+            {"person": slug.title()},
+            f"# {slug.title()}\n\nMet at a conference.[^test-source]\n",
+        )
+        _write_employment_rows(project_root, slug, ["employment-001", "employment-002"])
+
+    full = derive_employment_edges(project_root=project_root, data_root=data_root, as_of="2026-03-02")
+    assert full["scope"] == "full"
+    assert full["created_edge_files"] == 4
+    citations = derive_citation_edges(project_root=project_root, data_root=data_root, as_of="2026-03-02")
+    assert citations["created_edge_files"] == 2
+
+    _write_employment_rows(project_root, "alice", ["employment-001"])
+    _write_employment_rows(project_root, "alice-smith", [])
+    changed = changed_entity_dirs(data_root, [data_root / "person/al/person@alice/employment-history.jsonl"])
+    assert changed == {"person/al/person@alice"}
+
+    employment = derive_employment_edges(
+        project_root=project_root,
+        data_root=data_root,
+        as_of="2026-03-03",
+        changed_entity_dirs=changed,
+    )
+    assert employment["ok"] is True
+    assert employment["scope"] == "changed"
+    assert employment["person_entities_scanned"] == 1
+    assert employment["unchanged_existing"] == 1
+    assert employment["removed_paths"] == ["data/edge/em/edge@employment-alice-employment-002.json"]
+    assert (data_root / "edge/em/edge@employment-alice-smith-employment-002.json").exists()
+
+    _write_markdown_with_frontmatter(
+        project_root / "data/person/al/person@alice-smith/index.md",
+        {"person": "Alice Smith"},
+        "# Alice Smith\n",
+    )
+    citation = derive_citation_edges(
+        project_root=project_root,
+        data_root=data_root,
+        as_of="2026-03-03",
+        changed_entity_dirs={"person/al/person@alice-smith"},
+    )
+    assert citation["entities_scanned"] == 1
+    assert citation["removed_paths"] == ["data/edge/ci/edge@citation-person-alice-smith-test-source.json"]
+    assert (data_root / "edge/ci/edge@citation-person-alice-test-source.json").exists()
+
+    full_again = derive_employment_edges(project_root=project_root, data_root=data_root, as_of="2026-03-03")
+    assert full_again["removed_paths"] == [
+        "data/edge/em/edge@employment-alice-smith-employment-001.json",
+        "data/edge/em/edge@employment-alice-smith-employment-002.json",
+    ]
+
+
+def test_derive_employment_edges_reads_each_edge_once_and_flushes_dirty_records(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    project_root = tmp_path
+    data_root = project_root / "data"
+    _write_source_record(project_root)
+    _write_markdown_with_frontmatter(project_root / "data/org/ac/org@acme/index.md", {"org": "Acme"}, "# Acme\n")
+    _write_markdown_with_frontmatter(project_root / "data/person/al/person@alice/index.md", {"person": "Alice"}, "# Alice\n")
+    employment_path = _write_employment_rows(project_root, "alice", ["employment-001", "employment-002"])
+    derive_employment_edges(project_root=project_root, data_root=data_root, as_of="2026-03-02")
+
+    employment_path.write_text(
+        employment_path.read_text(encoding="utf-8").replace('"role": "Engineer"', '"role": "Manager"', 1),
+        encoding="utf-8",
+    )
+    edge_reads: list[str] = []
+    edge_writes: list[str] = []
+    original_read_text = Path.read_text
+    original_write_text = Path.write_text
+
+    def counting_read_text(path: Path, *args: object, **kwargs: object) -> str:
+        if path.name.startswith("edge@"):
+            edge_reads.append(path.name)
+        return original_read_text(path, *args, **kwargs)
+
+    def counting_write_text(path: Path, *args: object, **kwargs: object) -> int:
+        if path.name.startswith("edge@"):
+            edge_writes.append(path.name)
+        return original_write_text(path, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+    monkeypatch.setattr(Path, "write_text", counting_write_text)
+    result = derive_employment_edges(project_root=project_root, data_root=data_root, as_of="2026-03-03")
+
+    assert sorted(edge_reads) == [
+        "edge@employment-alice-employment-001.json",
+        "edge@employment-alice-employment-002.json",
+    ]
+    assert edge_writes == ["edge@employment-alice-employment-001.json"]
+    assert result["updated_paths"] == ["data/edge/em/edge@employment-alice-employment-001.json"]
+    assert result["unchanged_existing"] == 1
+    edge_payload = _read_edge(data_root / "edge/em/edge@employment-alice-employment-001.json")
+    assert edge_payload["notes"] == "Role: Manager | Period: 2024 - Present"
+    assert edge_payload["first_noted_at"] == "2026-03-02"
+    assert edge_payload["last_verified_at"] == "2026-03-03"
+
+
+def test_changed_entity_dirs_expands_directory_paths(tmp_path: Path) -> None:
+    data_root = tmp_path / "data"
+    for rel_dir in ("person/al/person@alice", "person/bo/person@bob", "org/ac/org@acme"):
+        _write_markdown_with_frontmatter(data_root / rel_dir / "index.md", {}, "# Entity\n")
+
+    assert changed_entity_dirs(data_root, [data_root / "person"]) == {
+        "person/al/person@alice",
+        "person/bo/person@bob",
+    }
+    assert changed_entity_dirs(data_root, [data_root / "person/zz/person@gone/index.md"]) == {
+        "person/zz/person@gone"
+    }
+    assert changed_entity_dirs(data_root, [data_root / "edge/em/edge@x.json", tmp_path / "README.md"]) == set()
+
+
+def _write_edge(project_root: Path, edge_id: str, from_entity: str, to_entity: str) -> Path:
+    edge_path = project_root / f"data/edge/{edge_id[:2]}/edge@{edge_id}.json"
+    edge_path.parent.mkdir(parents=True, exist_ok=True)
+    edge_path.write_text(
+        json.dumps(
+            {
+                "id": edge_id,
+                "relation": "works_at",
+                "directed": True,
+                "from": from_entity,
+                "to": to_entity,
+                "first_noted_at": "2026-02-10",
+                "last_verified_at": "2026-02-10",
+                "valid_from": None,
+                "valid_to": None,
+                "sources": ["source/te/source@test-source"],
+                "notes": None,
+                "strength": None,
+            },
+            indent=2,
+            sort_keys=True,
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    return edge_path
+
+
+def test_sync_edge_backlinks_only_touches_changed_links(tmp_path: Path) -> None:
+    project_root = tmp_path
+    data_root = project_root / "data"
+    _write_source_record(project_root)
+    for kind, slug, title_key in (("person", "alice", "person"), ("person", "bob", "person"), ("org", "acme", "org")):
+        _write_markdown_with_frontmatter(
+            project_root / f"data/{kind}/{slug[:2]}/{kind}@{slug}/index.md",
+            {title_key: slug.title()},
+            f"# {slug.title()}\n",
+        )
+    _write_edge(project_root, "works-alice-acme", "person/al/person@alice", "org/ac/org@acme")
+    bob_edge = _write_edge(project_root, "works-bob-acme", "person/bo/person@bob", "org/ac/org@acme")
+
+    first = sync_edge_backlinks(project_root=project_root, data_root=data_root)
+    assert first["ok"] is True
+    assert (first["links_created"], first["links_removed"], first["links_retargeted"]) == (4, 0, 0)
+
+    alice_link = data_root / "person/al/person@alice/edges/edge@works-alice-acme.json"
+    alice_inode = os.lstat(alice_link).st_ino
+    second = sync_edge_backlinks(project_root=project_root, data_root=data_root)
+    assert (second["links_created"], second["links_removed"], second["links_retargeted"]) == (0, 0, 0)
+    assert second["links_unchanged"] == 4
+    assert os.lstat(alice_link).st_ino == alice_inode
+
+    bob_link = data_root / "person/bo/person@bob/edges/edge@works-bob-acme.json"
+    bob_link.unlink()
+    os.symlink("../../../../edge/wo/edge@works-alice-acme.json", bob_link)
+    moved_edge = data_root / "edge/mo/edge@works-bob-acme.json"
+    moved_edge.parent.mkdir(parents=True)
+    bob_edge.rename(moved_edge)
+    _write_edge(project_root, "works-bob-acme-advisor", "person/bo/person@bob", "org/ac/org@acme")
+    (data_root / "org/ac/org@acme/edges/edge@stale.json").symlink_to("../../../../edge/st/edge@stale.json")
+
+    third = sync_edge_backlinks(project_root=project_root, data_root=data_root)
+    assert third["ok"] is True
+    assert third["links_created"] == 2
+    assert third["links_retargeted"] == 2
+    assert third["links_removed"] == 1
+    assert third["links_unchanged"] == 2
+    assert os.lstat(alice_link).st_ino == alice_inode
+    assert (bob_link.parent / os.readlink(bob_link)).resolve() == moved_edge.resolve()
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from kb import lexical
+
+
+def test_tokenize_lowercases_and_drops_single_letters() -> None:
+    assert lexical.tokenize("Alice & Bob's A1 payments, 7 x") == ["alice", "bob", "a1", "payments", "7"]
+
+
+def test_bm25_prefers_rare_terms_and_shorter_documents() -> None:
+    index = lexical.build_lexical_index(
+        [
+            "alice founder payments",
+            "bob founder gaming graphics engines and systems",
+            "carol founder payments payments",
+        ]
+    )
+
+    ranked = lexical.rank_lexical_rows(index, "payments", limit=3)
+    assert [row for row, _ in ranked] == [2, 0]
+
+    ranked = lexical.rank_lexical_rows(index, "founder graphics", limit=1)
+    assert ranked[0][0] == 1
+    assert lexical.rank_lexical_rows(index, "unknown", limit=3) == []
+
+
+def test_lexical_index_round_trips_through_disk(tmp_path: Path) -> None:
+    index = lexical.build_lexical_index(["alice payments", "bob gaming"])
+    path = tmp_path / "index.lexical.json"
+    lexical.write_lexical_index(path, index)
+
+    loaded = lexical.load_lexical_index(path)
+    assert loaded["doc_count"] == 2
+    assert lexical.rank_lexical_rows(loaded, "gaming", limit=2) == lexical.rank_lexical_rows(
+        index, "gaming", limit=2
+    )
+
+    path.write_text('{"version": 99}', encoding="utf-8")
+    with pytest.raises(ValueError, match="unsupported lexical index version"):
+        lexical.load_lexical_index(path)
@@ -6,12 +6,14 @@ import os
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 from starlette.testclient import TestClient
 
 from kb import mcp_server
+from kb.cli import build_parser, run_edges
 from kb import semantic
 
 
@@ -265,6 +267,93 @@ def test_upsert_note_maps_busy_lock_to_retryable_error(
     assert result["error"]["retryable"] is True
 
 
+def test_concurrent_writers_queue_for_the_write_lock_instead_of_failing_busy(tmp_path: Path) -> None:
+    project_root, data_root = _init_repo(tmp_path)
+    server = mcp_server.create_mcp_server(project_root=project_root, data_root=data_root)
+    slugs = [f"queued-{index}" for index in range(6)]
+
+    def write(slug: str) -> dict[str, object]:
+        return _call_tool(server, "upsert_person", {"slug": slug, "push": False})
+
+    with ThreadPoolExecutor(max_workers=len(slugs)) as executor:
+        results = list(executor.map(write, slugs))
+
+    assert all(result["ok"] for result in results), results
+    status = _call_tool(server, "write_queue_status", {})
+    assert status["write_queue"]["queue_depth"] == 0
+    assert status["write_queue"]["acquisitions"] >= len(slugs)
+    assert status["write_queue"]["timeouts"] == 0
+
+
+def test_repo_write_lock_raises_busy_after_timeout(tmp_path: Path) -> None:
+    project_root, _ = _init_repo(tmp_path)
+    with mcp_server.repo_write_lock(project_root, timeout=1):
+        with pytest.raises(mcp_server.BusyLockError):
+            with mcp_server.repo_write_lock(project_root, timeout=0.05):
+                pass
+
+
+def test_journaled_transactions_avoid_repo_wide_status_and_batch_rollback(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    project_root, data_root = _init_repo(tmp_path)
+    server = mcp_server.create_mcp_server(project_root=project_root, data_root=data_root)
+    original_run_git = mcp_server.run_git
+    git_calls: list[list[str]] = []
+
+    def recording_run_git(
+        project_root_value: Path,
+        args: list[str],
+        *,
+        check: bool = True,
+    ) -> subprocess.CompletedProcess[str]:
+        git_calls.append(list(args))
+        return original_run_git(project_root_value, args, check=check)
+
+    monkeypatch.setattr(mcp_server, "run_git", recording_run_git)
+
+    created = _call_tool(server, "upsert_person", {"slug": "journaled", "push": False})
+    assert created["ok"] is True
+    assert sorted(created["changed_paths"]) == [
+        "data/person/jo/person@journaled/changelog.jsonl",
+        "data/person/jo/person@journaled/edges/.gitkeep",
+        "data/person/jo/person@journaled/employment-history.jsonl",
+        "data/person/jo/person@journaled/index.md",
+        "data/person/jo/person@journaled/looking-for.jsonl",
+    ]
+    status_calls = [args for args in git_calls if args[0] == "status"]
+    assert ["status", "--porcelain", "--untracked-files=all"] not in status_calls
+    assert len(status_calls) == 2
+
+    data_root_status = ["status", "--porcelain", "--untracked-files=all", "--", "data"]
+    git_calls.clear()
+    assert _call_tool(server, "upsert_person", {"slug": "warm", "push": False})["ok"] is True
+    status_calls = [args for args in git_calls if args[0] == "status"]
+    assert len(status_calls) == 1
+    assert data_root_status not in status_calls
+    assert status_calls[0][-1] == "data/person/wa/person@warm/looking-for.jsonl"
+
+    (project_root / "notes.txt").write_text("external\n", encoding="utf-8")
+    _run_git(project_root, "add", "notes.txt")
+    assert _run_git(project_root, "commit", "-m", "external commit").returncode == 0
+    git_calls.clear()
+    assert _call_tool(server, "upsert_person", {"slug": "after-pull", "push": False})["ok"] is True
+    assert [args for args in git_calls if args[0] == "status"].count(data_root_status) == 1
+
+    monkeypatch.setattr(
+        mcp_server,
+        "run_validation",
+        lambda **_: {"ok": False, "scope": "mcp-transaction", "error_count": 1, "errors": [{"code": "schema_error"}]},
+    )
+    git_calls.clear()
+    rejected = _call_tool(server, "upsert_person", {"slug": "journaled", "body": "changed", "push": False})
+    assert rejected["error"]["code"] == "validation_failed"
+    assert rejected["changed_paths"] == ["data/person/jo/person@journaled/index.md"]
+    assert sum(1 for args in git_calls if args[0] == "ls-files") == 1
+    assert _run_git(project_root, "status", "--short").stdout.strip() == ""
+
+
 def test_run_transaction_rejects_non_data_changes(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
@@ -326,7 +415,8 @@ def test_upsert_source_commits_pushes_and_keeps_repo_valid(tmp_path: Path) -> No
 
     assert result["ok"] is True
     assert result["committed"] is True
-    assert result["pushed"] is True
+    assert result["pushed"] is False
+    assert result["push"]["queued"] is True
     assert result["commit"]
     assert result["changed_paths"]
     assert all(path.startswith("data/") for path in result["changed_paths"])
@@ -343,6 +433,11 @@ def test_upsert_source_commits_pushes_and_keeps_repo_valid(tmp_path: Path) -> No
     )
     assert validation_result["ok"] is True
 
+    assert mcp_server.PUSH_QUEUES.get(project_root=project_root).flush(timeout=30) is True
+    status = _call_tool(server, "push_status", {})
+    assert status["push"]["pending_commits"] == 0
+    assert status["push"]["last_pushed_commit"] == result["commit"]
+
     local_sha = _run_git(project_root, "rev-parse", "HEAD").stdout.strip()
     remote_sha = subprocess.run(
         ["git", "-C", str(remote_root), "rev-parse", "refs/heads/main"],
@@ -463,6 +558,99 @@ def test_upsert_source_sets_allow_orphan_source_flag(tmp_path: Path) -> None:
     assert explicit_payload.allow_orphan_source is True
 
 
+def test_load_source_catalog_reports_malformed_sources_with_and_without_graph(tmp_path: Path) -> None:
+    data_root = tmp_path / "data"
+    valid = data_root / "source" / "go" / "source@good-source" / "index.md"
+    valid.parent.mkdir(parents=True)
+    valid.write_text(
+        "---\n"
+        "id: source@good-source\n"
+        "title: Good Source\n"
+        "source-type: website\n"
+        "citation-key: good-source\n"
+        "source-path: data/source/go/source@good-source/index.md\n"
+        "url: https://example.com/good\n"
+        "retrieved-at: '2026-01-01'\n"
+        "---\n\n# Good Source\n",
+        encoding="utf-8",
+    )
+    graph = mcp_server.ReferenceGraph(project_root=tmp_path, data_root=data_root)
+    graph.build()
+    assert mcp_server.load_source_catalog(data_root, graph) == mcp_server.load_source_catalog(data_root)
+    assert "good-source" in mcp_server.load_source_catalog(data_root, graph)
+
+    broken = data_root / "source" / "br" / "source@broken-source" / "index.md"
+    broken.parent.mkdir(parents=True)
+    broken.write_text("---\nid: source@broken-source\n---\n\n# Broken\n", encoding="utf-8")
+    graph.refresh([broken])
+    for catalog_graph in (graph, None):
+        with pytest.raises(ValueError, match="invalid source record source/br/source@broken-source"):
+            mcp_server.load_source_catalog(data_root, catalog_graph)
+
+
+def test_failed_edge_upsert_leaves_edge_index_unchanged(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    project_root, data_root = _init_repo(tmp_path)
+    server = mcp_server.create_mcp_server(project_root=project_root, data_root=data_root)
+    for tool, slug, frontmatter in (
+        ("upsert_person", "alice", {"person": "Alice"}),
+        ("upsert_person", "bob", {"person": "Bob"}),
+        ("upsert_org", "acme", {"org": "Acme"}),
+    ):
+        assert _call_tool(server, tool, {"slug": slug, "frontmatter": frontmatter, "push": False})["ok"] is True
+    source_result = _call_tool(
+        server,
+        "upsert_source",
+        {
+            "slug": "index-source",
+            "frontmatter": {
+                "title": "Index Source",
+                "source-category": "citations/tests",
+                "url": "https://example.com/index-source",
+            },
+            "body": "Source used by edge index tests.",
+            "push": False,
+        },
+    )
+    assert source_result["ok"] is True
+    relation = {
+        "person_ref": "person/al/person@alice",
+        "org_ref": "org/ac/org@acme",
+        "first_noted_at": "2026-01-01",
+        "last_verified_at": "2026-01-10",
+        "sources": ["source/in/source@index-source"],
+        "push": False,
+    }
+    assert _call_tool(server, "upsert_works_at_relation", {"edge_id": "alice-acme", **relation})["ok"] is True
+
+    def kb_edges() -> dict[str, object]:
+        args = build_parser().parse_args(["edges", "--project-root", str(project_root), "--to", "org/ac/org@acme"])
+        assert run_edges(args) == 0
+        return json.loads(capsys.readouterr().out)
+
+    before = kb_edges()
+    assert [edge["id"] for edge in before["edges"]] == ["alice-acme"]
+
+    monkeypatch.setattr(
+        mcp_server,
+        "run_validation",
+        lambda **_: {"ok": False, "scope": "mcp-transaction", "error_count": 1, "errors": [{"code": "schema_error"}]},
+    )
+    rejected = _call_tool(
+        server,
+        "upsert_works_at_relation",
+        {**relation, "edge_id": "bob-acme", "person_ref": "person/bo/person@bob"},
+    )
+    assert rejected["ok"] is False
+    assert rejected["error"]["code"] == "validation_failed"
+    assert not (data_root / "edge" / "bo" / "edge@bob-acme.json").exists()
+
+    assert kb_edges() == before
+
+
 def test_relation_tools_upsert_update_and_sync_symlinks(tmp_path: Path) -> None:
     project_root, data_root = _init_repo(tmp_path)
     server = mcp_server.create_mcp_server(project_root=project_root, data_root=data_root)
@@ -770,6 +958,192 @@ def test_apply_sourced_changes_allows_orphan_source_when_flagged(tmp_path: Path)
     assert result["apply"]["consumed_source_refs"] == []
 
 
+def test_transactions_validate_only_the_dependency_closure(tmp_path: Path) -> None:
+    project_root, data_root = _init_repo(tmp_path)
+    server = mcp_server.create_mcp_server(project_root=project_root, data_root=data_root)
+    person_body = "# {name}\n\n## Snapshot\n\n- Baseline.\n\n## Bio\n\nInitial bio.\n"
+    for slug, name in (("alice", "Alice"), ("bob", "Bob")):
+        result = _call_tool(
+            server,
+            "upsert_person",
+            {"slug": slug, "frontmatter": {"person": name}, "body": person_body.format(name=name), "push": False},
+        )
+        assert result["ok"] is True
+
+    created = _call_tool(
+        server,
+        "apply_sourced_changes",
+        {
+            "operations": [
+                {
+                    "op": "create_source",
+                    "slug": "closure-source",
+                    "frontmatter": {
+                        "title": "Closure Source",
+                        "source-category": "citations/tests",
+                        "url": "https://example.com/closure-source",
+                    },
+                    "body": "Source body",
+                },
+                {
+                    "op": "append_entity_section_paragraph",
+                    "entity_ref": "person/al/person@alice",
+                    "section": "Bio",
+                    "paragraph": "Sourced detail.[^closure-source]",
+                    "changelog_note": "Added sourced detail.",
+                },
+            ],
+            "push": False,
+        },
+    )
+    assert created["ok"] is True
+    assert created["validation"]["scope"] == "mcp-transaction"
+
+    cited = _call_tool(
+        server,
+        "upsert_person",
+        {
+            "slug": "bob",
+            "frontmatter": {"person": "Bob"},
+            "body": person_body.format(name="Bob") + "\nSee source.[^closure-source]\n",
+            "push": False,
+        },
+    )
+    assert cited["ok"] is True
+    assert cited["validation"]["checked"]["entities"] == 1
+    assert cited["validation"]["checked"]["sources"] == 0
+
+    external_source = data_root / "source" / "ex" / "source@external-source" / "index.md"
+    external_source.parent.mkdir(parents=True)
+    (external_source.parent / "edges").mkdir()
+    created_source = data_root / "source" / "cl" / "source@closure-source" / "index.md"
+    external_source.write_text(
+        created_source.read_text(encoding="utf-8")
+        .replace("source/cl/source@closure-source", "source/ex/source@external-source")
+        .replace("closure-source", "external-source"),
+        encoding="utf-8",
+    )
+    _run_git(project_root, "add", ".")
+    assert _run_git(project_root, "commit", "-m", "external source").returncode == 0
+
+    external_cite = _call_tool(
+        server,
+        "upsert_person",
+        {
+            "slug": "bob",
+            "frontmatter": {"person": "Bob"},
+            "body": person_body.format(name="Bob") + "\nSee source.[^external-source]\n",
+            "push": False,
+        },
+    )
+    assert external_cite["ok"] is True
+    graph = mcp_server.REFERENCE_GRAPHS.get(project_root=project_root, data_root=data_root)
+    assert graph.head == external_cite["commit"]
+    assert sorted(graph.source_records) == ["source/cl/source@closure-source", "source/ex/source@external-source"]
+
+    unresolved = _call_tool(
+        server,
+        "upsert_person",
+        {
+            "slug": "bob",
+            "frontmatter": {"person": "Bob"},
+            "body": person_body.format(name="Bob") + "\nSee source.[^missing-source]\n",
+            "push": False,
+        },
+    )
+    assert unresolved["ok"] is False
+    assert [error["code"] for error in unresolved["validation"]["errors"]] == ["unresolved_citation"]
+
+
+def test_apply_write_batch_commits_many_writes_once(tmp_path: Path) -> None:
+    project_root, data_root = _init_repo(tmp_path)
+    server = mcp_server.create_mcp_server(project_root=project_root, data_root=data_root)
+    head_before = _run_git(project_root, "rev-parse", "HEAD").stdout.strip()
+    source_ref = f"source/{mcp_server.shard_for_slug('batch-source')}/source@batch-source"
+
+    result = _call_tool(
+        server,
+        "apply_write_batch",
+        {
+            "operations": [
+                *(
+                    {"op": "upsert_entity", "kind": "person", "slug": slug, "frontmatter": {"person": slug.title()}}
+                    for slug in ("alice", "bob", "carol")
+                ),
+                {"op": "upsert_entity", "kind": "org", "slug": "acme", "frontmatter": {"org": "Acme"}},
+                {
+                    "op": "upsert_source",
+                    "slug": "batch-source",
+                    "frontmatter": {
+                        "title": "Batch Source",
+                        "source-category": "citations/tests",
+                        "url": "https://example.com/batch-source",
+                    },
+                    "body": "Source body",
+                },
+                {
+                    "op": "upsert_works_at_relation",
+                    "edge_id": "works-at-alice-acme",
+                    "person_ref": "person/al/person@alice",
+                    "org_ref": "org/ac/org@acme",
+                    "first_noted_at": "2026-01-01",
+                    "last_verified_at": "2026-01-10",
+                    "sources": [source_ref],
+                },
+            ],
+            "commit_message": "batch import",
+            "push": False,
+        },
+    )
+
+    assert result["ok"] is True
+    assert result["apply"]["operation_count"] == 6
+    assert [op["op"] for op in result["apply"]["operations"]][-1] == "upsert_works_at_relation"
+    assert result["apply"]["sync"]["ok"] is True
+    assert _run_git(project_root, "rev-list", "--count", f"{head_before}..HEAD").stdout.strip() == "1"
+    assert _run_git(project_root, "log", "-1", "--format=%s").stdout.strip() == "batch import"
+    assert (data_root / "person" / "al" / "person@alice" / "edges" / "edge@works-at-alice-acme.json").is_symlink()
+
+    rejected = _call_tool(
+        server,
+        "apply_write_batch",
+        {"operations": [{"op": "delete_everything"}], "push": False},
+    )
+    assert rejected["ok"] is False
+    assert rejected["error"]["code"] == "invalid_input"
+    assert "index 0" in rejected["error"]["message"]
+
+
+def test_write_coalescer_groups_concurrent_writes_into_one_commit(tmp_path: Path) -> None:
+    project_root, data_root = _init_repo(tmp_path)
+    head_before = _run_git(project_root, "rev-parse", "HEAD").stdout.strip()
+    coalescer = mcp_server.WriteCoalescer(project_root=project_root, data_root=data_root, window_seconds=0.2)
+
+    def write(slug: str) -> dict[str, object]:
+        def apply() -> dict[str, object]:
+            _, meta = mcp_server.upsert_entity_file(
+                project_root=project_root,
+                data_root=data_root,
+                payload=mcp_server.EntityUpsertInput(kind="person", slug=slug, frontmatter={"person": slug.title()}),
+            )
+            return meta
+
+        return coalescer.submit(commit_message=f"upsert {slug}", apply_changes=apply, push=False)
+
+    slugs = ["alice", "bob", "carol", "dave"]
+    with ThreadPoolExecutor(max_workers=len(slugs)) as executor:
+        results = list(executor.map(write, slugs))
+
+    assert all(result["ok"] for result in results)
+    assert {result["coalesced_writes"] for result in results} == {len(slugs)}
+    assert len({result["commit"] for result in results}) == 1
+    assert [result["apply"]["slug"] for result in results] == slugs
+    assert _run_git(project_root, "rev-list", "--count", f"{head_before}..HEAD").stdout.strip() == "1"
+    body = _run_git(project_root, "log", "-1", "--format=%B").stdout
+    assert body.startswith("mcp(kbv2): coalesced 4 writes")
+    assert all(f"upsert {slug}" in body for slug in slugs)
+
+
 def test_append_entity_section_paragraph_suggests_sections_and_can_create_new(tmp_path: Path) -> None:
     project_root, data_root = _init_repo(tmp_path)
     server = mcp_server.create_mcp_server(project_root=project_root, data_root=data_root)
@@ -889,6 +1263,7 @@ def test_read_only_query_tools_list_search_and_read(tmp_path: Path) -> None:
         },
     )
     assert search["ok"] is True
+    assert search["engine"] == "memory-index"
     assert search["matches"]
     assert any(
         match["path"].endswith("data/source/te/source@test-query-source/index.md")
@@ -905,6 +1280,46 @@ def test_read_only_query_tools_list_search_and_read(tmp_path: Path) -> None:
     assert "Unique Query Token 42" in read["content"]
 
 
+def test_search_data_index_is_refreshed_after_transaction_commit(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    project_root, data_root = _init_repo(tmp_path)
+    monkeypatch.setattr(
+        mcp_server,
+        "DATA_TEXT_INDEXES",
+        mcp_server.DataTextIndexRegistry(rescan_seconds=3600),
+    )
+    server = mcp_server.create_mcp_server(project_root=project_root, data_root=data_root)
+
+    before = _call_tool(server, "search_data", {"query": "Indexed After Commit", "fixed_strings": True})
+    assert before["ok"] is True
+    assert before["matches"] == []
+
+    created = _call_tool(
+        server,
+        "upsert_source",
+        {
+            "slug": "indexed-after-commit",
+            "frontmatter": {
+                "title": "Indexed After Commit",
+                "source-category": "citations/mcp",
+                "url": "https://example.com/indexed-after-commit",
+            },
+            "body": "Created through MCP for search index testing.",
+            "push": False,
+        },
+    )
+    assert created["ok"] is True
+    assert created["committed"] is True
+
+    after = _call_tool(server, "search_data", {"query": "Indexed After Commit", "fixed_strings": True})
+    assert after["ok"] is True
+    assert any(
+        match["path"] == "data/source/in/source@indexed-after-commit/index.md" for match in after["matches"]
+    )
+
+
 def test_read_only_query_tools_have_non_destructive_annotations(tmp_path: Path) -> None:
     project_root, data_root = _init_repo(tmp_path)
     server = mcp_server.create_mcp_server(project_root=project_root, data_root=data_root)
@@ -912,7 +1327,16 @@ def test_read_only_query_tools_have_non_destructive_annotations(tmp_path: Path)
     tools = asyncio.run(server.list_tools())
     tools_by_name = {tool.name: tool for tool in tools}
 
-    for name in ("list_data_files", "read_data_file", "search_data", "semantic_search_data"):
+    for name in (
+        "list_data_files",
+        "read_data_file",
+        "search_data",
+        "semantic_search_data",
+        "hybrid_search_data",
+        "traverse_graph",
+        "push_status",
+        "write_queue_status",
+    ):
         annotations = tools_by_name[name].annotations
         assert annotations is not None
         assert annotations.readOnlyHint is True
@@ -1000,6 +1424,61 @@ def test_semantic_search_data_tool_uses_test_repo_index(
     assert result["results"]
     assert result["results"][0]["data_path"].endswith("person/al/person@alice/index.md")
     assert result["index_path"] == ".build/semantic/index.json"
+    assert result["query_cache"]["hit"] is False
+
+    repeated = _call_tool(
+        server,
+        "semantic_search_data",
+        {
+            "query": "founder payments infra",
+            "limit": 3,
+            "index_path": ".build/semantic/index.json",
+        },
+    )
+    assert repeated["query_cache"]["hit"] is True
+    assert repeated["query_cache"]["hits"] == 1
+    assert repeated["results"] == result["results"]
+
+    hybrid = _call_tool(
+        server,
+        "hybrid_search_data",
+        {
+            "query": "graphics systems",
+            "limit": 2,
+            "index_path": ".build/semantic/index.json",
+        },
+    )
+    assert hybrid["ok"] is True
+    assert hybrid["results"][0]["data_path"].endswith("person/bo/person@bob/index.md")
+    assert hybrid["results"][0]["lexical_rank"] == 1
+
+    filtered = _call_tool(
+        server,
+        "semantic_search_data",
+        {
+            "query": "founder payments infra",
+            "index_path": ".build/semantic/index.json",
+            "path_prefix": "person/bo/",
+        },
+    )
+    assert filtered["ok"] is True
+    assert filtered["search_mode"] == "filtered"
+    assert [item["data_path"] for item in filtered["results"]] == ["person/bo/person@bob/index.md"]
+
+    invalid = _call_tool(
+        server,
+        "semantic_search_data",
+        {"query": "founder", "date_from": "last week"},
+    )
+    assert invalid["ok"] is False
+    assert invalid["error"]["code"] == "invalid_input"
+
+    invalid_month = _call_tool(
+        server,
+        "semantic_search_data",
+        {"query": "founder", "date_to": "2026-13"},
+    )
+    assert invalid_month["error"]["code"] == "invalid_input"
 
 
 def test_semantic_search_data_tool_returns_not_found_for_missing_index(tmp_path: Path) -> None:
@@ -1030,6 +1509,141 @@ def test_read_data_file_rejects_path_outside_data_root(tmp_path: Path) -> None:
     assert result["error"]["code"] == "invalid_input"
 
 
+def test_traverse_graph_walks_relations_with_filters_and_validity(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    project_root, data_root = _init_repo(tmp_path)
+    for rel_dir in (
+        "person/al/person@alice",
+        "person/bo/person@bob",
+        "person/ca/person@carol",
+        "org/ac/org@acme",
+        "source/te/source@test-source",
+    ):
+        index_path = data_root / rel_dir / "index.md"
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        index_path.write_text("---\n---\n\n# Entity\n", encoding="utf-8")
+
+    def write_edge(edge_id: str, relation: str, from_entity: str, to_entity: str, **extra: object) -> None:
+        edge_path = data_root / "edge" / edge_id[:2] / f"edge@{edge_id}.json"
+        edge_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "id": edge_id,
+            "relation": relation,
+            "directed": relation != "knows",
+            "from": from_entity,
+            "to": to_entity,
+            "first_noted_at": "2026-01-01",
+            "last_verified_at": "2026-01-01",
+            "valid_from": None,
+            "valid_to": None,
+            "sources": ["source/te/source@test-source"],
+            "notes": None,
+            "strength": 5 if relation == "knows" else None,
+            **extra,
+        }
+        edge_path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+    write_edge("kn-alice-bob", "knows", "person/al/person@alice", "person/bo/person@bob")
+    write_edge("wa-bob-acme", "works_at", "person/bo/person@bob", "org/ac/org@acme", valid_to="2023")
+    write_edge("wa-carol-acme", "works_at", "person/ca/person@carol", "org/ac/org@acme", valid_from="2024-02")
+    write_edge("ci-alice-source", "cites", "person/al/person@alice", "source/te/source@test-source")
+    server = mcp_server.create_mcp_server(project_root=project_root, data_root=data_root)
+
+    result = _call_tool(
+        server,
+        "traverse_graph",
+        {"start": "person/al/person@alice", "max_depth": 2, "relations": ["knows", "works_at"]},
+    )
+    assert result["ok"] is True
+    assert [(node["entity"], node["depth"], node["via_edge"]) for node in result["nodes"]] == [
+        ("person/bo/person@bob", 1, "kn-alice-bob"),
+        ("org/ac/org@acme", 2, "wa-bob-acme"),
+    ]
+    assert [edge["id"] for edge in result["edges"]] == ["kn-alice-bob", "wa-bob-acme"]
+    assert result["edges"][0]["path"] == "edge/kn/edge@kn-alice-bob.json"
+    assert result["truncated"] is False
+
+    current = _call_tool(
+        server,
+        "traverse_graph",
+        {"start": "org/ac/org@acme", "max_depth": 1, "direction": "in", "as_of": "2025-06-01"},
+    )
+    assert [node["entity"] for node in current["nodes"]] == ["person/ca/person@carol"]
+    past = _call_tool(
+        server,
+        "traverse_graph",
+        {"start": "org/ac/org@acme", "max_depth": 1, "direction": "in", "as_of": "2023-11"},
+    )
+    assert [node["entity"] for node in past["nodes"]] == ["person/bo/person@bob"]
+    outgoing = _call_tool(server, "traverse_graph", {"start": "org/ac/org@acme", "direction": "out"})
+    assert outgoing["nodes"] == []
+
+    limited = _call_tool(server, "traverse_graph", {"start": "person/al/person@alice", "max_depth": 3, "limit": 2})
+    assert limited["node_count"] == 2
+    assert limited["truncated"] is True
+
+    git_calls: list[list[str]] = []
+    real_run_git = mcp_server.run_git
+
+    def counting_run_git(root: Path, args: list[str], **kwargs: object) -> subprocess.CompletedProcess[str]:
+        git_calls.append(args)
+        return real_run_git(root, args, **kwargs)
+
+    monkeypatch.setattr(mcp_server, "run_git", counting_run_git)
+    _call_tool(server, "traverse_graph", {"start": "person/al/person@alice"})
+    assert git_calls == []
+
+    write_edge("kn-bob-carol", "knows", "person/bo/person@bob", "person/ca/person@carol")
+    unsynced = _call_tool(server, "traverse_graph", {"start": "person/bo/person@bob", "relations": ["knows"]})
+    assert [node["entity"] for node in unsynced["nodes"]] == ["person/al/person@alice"]
+    _run_git(project_root, "add", ".")
+    assert _run_git(project_root, "commit", "-m", "add edge").returncode == 0
+    committed = _call_tool(server, "traverse_graph", {"start": "person/bo/person@bob", "relations": ["knows"]})
+    assert [node["entity"] for node in committed["nodes"]] == ["person/al/person@alice", "person/ca/person@carol"]
+
+    missing = _call_tool(server, "traverse_graph", {"start": "person/no/person@nobody"})
+    assert missing["error"]["code"] == "not_found"
+    invalid = _call_tool(server, "traverse_graph", {"start": "alice"})
+    assert invalid["error"]["code"] == "invalid_input"
+
+
+def test_read_head_commit_follows_worktree_gitdir_and_unknown_head_syncs(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    project_root, _ = _init_repo(tmp_path)
+    _run_git(project_root, "branch", "feature")
+    _run_git(project_root, "pack-refs", "--all")
+    worktree = tmp_path / "worktree"
+    assert _run_git(project_root, "worktree", "add", str(worktree), "feature").returncode == 0
+    (worktree / "data").mkdir(exist_ok=True)
+    assert (worktree / ".git").is_file()
+
+    head = _run_git(worktree, "rev-parse", "HEAD").stdout.strip()
+    assert mcp_server.read_head_commit(worktree) == head
+    (worktree / "note.txt").write_text("worktree\n", encoding="utf-8")
+    _run_git(worktree, "add", "note.txt")
+    assert _run_git(worktree, "commit", "-m", "worktree commit").returncode == 0
+    assert mcp_server.read_head_commit(worktree) == _run_git(worktree, "rev-parse", "HEAD").stdout.strip()
+
+    graph = mcp_server.current_reference_graph(worktree, worktree / "data")
+    assert graph.head == mcp_server.read_head_commit(worktree)
+
+    monkeypatch.setattr(mcp_server, "read_head_commit", lambda _: None)
+    synced: list[Path] = []
+    real_sync = mcp_server.sync_reference_graph
+
+    def recording_sync(root: Path, data_root: Path, dirty_paths: set[str] | None = None) -> object:
+        synced.append(root)
+        return real_sync(root, data_root, dirty_paths)
+
+    monkeypatch.setattr(mcp_server, "sync_reference_graph", recording_sync)
+    assert mcp_server.current_reference_graph(worktree, worktree / "data") is graph
+    assert synced == [worktree]
+
+
 def test_streamable_http_oauth_discovery_alias_routes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     project_root, data_root = _init_repo(tmp_path)
     monkeypatch.setenv(mcp_server.OAUTH_MODE_ENV_VAR, "in-memory")
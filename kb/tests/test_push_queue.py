@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import subprocess
+import threading
+from pathlib import Path
+
+from kb import push_queue
+
+
+def _completed(returncode: int, stderr: str = "") -> subprocess.CompletedProcess[str]:
+    return subprocess.CompletedProcess(args=["git", "push"], returncode=returncode, stdout="", stderr=stderr)
+
+
+def test_push_queue_coalesces_commits_enqueued_during_a_push(tmp_path: Path) -> None:
+    queue = push_queue.PushQueue(project_root=tmp_path)
+    release_first = threading.Event()
+    first_started = threading.Event()
+    calls: list[int] = []
+
+    def fake_push() -> subprocess.CompletedProcess[str]:
+        calls.append(len(calls))
+        if len(calls) == 1:
+            first_started.set()
+            release_first.wait(timeout=5)
+        return _completed(0)
+
+    queue._push = fake_push  # type: ignore[method-assign]
+    queue.enqueue("c1")
+    assert first_started.wait(timeout=5)
+    for sha in ("c2", "c3", "c4"):
+        queue.enqueue(sha)
+    assert queue.status()["pending_commits"] == 4
+    assert queue.status()["in_flight"] is True
+    release_first.set()
+
+    assert queue.flush(timeout=5) is True
+    status = queue.status()
+    assert len(calls) == 2
+    assert status["pushes"] == 2
+    assert status["pushed_commits"] == 4
+    assert status["last_pushed_commit"] == "c4"
+    assert status["pending_commits"] == 0
+    assert status["lag_seconds"] == 0.0
+
+
+def test_push_queue_retries_failed_pushes_with_backoff(tmp_path: Path) -> None:
+    queue = push_queue.PushQueue(project_root=tmp_path, retry_initial_seconds=0.05, retry_max_seconds=0.1)
+    results = [_completed(1, "remote unreachable"), _completed(1, "remote unreachable"), _completed(0)]
+
+    def fake_push() -> subprocess.CompletedProcess[str]:
+        return results.pop(0)
+
+    queue._push = fake_push  # type: ignore[method-assign]
+    queue.enqueue("c1")
+    assert queue.flush(timeout=5) is True
+
+    status = queue.status()
+    assert results == []
+    assert status["last_error"] is None
+    assert status["consecutive_failures"] == 0
+    assert status["last_pushed_commit"] == "c1"
+
+
+def test_push_queue_reports_lag_while_push_keeps_failing(tmp_path: Path) -> None:
+    queue = push_queue.PushQueue(project_root=tmp_path, retry_initial_seconds=60)
+    queue._push = lambda: _completed(1, "rejected")  # type: ignore[method-assign]
+    queue.enqueue("c1")
+
+    assert queue.flush(timeout=0.2) is False
+    status = queue.status()
+    assert status["pending_commits"] == 1
+    assert status["last_error"] == "rejected"
+    assert status["consecutive_failures"] == 1
+    assert status["next_retry_at"] is not None
+    assert status["lag_seconds"] > 0
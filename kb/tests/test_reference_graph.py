@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import yaml
+
+from kb.reference_graph import ReferenceGraph
+
+
+def _write_markdown_with_frontmatter(path: Path, frontmatter: dict[str, object], body: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    frontmatter_block = yaml.safe_dump(frontmatter, sort_keys=False).strip()
+    path.write_text(f"---\n{frontmatter_block}\n---\n\n{body}", encoding="utf-8")
+
+
+def _write_tree(project_root: Path) -> Path:
+    data_root = project_root / "data"
+    _write_markdown_with_frontmatter(
+        data_root / "source/te/source@test-source/index.md",
+        {"id": "source@test-source", "citation-key": "test-source"},
+        "# Test Source\n",
+    )
+    _write_markdown_with_frontmatter(data_root / "org/ac/org@acme/index.md", {"org": "Acme"}, "# Acme\n")
+    _write_markdown_with_frontmatter(
+        data_root / "person/al/person@alice/index.md",
+        {"person": "Alice"},
+        "# Alice\n\nCited.[^test-source]\n",
+    )
+    (data_root / "person/al/person@alice/employment-history.jsonl").write_text(
+        json.dumps(
+            {
+                "id": "employment-001",
+                "period": "2020 - Present",
+                "organization": "Acme",
+                "role": "Founder",
+                "organization_ref": "org/ac/org@acme",
+                "source_path": "data/person/al/person@alice/index.md",
+                "source_section": "snapshot",
+                "source_row": 1,
+            }
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    edge_path = data_root / "edge/ci/edge@citation-org-acme-test-source.json"
+    edge_path.parent.mkdir(parents=True)
+    edge_path.write_text(
+        json.dumps(
+            {
+                "id": "citation-org-acme-test-source",
+                "relation": "cites",
+                "directed": True,
+                "from": "org/ac/org@acme",
+                "to": "source/te/source@test-source",
+                "first_noted_at": "2026-02-10",
+                "last_verified_at": "2026-02-10",
+                "sources": ["source/te/source@test-source"],
+            }
+        ),
+        encoding="utf-8",
+    )
+    return data_root
+
+
+def _rel(data_root: Path, paths: set[Path]) -> list[str]:
+    return sorted(path.relative_to(data_root).as_posix() for path in paths)
+
+
+def test_refresh_returns_dependents_of_changed_records(tmp_path: Path) -> None:
+    data_root = _write_tree(tmp_path)
+    graph = ReferenceGraph(project_root=tmp_path, data_root=data_root)
+    graph.build(head="abc")
+
+    assert graph.sources_by_citation_key == {"test-source": {"source/te/source@test-source"}}
+    assert _rel(data_root, graph.refresh([data_root / "source/te/source@test-source/index.md"])) == [
+        "edge/ci/edge@citation-org-acme-test-source.json",
+        "person/al/person@alice",
+        "source/te/source@test-source",
+    ]
+    assert _rel(data_root, graph.refresh([data_root / "org/ac/org@acme/index.md"])) == [
+        "edge/ci/edge@citation-org-acme-test-source.json",
+        "org/ac/org@acme",
+        "person/al/person@alice",
+    ]
+    assert _rel(data_root, graph.refresh([data_root / "edge/ci/edge@citation-org-acme-test-source.json"])) == [
+        "edge/ci/edge@citation-org-acme-test-source.json",
+        "org/ac/org@acme",
+        "source/te/source@test-source",
+    ]
+
+
+def test_refresh_tracks_removed_and_added_records(tmp_path: Path) -> None:
+    data_root = _write_tree(tmp_path)
+    graph = ReferenceGraph(project_root=tmp_path, data_root=data_root)
+    graph.build()
+
+    alice_index = data_root / "person/al/person@alice/index.md"
+    alice_index.write_text("---\nperson: Alice\n---\n\n# Alice\n", encoding="utf-8")
+    graph.refresh([alice_index])
+    source_index = data_root / "source/te/source@test-source/index.md"
+    source_index.unlink()
+    assert "person/al/person@alice" not in _rel(data_root, graph.refresh([source_index]))
+    assert graph.sources_by_citation_key == {}
+    assert "source/te/source@test-source" not in graph.entities
+
+    _write_markdown_with_frontmatter(data_root / "person/bo/person@bob/index.md", {"person": "Bob"}, "# Bob\n")
+    assert _rel(data_root, graph.refresh([data_root / "person/bo"])) == ["person/bo/person@bob"]
+    assert "person/bo/person@bob" in graph.entities
+
+
+def test_graph_exposes_versioned_sources_and_edge_adjacency(tmp_path: Path) -> None:
+    data_root = _write_tree(tmp_path)
+    graph = ReferenceGraph(project_root=tmp_path, data_root=data_root)
+    graph.build()
+    version = graph.version
+
+    edge_rel = "edge/ci/edge@citation-org-acme-test-source.json"
+    assert graph.edges_from("org/ac/org@acme") == [edge_rel]
+    assert graph.edges_to("source/te/source@test-source") == [edge_rel]
+    assert graph.edge_record(edge_rel).relation.value == "cites"
+    assert graph.source_records == {}
+
+    _write_markdown_with_frontmatter(
+        data_root / "source/te/source@test-source/index.md",
+        {
+            "id": "source@test-source",
+            "title": "Test Source",
+            "source-type": "website",
+            "citation-key": "test-source",
+            "source-path": "data/source/te/source@test-source/index.md",
+            "url": "https://example.com/source",
+            "retrieved-at": "2026-02-10",
+        },
+        "# Test Source\n",
+    )
+    graph.refresh([data_root / "source/te/source@test-source/index.md"])
+    assert graph.version == version + 1
+    assert graph.source_records["source/te/source@test-source"].citation_key == "test-source"
+
+    (data_root / edge_rel).unlink()
+    graph.refresh([data_root / edge_rel])
+    assert graph.edges_from("org/ac/org@acme") == []
+    assert graph.edge_record(edge_rel) is None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 import pytest
@@ -155,3 +156,569 @@ def test_search_rejects_model_mismatch(tmp_path: Path) -> None:
             embedding_backend=backend,
             limit=3,
         )
+
+
+def test_semantic_index_cache_reuses_payload_until_file_changes(tmp_path: Path) -> None:
+    project_root = tmp_path / "repo"
+    data_root = project_root / "data"
+    index_path = project_root / ".build" / "semantic" / "index.json"
+    backend = FakeEmbeddingBackend()
+
+    _write(data_root / "person" / "al" / "person@alice" / "index.md", "Alice payments infra")
+    semantic.build_semantic_index(
+        project_root=project_root,
+        data_root=data_root,
+        index_path=index_path,
+        embedding_backend=backend,
+        max_chars=140,
+        min_chars=1,
+        overlap_chars=0,
+    )
+
+    cache = semantic.SemanticIndexCache()
+    first = cache.load(index_path)
+    second = cache.load(index_path)
+    assert first is second
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    _write(data_root / "person" / "bo" / "person@bob" / "index.md", "Bob gaming founder")
+    semantic.build_semantic_index(
+        project_root=project_root,
+        data_root=data_root,
+        index_path=index_path,
+        embedding_backend=backend,
+        max_chars=140,
+        min_chars=1,
+        overlap_chars=0,
+    )
+    reloaded = cache.load(index_path)
+    assert reloaded is not first
+    assert reloaded["chunk_count"] == 2
+
+    index_path.unlink()
+    with pytest.raises(FileNotFoundError):
+        cache.load(index_path)
+
+
+def test_embedding_backend_pool_reuses_backend_per_model_and_cache_dir(tmp_path: Path) -> None:
+    created: list[tuple[str, Path | None]] = []
+
+    def factory(*, model_name: str, cache_dir: Path | None) -> semantic.EmbeddingBackend:
+        created.append((model_name, cache_dir))
+        return FakeEmbeddingBackend()
+
+    pool = semantic.EmbeddingBackendPool()
+    first = pool.get(model_name="fake-mini", cache_dir=tmp_path, factory=factory)
+    second = pool.get(model_name="fake-mini", cache_dir=tmp_path, factory=factory)
+    other = pool.get(model_name="fake-mini", cache_dir=tmp_path / "other", factory=factory)
+
+    assert first is second
+    assert other is not first
+    assert created == [("fake-mini", tmp_path), ("fake-mini", tmp_path / "other")]
+
+
+def _build_two_person_index(project_root: Path, backend: semantic.EmbeddingBackend) -> Path:
+    data_root = project_root / "data"
+    index_path = project_root / ".build" / "semantic" / "index.json"
+    _write(
+        data_root / "person" / "al" / "person@alice" / "index.md",
+        "Alice is a founder building payments infra products.",
+    )
+    _write(
+        data_root / "person" / "bo" / "person@bob" / "index.md",
+        "Bob develops gaming engines and graphics systems.",
+    )
+    semantic.build_semantic_index(
+        project_root=project_root,
+        data_root=data_root,
+        index_path=index_path,
+        embedding_backend=backend,
+        max_chars=140,
+        min_chars=1,
+        overlap_chars=0,
+    )
+    return index_path
+
+
+def test_build_writes_binary_vectors_and_chunk_sidecar(tmp_path: Path) -> None:
+    np = pytest.importorskip("numpy")
+    index_path = _build_two_person_index(tmp_path / "repo", FakeEmbeddingBackend())
+    vectors_path, chunks_path = semantic.semantic_index_sidecar_paths(index_path)
+
+    manifest = json.loads(index_path.read_text(encoding="utf-8"))
+    assert manifest["version"] == semantic.INDEX_VERSION
+    assert "chunks" not in manifest
+    assert manifest["vectors_file"] == vectors_path.name == "index.vectors.npy"
+    assert manifest["chunks_file"] == chunks_path.name == "index.chunks.jsonl"
+    assert len(chunks_path.read_text(encoding="utf-8").splitlines()) == 2
+
+    payload = semantic.load_semantic_index(index_path)
+    vectors = payload["vectors"]
+    assert isinstance(vectors, np.memmap)
+    assert vectors.dtype == np.float32
+    assert vectors.shape == (2, 5)
+    assert np.allclose(np.linalg.norm(vectors, axis=1), 1.0)
+    assert [chunk["data_path"] for chunk in payload["chunks"]] == [
+        "person/al/person@alice/index.md",
+        "person/bo/person@bob/index.md",
+    ]
+
+
+def test_legacy_json_index_is_still_searchable(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    backend = FakeEmbeddingBackend()
+    monkeypatch.setattr(semantic, "_optional_numpy", lambda: None)
+    index_path = _build_two_person_index(tmp_path / "repo", backend)
+    monkeypatch.undo()
+
+    manifest = json.loads(index_path.read_text(encoding="utf-8"))
+    assert manifest["version"] == semantic.LEGACY_INDEX_VERSION
+    assert all(isinstance(chunk["vector"], list) for chunk in manifest["chunks"])
+    assert not semantic.semantic_index_sidecar_paths(index_path)[0].exists()
+
+    payload = semantic.load_semantic_index(index_path)
+    search = semantic.search_semantic_index(
+        index_payload=payload,
+        query="founder for payments infra",
+        embedding_backend=backend,
+        limit=1,
+    )
+    assert search["results"][0]["data_path"] == "person/al/person@alice/index.md"
+
+
+def test_numpy_ranking_matches_pure_python_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("numpy")
+
+    class TableBackend(semantic.EmbeddingBackend):
+        backend_id = "fake"
+        model_name = "table"
+
+        def embed_texts(self, texts: list[str]) -> list[list[float]]:
+            return [[1.0, 0.5, 0.0] for _ in texts]
+
+    vectors = [
+        [0.0, 1.0, 0.0],
+        [1.0, 0.5, 0.1],
+        [0.0, 0.0, 0.0],
+        [2.0, 1.0, 0.0],
+        [0.3, 0.0, 1.0],
+        [1.0, 0.0, 0.0],
+    ]
+
+    def payload() -> dict[str, object]:
+        return {
+            "version": semantic.LEGACY_INDEX_VERSION,
+            "model": {"backend": "fake", "name": "table"},
+            "embedding_dim": 3,
+            "chunk_count": len(vectors),
+            "chunks": [
+                {"id": f"chunk-{row}", "data_path": f"row-{row}.md", "text": f"row {row}", "vector": vector}
+                for row, vector in enumerate(vectors)
+            ],
+        }
+
+    def search(index_payload: dict[str, object]) -> list[tuple[str, float]]:
+        result = semantic.search_semantic_index(
+            index_payload=index_payload,
+            query="anything",
+            embedding_backend=TableBackend(),
+            limit=3,
+            min_score=0.1,
+        )
+        return [(item["id"], round(item["score"], 5)) for item in result["results"]]
+
+    vectorized_payload = payload()
+    vectorized = search(vectorized_payload)
+    assert "vectors" in vectorized_payload
+
+    monkeypatch.setattr(semantic, "_optional_numpy", lambda: None)
+    fallback = search(payload())
+
+    assert vectorized == fallback
+    assert [item[0] for item in vectorized] == ["chunk-3", "chunk-1", "chunk-5"]
+
+
+class CountingEmbeddingBackend(FakeEmbeddingBackend):
+    def __init__(self) -> None:
+        self.embedded: list[str] = []
+
+    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        self.embedded.extend(texts)
+        return super().embed_texts(texts)
+
+
+def test_incremental_rebuild_only_embeds_changed_files(tmp_path: Path) -> None:
+    pytest.importorskip("numpy")
+    project_root = tmp_path / "repo"
+    data_root = project_root / "data"
+    index_path = project_root / ".build" / "semantic" / "index.json"
+    alice = data_root / "person" / "al" / "person@alice" / "index.md"
+    bob = data_root / "person" / "bo" / "person@bob" / "index.md"
+    carol = data_root / "person" / "ca" / "person@carol" / "index.md"
+    _write(alice, "Alice is a founder building payments infra products.")
+    _write(bob, "Bob develops gaming engines and graphics systems.")
+    _write(carol, "Carol invests in payments companies.")
+
+    def build(backend: semantic.EmbeddingBackend, **kwargs: object) -> dict[str, object]:
+        return semantic.build_semantic_index(
+            project_root=project_root,
+            data_root=data_root,
+            index_path=index_path,
+            embedding_backend=backend,
+            max_chars=140,
+            min_chars=1,
+            overlap_chars=0,
+            **kwargs,
+        )
+
+    first = build(CountingEmbeddingBackend())
+    assert first["incremental"] is False
+    assert first["embedded_chunk_count"] == 3
+
+    _write(alice, "Alice is now a gaming founder.")
+    carol.unlink()
+    backend = CountingEmbeddingBackend()
+    second = build(backend)
+
+    assert second["incremental"] is True
+    assert backend.embedded == ["Alice is now a gaming founder."]
+    assert second["reused_chunk_count"] == 1
+    assert second["files"] == {"added": 0, "changed": 1, "unchanged": 1, "removed": 1}
+
+    payload = semantic.load_semantic_index(index_path)
+    assert [chunk["data_path"] for chunk in payload["chunks"]] == [
+        "person/al/person@alice/index.md",
+        "person/bo/person@bob/index.md",
+    ]
+    search = semantic.search_semantic_index(
+        index_payload=payload,
+        query="gaming",
+        embedding_backend=backend,
+        limit=2,
+    )
+    assert search["results"][0]["data_path"] == "person/bo/person@bob/index.md"
+    assert search["results"][1]["data_path"] == "person/al/person@alice/index.md"
+    assert search["results"][1]["score"] > 0.0
+
+    full = build(CountingEmbeddingBackend(), incremental=False)
+    assert full["embedded_chunk_count"] == 2
+
+    rechunked = semantic.build_semantic_index(
+        project_root=project_root,
+        data_root=data_root,
+        index_path=index_path,
+        embedding_backend=CountingEmbeddingBackend(),
+        max_chars=100,
+        min_chars=1,
+        overlap_chars=0,
+    )
+    assert rechunked["incremental"] is False
+    assert rechunked["embedded_chunk_count"] == 2
+
+
+def test_build_streams_embeddings_in_batches_and_reports_throughput(tmp_path: Path) -> None:
+    pytest.importorskip("numpy")
+    project_root = tmp_path / "repo"
+    data_root = project_root / "data"
+    index_path = project_root / ".build" / "semantic" / "index.json"
+    for slug in ("alice", "bob", "carol", "dave", "erin"):
+        _write(data_root / "person" / slug[:2] / f"person@{slug}" / "index.md", f"{slug} payments founder")
+
+    class BatchRecordingBackend(FakeEmbeddingBackend):
+        def __init__(self) -> None:
+            self.batch_sizes: list[int] = []
+
+        def embed_texts(self, texts: list[str]) -> list[list[float]]:
+            self.batch_sizes.append(len(texts))
+            return super().embed_texts(texts)
+
+    backend = BatchRecordingBackend()
+    progress: list[tuple[int, int]] = []
+    result = semantic.build_semantic_index(
+        project_root=project_root,
+        data_root=data_root,
+        index_path=index_path,
+        embedding_backend=backend,
+        max_chars=140,
+        min_chars=1,
+        overlap_chars=0,
+        batch_size=2,
+        progress=lambda done, total: progress.append((done, total)),
+    )
+
+    assert backend.batch_sizes == [2, 2, 1]
+    assert progress == [(2, 5), (4, 5), (5, 5)]
+    assert result["embedded_chunk_count"] == 5
+    assert result["chunks_per_second"] > 0
+    assert not index_path.with_name("index.vectors.npy.tmp").exists()
+    assert semantic.load_semantic_index(index_path)["vectors"].shape == (5, 5)
+
+
+def test_fastembed_backend_streams_model_batches_without_float_loops() -> None:
+    np = pytest.importorskip("numpy")
+
+    class FakeModel:
+        def __init__(self) -> None:
+            self.calls: list[tuple[int, int | None]] = []
+
+        def embed(self, texts: list[str], *, batch_size: int, parallel: int | None):
+            self.calls.append((batch_size, parallel))
+            for index, _ in enumerate(texts):
+                yield np.asarray([float(index), 1.0], dtype=np.float32)
+
+    backend = semantic.FastEmbedBackend(model_name="fake", batch_size=4, parallel=0)
+    model = FakeModel()
+    backend._model = model
+
+    batches = list(backend.embed_batches(["a", "b", "c"], batch_size=2))
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert backend.embed_texts(["a", "b"]) == [[0.0, 1.0], [1.0, 1.0]]
+    assert model.calls == [(2, 0), (4, 0)]
+
+
+def test_ann_index_is_built_on_request_and_matches_exact_search(tmp_path: Path) -> None:
+    pytest.importorskip("numpy")
+    project_root = tmp_path / "repo"
+    data_root = project_root / "data"
+    index_path = project_root / ".build" / "semantic" / "index.json"
+    topics = ["alice", "payments", "infra", "gaming", "founder"]
+    for index in range(40):
+        words = " ".join(topics[(index + offset) % len(topics)] for offset in range(index % 3 + 1))
+        _write(data_root / "note" / f"n{index:02d}" / "index.md", f"{words} note {index}")
+
+    backend = FakeEmbeddingBackend()
+
+    def build(**kwargs: object) -> dict[str, object]:
+        return semantic.build_semantic_index(
+            project_root=project_root,
+            data_root=data_root,
+            index_path=index_path,
+            embedding_backend=backend,
+            max_chars=140,
+            min_chars=1,
+            overlap_chars=0,
+            **kwargs,
+        )
+
+    result = build(ann=True)
+    assert result["ann"]["type"] == "ivf"
+    assert semantic.semantic_ann_path(index_path).exists()
+
+    payload = semantic.load_semantic_index(index_path)
+    assert "ann_index" in payload
+    n_lists = result["ann"]["n_lists"]
+
+    def search(**kwargs: object) -> dict[str, object]:
+        return semantic.search_semantic_index(
+            index_payload=payload,
+            query="payments founder",
+            embedding_backend=backend,
+            limit=5,
+            **kwargs,
+        )
+
+    exact = search(exact=True)
+    approximate = search(n_probe=n_lists)
+    assert exact["search_mode"] == "exact"
+    assert approximate["search_mode"] == "ann"
+    assert [item["id"] for item in approximate["results"]] == [item["id"] for item in exact["results"]]
+
+    benchmark = semantic.benchmark_semantic_index(payload, query_count=10, limit=5, n_probe=n_lists)
+    assert benchmark["recall_at_k"] == 1.0
+    assert benchmark["ann_latency_ms"] is not None
+
+    rebuilt = build()
+    assert rebuilt["ann"] is None
+    assert not semantic.semantic_ann_path(index_path).exists()
+    assert "ann_index" not in semantic.load_semantic_index(index_path)
+
+
+def test_query_embedding_cache_skips_inference_for_repeated_queries(tmp_path: Path) -> None:
+    index_path = _build_two_person_index(tmp_path / "repo", FakeEmbeddingBackend())
+    payload = semantic.load_semantic_index(index_path)
+    backend = CountingEmbeddingBackend()
+    persist_path = tmp_path / "repo" / ".build" / "semantic" / "query-cache.jsonl"
+    cache = semantic.QueryEmbeddingCache(max_entries=2, persist_path=persist_path)
+
+    def search(query: str) -> dict[str, object]:
+        return semantic.search_semantic_index(
+            index_payload=payload,
+            query=query,
+            embedding_backend=backend,
+            limit=1,
+            query_cache=cache,
+        )
+
+    first = search("founder payments")
+    second = search("  founder   payments ")
+    assert first["query_cache"]["hit"] is False
+    assert second["query_cache"] == {"hit": True, "hits": 1, "misses": 1, "size": 1, "max_entries": 2}
+    assert backend.embedded == ["founder payments"]
+    assert second["results"] == first["results"]
+
+    search("gaming")
+    search("infra")
+    assert len(cache) == 2
+    assert search("founder payments")["query_cache"]["hit"] is False
+
+    reloaded = semantic.QueryEmbeddingCache(max_entries=2, persist_path=persist_path)
+    reloaded_backend = CountingEmbeddingBackend()
+    vector, hit = reloaded.embed(reloaded_backend, "infra")
+    assert hit is True
+    assert reloaded_backend.embedded == []
+    assert vector == FakeEmbeddingBackend().embed_texts(["infra"])[0]
+
+
+def test_query_cache_does_not_change_the_embedded_query_text(tmp_path: Path) -> None:
+    index_path = _build_two_person_index(tmp_path / "repo", FakeEmbeddingBackend())
+    payload = semantic.load_semantic_index(index_path)
+    query = "  founder \n\n payments  "
+
+    def search(backend: CountingEmbeddingBackend, cache: semantic.QueryEmbeddingCache | None) -> dict:
+        return semantic.search_semantic_index(
+            index_payload=payload,
+            query=query,
+            embedding_backend=backend,
+            limit=2,
+            query_cache=cache,
+        )
+
+    uncached_backend = CountingEmbeddingBackend()
+    cached_backend = CountingEmbeddingBackend()
+    uncached = search(uncached_backend, None)
+    cached = search(cached_backend, semantic.QueryEmbeddingCache(max_entries=2))
+    assert uncached_backend.embedded == cached_backend.embedded == ["founder payments"]
+    assert [item["score"] for item in cached["results"]] == [item["score"] for item in uncached["results"]]
+
+
+def test_hybrid_search_fuses_lexical_matches_missing_from_embeddings(tmp_path: Path) -> None:
+    index_path = _build_two_person_index(tmp_path / "repo", FakeEmbeddingBackend())
+    manifest = json.loads(index_path.read_text(encoding="utf-8"))
+    assert manifest["lexical"]["file"] == semantic.semantic_lexical_path(index_path).name
+    assert semantic.semantic_lexical_path(index_path).exists()
+
+    payload = semantic.load_semantic_index(index_path)
+    result = semantic.hybrid_search_index(
+        index_payload=payload,
+        query="founder graphics",
+        embedding_backend=FakeEmbeddingBackend(),
+        limit=2,
+    )
+
+    assert result["search_mode"] == "hybrid-exact"
+    assert result["fusion"]["method"] == "rrf"
+    by_path = {item["data_path"]: item for item in result["results"]}
+    alice = by_path["person/al/person@alice/index.md"]
+    bob = by_path["person/bo/person@bob/index.md"]
+    assert alice["semantic_rank"] == 1
+    assert bob["lexical_rank"] is not None
+    assert bob["lexical_score"] > 0
+    assert [item["rank"] for item in result["results"]] == [1, 2]
+
+
+def test_hybrid_search_requires_lexical_index(tmp_path: Path) -> None:
+    index_path = _build_two_person_index(tmp_path / "repo", FakeEmbeddingBackend())
+    payload = semantic.load_semantic_index(index_path)
+    payload.pop("lexical_index")
+
+    with pytest.raises(ValueError, match="lexical index"):
+        semantic.hybrid_search_index(
+            index_payload=payload,
+            query="alice",
+            embedding_backend=FakeEmbeddingBackend(),
+        )
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_filtered_search_only_scores_matching_metadata(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    use_numpy: bool,
+) -> None:
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(semantic, "_optional_numpy", lambda: None)
+    project_root = tmp_path / "repo"
+    data_root = project_root / "data"
+    _write(
+        data_root / "person" / "al" / "person@alice" / "index.md",
+        "---\nperson: Alice\nupdated-at: 2026-01-10\n---\n\nAlice is a payments founder.\n",
+    )
+    _write(
+        data_root / "org" / "ac" / "org@acme" / "index.md",
+        "---\norg: Acme\nupdated-at: 2026-03-01\n---\n\nAcme payments founder infra company.\n",
+    )
+    _write(
+        data_root / "source" / "ac" / "source@acme-news" / "index.md",
+        (
+            "---\nid: source@acme-news\nsource-type: website\nretrieved-at: '2026-02-20'\n---\n\n"
+            "Acme founder payments infra announcement.\n"
+        ),
+    )
+    index_path = project_root / ".build" / "semantic" / "index.json"
+    semantic.build_semantic_index(
+        project_root=project_root,
+        data_root=data_root,
+        index_path=index_path,
+        embedding_backend=FakeEmbeddingBackend(),
+        max_chars=256,
+        min_chars=1,
+        overlap_chars=0,
+    )
+    payload = semantic.load_semantic_index(index_path)
+    assert payload["chunks"][0]["metadata"] == {
+        "kind": "org",
+        "entity": "org@acme",
+        "source_type": None,
+        "dates": {"updated-at": "2026-03-01"},
+    }
+
+    def search(semantic_filter: semantic.SemanticFilter) -> dict:
+        return semantic.search_semantic_index(
+            index_payload=payload,
+            query="founder payments infra",
+            embedding_backend=FakeEmbeddingBackend(),
+            limit=5,
+            semantic_filter=semantic_filter,
+        )
+
+    unfiltered = search(semantic.SemanticFilter())
+    assert unfiltered["search_mode"] == "exact"
+    assert "filter" not in unfiltered
+    assert len(unfiltered["results"]) == 3
+
+    people = search(semantic.SemanticFilter(kinds=("person",)))
+    assert people["search_mode"] == "filtered"
+    assert people["filter"] == {"kinds": ["person"]}
+    assert [item["metadata"]["entity"] for item in people["results"]] == ["person@alice"]
+
+    sources = search(semantic.SemanticFilter(source_type="website", path_prefix="source/"))
+    assert [item["data_path"] for item in sources["results"]] == ["source/ac/source@acme-news/index.md"]
+
+    recent = search(semantic.SemanticFilter(date_from="2026-02-01", date_to="2026-12-31"))
+    assert [item["metadata"]["entity"] for item in recent["results"]] == ["org@acme"]
+
+    retrieved = search(semantic.SemanticFilter(date_field="retrieved-at", date_to="2026-02-20"))
+    assert [item["metadata"]["entity"] for item in retrieved["results"]] == ["source@acme-news"]
+
+    assert search(semantic.SemanticFilter(entity="person@nobody"))["results"] == []
+
+    march = search(semantic.SemanticFilter(date_from="2026-03", date_to="2026-03"))
+    assert [item["metadata"]["entity"] for item in march["results"]] == ["org@acme"]
+    assert len(search(semantic.SemanticFilter(date_to="2026"))["results"]) == 2
+
+    with pytest.raises(ValueError, match="invalid date_to"):
+        semantic.SemanticFilter(date_to="last week")
+
+
+def test_metadata_index_matches_path_prefix_on_segments() -> None:
+    chunks = [
+        {"data_path": path, "metadata": {"kind": None, "entity": None, "source_type": None, "dates": {}}}
+        for path in ("person/al/person@alice/index.md", "personal-notes/todo.md", "person", "person2/x.md")
+    ]
+    metadata_index = semantic.SemanticMetadataIndex(chunks)
+
+    for prefix in ("person", "person/", "/person"):
+        assert metadata_index.rows(semantic.SemanticFilter(path_prefix=prefix)) == [0, 2]
+    assert metadata_index.rows(semantic.SemanticFilter(path_prefix="person/al")) == [0]
+    assert metadata_index.rows(semantic.SemanticFilter(path_prefix="pers")) == []
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+
+import pytest
+
+from kb import text_index
+
+
+def _write(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def _build_index(tmp_path: Path) -> text_index.DataTextIndex:
+    project_root = tmp_path / "repo"
+    data_root = project_root / "data"
+    _write(data_root / "person" / "al" / "person@alice" / "index.md", "# Alice\n\nFounder of Acme Payments.\n")
+    _write(
+        data_root / "person" / "al" / "person@alice" / "employment-history.jsonl",
+        '{"organization": "Acme Payments", "role": "CEO"}\n',
+    )
+    _write(data_root / "org" / "ac" / "org@acme" / "index.md", "# Acme\n\nPayments infra.\nacme payments again\n")
+    _write(data_root / "org" / "ac" / "org@acme" / "logo.png", "acme payments")
+    return text_index.DataTextIndex(project_root=project_root, data_root=data_root)
+
+
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [
+        ("Acme Payments", ["Acme Payments"]),
+        ("foo.*bar", ["foo", "bar"]),
+        ("colou?r", ["colo", "r"]),
+        (r"ab{2,3}cd", ["a", "b", "cd"]),
+        (r"person@[a-z]+", ["person@"]),
+        (r"\.md$", [".md"]),
+        ("(x|y)hello", ["hello"]),
+        ("alice|bob", []),
+        (r"\d+ Acme", [" Acme"]),
+        (r"\x41bc", ["Abc"]),
+        (r"a\x20b", ["a b"]),
+        (r"\101BC", ["ABC"]),
+        (r"\u0041cme", ["Acme"]),
+        (r"\U00000041cme", ["Acme"]),
+        (r"\N{LATIN CAPITAL LETTER A}cme", ["Acme"]),
+        (r"Acme\tPayments", ["Acme\tPayments"]),
+        ("[]x]yz", ["yz"]),
+        ("[^]x]yz", ["yz"]),
+        ("(?ix)foo bar", ["foobar"]),
+        ("(?x)foo bar", ["foobar"]),
+        ("(?i)caf\u00e9", []),
+        ("(?i)Kelvin", ["elv", "n"]),
+        ("(?-i:Acme) Payments", ["Acme", " Payments"]),
+    ],
+)
+def test_required_regex_literals(pattern: str, expected: list[str]) -> None:
+    assert text_index.required_regex_literals(pattern) == expected
+
+
+def test_required_regex_literals_respects_ignorecase_flag() -> None:
+    assert text_index.required_regex_literals("Acme Payments", re.IGNORECASE) == ["Acme Payment"]
+    assert text_index.required_regex_literals("caf\u00e9", re.IGNORECASE) == []
+    assert text_index.required_regex_literals("caf\u00e9") == ["caf\u00e9"]
+
+
+def test_regex_search_keeps_matches_the_old_prefilter_dropped(tmp_path: Path) -> None:
+    index = _build_index(tmp_path)
+    _write(index.data_root / "note" / "no" / "note@misc" / "index.md", "xyz\nfoobar\nCaf\u00c9 Acme\n")
+
+    for query, text in (("[]x]yz", "xyz"), ("(?ix)foo bar", "foobar"), ("caf\u00e9", "Caf\u00c9")):
+        result = index.search(query=query)
+        assert [match["submatches"][0]["text"] for match in result["matches"]] == [text], query
+
+
+def test_fixed_string_search_matches_case_insensitively_with_line_positions(tmp_path: Path) -> None:
+    index = _build_index(tmp_path)
+
+    result = index.search(query="acme payments", fixed_strings=True)
+
+    assert result["engine"] == "memory-index"
+    assert result["truncated"] is False
+    assert [(match["path"], match["line_number"]) for match in result["matches"]] == [
+        ("data/org/ac/org@acme/index.md", 4),
+        ("data/person/al/person@alice/employment-history.jsonl", 1),
+        ("data/person/al/person@alice/index.md", 3),
+    ]
+    assert result["matches"][2]["submatches"] == [{"start": 11, "end": 24, "text": "Acme Payments"}]
+    assert result["summary"]["indexed_files"] == 3
+
+    sensitive = index.search(query="acme payments", fixed_strings=True, case_sensitive=True)
+    assert [match["path"] for match in sensitive["matches"]] == ["data/org/ac/org@acme/index.md"]
+
+
+def test_search_applies_globs_and_stops_at_max_results(tmp_path: Path) -> None:
+    index = _build_index(tmp_path)
+
+    only_jsonl = index.search(query="Payments", fixed_strings=True, file_glob="*.jsonl")
+    assert [match["path"] for match in only_jsonl["matches"]] == [
+        "data/person/al/person@alice/employment-history.jsonl"
+    ]
+
+    limited = index.search(query=r"payments\b", max_results=2)
+    assert len(limited["matches"]) == 2
+    assert limited["truncated"] is True
+    assert limited["match_count"] == 3
+
+
+def test_regex_search_narrows_candidates_by_trigrams(tmp_path: Path) -> None:
+    index = _build_index(tmp_path)
+
+    result = index.search(query=r"Founder\s+of")
+    assert result["summary"]["candidate_files"] == 1
+    assert result["matches"][0]["submatches"][0]["text"] == "Founder of"
+
+    with pytest.raises(ValueError, match="invalid regex"):
+        index.search(query="(unclosed")
+
+    escaped = index.search(query=r"\x41cme Payments", case_sensitive=True)
+    assert escaped["summary"]["candidate_files"] == 3
+    assert [match["path"] for match in escaped["matches"]] == [
+        "data/person/al/person@alice/employment-history.jsonl",
+        "data/person/al/person@alice/index.md",
+    ]
+
+
+def test_refresh_paths_updates_changed_and_removed_files(tmp_path: Path) -> None:
+    index = _build_index(tmp_path)
+    assert index.search(query="Globex", fixed_strings=True)["matches"] == []
+
+    alice = index.data_root / "person" / "al" / "person@alice" / "index.md"
+    alice.write_text("# Alice\n\nNow at Globex.\n", encoding="utf-8")
+    stat = alice.stat()
+    os.utime(alice, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    acme = index.data_root / "org" / "ac" / "org@acme" / "index.md"
+    acme.unlink()
+    index.refresh_paths(["data/person/al/person@alice/index.md", "data/org/ac/org@acme/index.md"])
+
+    assert [match["path"] for match in index.search(query="globex", fixed_strings=True)["matches"]] == [
+        "data/person/al/person@alice/index.md"
+    ]
+    assert [match["path"] for match in index.search(query="payments infra", fixed_strings=True)["matches"]] == []
+    assert len(index) == 2
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import yaml
+
+from kb import validate
+from kb.edges import sync_edge_backlinks
+
+
+def _write_markdown_with_frontmatter(path: Path, frontmatter: dict[str, object], body: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    frontmatter_block = yaml.safe_dump(frontmatter, sort_keys=False).strip()
+    path.write_text(f"---\n{frontmatter_block}\n---\n\n{body}", encoding="utf-8")
+
+
+def _write_valid_tree(project_root: Path) -> Path:
+    data_root = project_root / "data"
+    _write_markdown_with_frontmatter(
+        data_root / "source/te/source@test-source/index.md",
+        {
+            "id": "source@test-source",
+            "title": "Test Source",
+            "source-type": "website",
+            "citation-key": "test-source",
+            "source-path": "data/source/te/source@test-source/index.md",
+            "url": "https://example.com/source",
+            "retrieved-at": "2026-02-10",
+        },
+        "# Test Source\n",
+    )
+    (data_root / "source/te/source@test-source/edges").mkdir(parents=True)
+    org_dir = data_root / "org/ac/org@acme"
+    _write_markdown_with_frontmatter(org_dir / "index.md", {"org": "Acme"}, "# Acme\n\nCited.[^test-source]\n")
+    (org_dir / "edges").mkdir()
+    (org_dir / "changelog.jsonl").write_text("", encoding="utf-8")
+
+    edge_path = data_root / "edge/ci/edge@citation-org-acme-test-source.json"
+    edge_path.parent.mkdir(parents=True)
+    edge_path.write_text(
+        json.dumps(
+            {
+                "id": "citation-org-acme-test-source",
+                "relation": "cites",
+                "directed": True,
+                "from": "org/ac/org@acme",
+                "to": "source/te/source@test-source",
+                "first_noted_at": "2026-02-10",
+                "last_verified_at": "2026-02-10",
+                "sources": ["source/te/source@test-source"],
+            }
+        ),
+        encoding="utf-8",
+    )
+    sync_edge_backlinks(project_root=project_root, data_root=data_root)
+    return data_root
+
+
+def _age_files(root: Path) -> None:
+    past = 1_600_000_000_000_000_000
+    for path in root.rglob("*"):
+        if path.is_file() and not path.is_symlink():
+            os.utime(path, ns=(past, past))
+
+
+def _validate(project_root: Path, data_root: Path, cache_path: Path | None) -> dict:
+    return validate.run_validation(
+        project_root=project_root,
+        data_root=data_root,
+        scope_paths=None,
+        scope_label="full",
+        cache_path=cache_path,
+    )
+
+
+def test_validation_cache_reuses_unchanged_files_and_reparses_edits(tmp_path: Path) -> None:
+    data_root = _write_valid_tree(tmp_path)
+    _age_files(data_root)
+    cache_path = tmp_path / validate.DEFAULT_VALIDATION_CACHE_PATH
+
+    first = _validate(tmp_path, data_root, cache_path)
+    assert first["ok"] is True
+    assert first["cache"]["hits"] == 0
+    assert first["cache"]["misses"] == first["cache"]["entries"] > 0
+
+    second = _validate(tmp_path, data_root, cache_path)
+    assert second["ok"] is True
+    assert second["cache"]["misses"] == 0
+    assert {key: value for key, value in second.items() if key != "cache"} == {
+        key: value for key, value in first.items() if key != "cache"
+    }
+
+    source_index = data_root / "source/te/source@test-source/index.md"
+    source_index.write_text(
+        source_index.read_text(encoding="utf-8").replace("citation-key: test-source", "citation-key: renamed"),
+        encoding="utf-8",
+    )
+    third = _validate(tmp_path, data_root, cache_path)
+    assert third["cache"]["misses"] == 2
+    assert third["ok"] is False
+    assert [error["code"] for error in third["errors"]] == ["unresolved_citation"]
+    assert third == {**_validate(tmp_path, data_root, None), "cache": third["cache"]}
+
+
+def test_validation_cache_replays_cached_file_issues(tmp_path: Path) -> None:
+    data_root = _write_valid_tree(tmp_path)
+    (data_root / "org/ac/org@acme/changelog.jsonl").write_text("{not json}\n", encoding="utf-8")
+    _age_files(data_root)
+    cache_path = tmp_path / "cache.json"
+
+    uncached = _validate(tmp_path, data_root, None)
+    first = _validate(tmp_path, data_root, cache_path)
+    second = _validate(tmp_path, data_root, cache_path)
+
+    assert uncached["errors"][0]["code"] == "invalid_jsonl"
+    assert first["errors"] == second["errors"] == uncached["errors"]
+    assert second["cache"]["misses"] == 0
+
+
+def test_validation_cache_is_discarded_when_validator_changes(tmp_path: Path) -> None:
+    data_root = _write_valid_tree(tmp_path)
+    cache_path = tmp_path / "cache.json"
+    _validate(tmp_path, data_root, cache_path)
+
+    payload = json.loads(cache_path.read_text(encoding="utf-8"))
+    payload["fingerprint"] = "stale"
+    cache_path.write_text(json.dumps(payload), encoding="utf-8")
+
+    result = _validate(tmp_path, data_root, cache_path)
+    assert result["cache"]["hits"] == 0
+    assert json.loads(cache_path.read_text(encoding="utf-8"))["fingerprint"] == validate.validator_fingerprint()
+
+
+def test_parallel_validation_matches_sequential_results(tmp_path: Path) -> None:
+    data_root = _write_valid_tree(tmp_path)
+    (data_root / "org/ac/org@acme/changelog.jsonl").write_text("{not json}\n", encoding="utf-8")
+    (data_root / "edge/ci/edge@broken.json").write_text('{"id": "broken"}', encoding="utf-8")
+
+    sequential = _validate(tmp_path, data_root, None)
+    parallel = validate.run_validation(
+        project_root=tmp_path,
+        data_root=data_root,
+        scope_paths=None,
+        scope_label="full",
+        jobs=2,
+    )
+
+    assert sequential["ok"] is False
+    assert {error["code"] for error in sequential["errors"]} >= {"invalid_jsonl", "schema_error"}
+    assert parallel == sequential
+
+
+def test_jsonl_files_are_read_once_per_validation(tmp_path: Path, monkeypatch) -> None:
+    data_root = _write_valid_tree(tmp_path)
+    changelog_path = data_root / "org/ac/org@acme/changelog.jsonl"
+    changelog_path.write_text(
+        json.dumps({"date": "2026-02-10", "note": "Updated from source.[^test-source]"}) + "\n" + "{broken\n",
+        encoding="utf-8",
+    )
+
+    opened: list[Path] = []
+    original_open = Path.open
+
+    def tracking_open(self: Path, *args, **kwargs):
+        if self.suffix == ".jsonl":
+            opened.append(self)
+        return original_open(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "open", tracking_open)
+    result = _validate(tmp_path, data_root, None)
+
+    assert opened == [changelog_path]
+    assert [(error["code"], error.get("line")) for error in result["errors"]] == [("invalid_jsonl", 2)]
+
+
+def test_scope_index_matches_entities_edges_and_sources_by_path_prefix(tmp_path: Path) -> None:
+    data_root = _write_valid_tree(tmp_path)
+    entities = validate.gather_entities(data_root)
+    sources = validate.gather_source_files(data_root)
+    edge_files = validate.gather_edge_files(data_root)
+    org = entities["org/ac/org@acme"]
+    source_file = sources["source/te/source@test-source"]
+    (edge_file,) = edge_files
+
+    scope = validate.ScopeIndex(
+        {
+            org.directory / "changelog.jsonl",
+            data_root / "edge/ci",
+            data_root / "source",
+        }
+    )
+
+    assert validate.is_entity_in_scope(org, scope)
+    assert validate.is_edge_in_scope(edge_file, scope)
+    assert validate.is_source_in_scope(source_file, scope)
+    assert not validate.is_entity_in_scope(org, validate.ScopeIndex({data_root / "person"}))
+    assert validate.is_entity_in_scope(org, validate.ScopeIndex({data_root}))
+    assert not validate.is_entity_in_scope(org, set())
+    assert not validate.is_edge_in_scope(edge_file, validate.ScopeIndex({data_root / "edge/ci/edge@other.json"}))
+
+    assert scope.dependents(entities=entities, sources=sources, edge_files=edge_files) == {
+        org.directory / "changelog.jsonl": ["org/ac/org@acme"],
+        data_root / "edge/ci": [edge_file.rel_path],
+        data_root / "source": ["source/te/source@test-source"],
+    }
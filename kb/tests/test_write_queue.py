@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import fcntl
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from kb import write_queue
+
+
+def test_fair_write_queue_serves_waiters_in_arrival_order(tmp_path: Path) -> None:
+    queue = write_queue.FairWriteQueue(lock_path=tmp_path / ".kb-write.lock")
+    order: list[int] = []
+    threads: list[threading.Thread] = []
+
+    def writer(index: int) -> None:
+        with queue.acquire(timeout=5):
+            order.append(index)
+            time.sleep(0.01)
+
+    with queue.acquire(timeout=5):
+        for index in range(5):
+            thread = threading.Thread(target=writer, args=(index,))
+            thread.start()
+            threads.append(thread)
+            deadline = time.monotonic() + 5
+            while queue.status()["queue_depth"] < index + 2 and time.monotonic() < deadline:
+                time.sleep(0.001)
+        assert queue.status()["queue_depth"] == 6
+
+    for thread in threads:
+        thread.join(timeout=5)
+
+    status = queue.status()
+    assert order == [0, 1, 2, 3, 4]
+    assert status["queue_depth"] == 0
+    assert status["max_queue_depth"] == 6
+    assert status["acquisitions"] == 6
+    assert status["timeouts"] == 0
+
+
+def test_fair_write_queue_times_out_and_skips_abandoned_tickets(tmp_path: Path) -> None:
+    queue = write_queue.FairWriteQueue(lock_path=tmp_path / ".kb-write.lock")
+    with queue.acquire(timeout=5):
+        with pytest.raises(write_queue.WriteQueueTimeout):
+            with queue.acquire(timeout=0.05):
+                pass
+        assert queue.status()["queue_depth"] == 1
+
+    with queue.acquire(timeout=0.5):
+        pass
+    status = queue.status()
+    assert status["timeouts"] == 1
+    assert status["acquisitions"] == 2
+    assert status["queue_depth"] == 0
+
+
+def test_fair_write_queue_waits_for_file_lock_held_by_another_process(tmp_path: Path) -> None:
+    lock_path = tmp_path / ".kb-write.lock"
+    queue = write_queue.FairWriteQueue(lock_path=lock_path)
+    holder = lock_path.open("w", encoding="utf-8")
+    fcntl.flock(holder.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    try:
+        with pytest.raises(write_queue.WriteQueueTimeout):
+            with queue.acquire(timeout=0.05):
+                pass
+
+        release = threading.Timer(0.1, lambda: fcntl.flock(holder.fileno(), fcntl.LOCK_UN))
+        release.start()
+        with queue.acquire(timeout=5):
+            assert queue.status()["queue_depth"] == 1
+        release.join()
+    finally:
+        holder.close()
+
+    assert queue.status()["queue_depth"] == 0
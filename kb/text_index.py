@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import fnmatch
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from re import _constants as re_constants
+from re import _parser as re_parser
+from typing import Any, Iterable
+
+TEXT_FILE_SUFFIXES = {".md", ".json", ".jsonl", ".txt", ".yaml", ".yml", ".csv"}
+DEFAULT_RESCAN_SECONDS = 30.0
+NGRAM_SIZE = 3
+REGEX_REPEATS = {re_constants.MAX_REPEAT, re_constants.MIN_REPEAT, re_constants.POSSESSIVE_REPEAT}
+# ASCII letters that IGNORECASE also matches against non-ASCII characters (K, ſ, İ, ı).
+IGNORECASE_FOLDED_LITERALS = set("iks")
+
+
+@dataclass(frozen=True)
+class IndexedTextFile:
+    rel_from_data: str
+    rel_from_project: str
+    fingerprint: tuple[int, int]
+    lines: tuple[str, ...]
+    lowered_lines: tuple[str, ...]
+    ngrams: frozenset[str]
+
+
+def text_ngrams(text: str) -> set[str]:
+    return {text[index : index + NGRAM_SIZE] for index in range(len(text) - NGRAM_SIZE + 1)}
+
+
+def required_regex_literals(pattern: str, flags: int = 0) -> list[str]:
+    try:
+        parsed = re_parser.parse(pattern, flags)
+    except re.error:
+        return []
+    literals: list[str] = []
+    ignorecase = bool(parsed.state.flags & re.IGNORECASE)
+    if not _collect_required_literals(parsed, literals, ignorecase=ignorecase):
+        return []
+    return literals
+
+
+def _collect_required_literals(items: Iterable[tuple[Any, Any]], literals: list[str], *, ignorecase: bool) -> bool:
+    current: list[str] = []
+
+    def flush() -> None:
+        if current:
+            literals.append("".join(current))
+            current.clear()
+
+    for op, value in items:
+        if op is re_constants.LITERAL:
+            char = chr(value)
+            if ignorecase and not char.isascii():
+                return False
+            if ignorecase and char.lower() in IGNORECASE_FOLDED_LITERALS:
+                flush()
+            else:
+                current.append(char)
+            continue
+        flush()
+        if op is re_constants.SUBPATTERN:
+            _, add_flags, del_flags, subpattern = value
+            scoped = (ignorecase or bool(add_flags & re.IGNORECASE)) and not del_flags & re.IGNORECASE
+            if not _collect_required_literals(subpattern, literals, ignorecase=scoped):
+                return False
+        elif op in REGEX_REPEATS and value[0] >= 1:
+            if not _collect_required_literals(value[2], literals, ignorecase=ignorecase):
+                return False
+        elif op is re_constants.ATOMIC_GROUP:
+            if not _collect_required_literals(value, literals, ignorecase=ignorecase):
+                return False
+        elif op is re_constants.ASSERT:
+            if not _collect_required_literals(value[1], literals, ignorecase=ignorecase):
+                return False
+    flush()
+    return True
+
+
+class DataTextIndex:
+    def __init__(
+        self,
+        *,
+        project_root: Path,
+        data_root: Path,
+        rescan_seconds: float = DEFAULT_RESCAN_SECONDS,
+    ) -> None:
+        self.project_root = project_root
+        self.data_root = data_root
+        self.rescan_seconds = rescan_seconds
+        self._files: dict[str, IndexedTextFile] = {}
+        self._postings: dict[str, set[str]] = {}
+        self._lock = threading.RLock()
+        self._scanned_at: float | None = None
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def _rel_from_project(self, path: Path) -> str:
+        try:
+            return path.relative_to(self.project_root).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def _index_file(self, rel_from_data: str) -> None:
+        path = self.data_root / rel_from_data
+        try:
+            stat = path.stat()
+        except OSError:
+            self._remove_file(rel_from_data)
+            return
+        if not path.is_file() or path.suffix.lower() not in TEXT_FILE_SUFFIXES:
+            self._remove_file(rel_from_data)
+            return
+
+        fingerprint = (stat.st_mtime_ns, stat.st_size)
+        existing = self._files.get(rel_from_data)
+        if existing is not None and existing.fingerprint == fingerprint:
+            return
+
+        text = path.read_text(encoding="utf-8", errors="replace")
+        lowered = text.lower()
+        self._remove_file(rel_from_data)
+        indexed = IndexedTextFile(
+            rel_from_data=rel_from_data,
+            rel_from_project=self._rel_from_project(path),
+            fingerprint=fingerprint,
+            lines=tuple(text.splitlines()),
+            lowered_lines=tuple(lowered.splitlines()),
+            ngrams=frozenset(text_ngrams(lowered)),
+        )
+        self._files[rel_from_data] = indexed
+        for ngram in indexed.ngrams:
+            self._postings.setdefault(ngram, set()).add(rel_from_data)
+
+    def _remove_file(self, rel_from_data: str) -> None:
+        existing = self._files.pop(rel_from_data, None)
+        if existing is None:
+            return
+        for ngram in existing.ngrams:
+            holders = self._postings.get(ngram)
+            if holders is None:
+                continue
+            holders.discard(rel_from_data)
+            if not holders:
+                del self._postings[ngram]
+
+    def rescan(self) -> None:
+        with self._lock:
+            seen: set[str] = set()
+            if self.data_root.exists():
+                for path in self.data_root.rglob("*"):
+                    if path.suffix.lower() not in TEXT_FILE_SUFFIXES or not path.is_file():
+                        continue
+                    rel_from_data = path.relative_to(self.data_root).as_posix()
+                    seen.add(rel_from_data)
+                    self._index_file(rel_from_data)
+            for rel_from_data in set(self._files) - seen:
+                self._remove_file(rel_from_data)
+            self._scanned_at = time.monotonic()
+
+    def refresh_paths(self, paths: Iterable[str]) -> None:
+        with self._lock:
+            if self._scanned_at is None:
+                return
+            for raw_path in paths:
+                path = Path(raw_path)
+                if not path.is_absolute():
+                    path = self.project_root / path
+                try:
+                    rel_from_data = path.relative_to(self.data_root).as_posix()
+                except ValueError:
+                    continue
+                self._index_file(rel_from_data)
+
+    def _ensure_fresh(self) -> None:
+        if self._scanned_at is None or time.monotonic() - self._scanned_at >= self.rescan_seconds:
+            self.rescan()
+
+    def _candidate_paths(self, literals: list[str]) -> list[str]:
+        ngrams: set[str] = set()
+        for literal in literals:
+            ngrams.update(text_ngrams(literal.lower()))
+        if not ngrams:
+            return sorted(self._files)
+
+        postings = sorted((self._postings.get(ngram, set()) for ngram in ngrams), key=len)
+        candidates = set(postings[0])
+        for holders in postings[1:]:
+            if not candidates:
+                break
+            candidates &= holders
+        return sorted(candidates)
+
+    def search(
+        self,
+        *,
+        query: str,
+        file_glob: str | None = None,
+        glob: str | None = None,
+        case_sensitive: bool = False,
+        fixed_strings: bool = False,
+        max_results: int = 100,
+    ) -> dict[str, Any]:
+        pattern: re.Pattern[str] | None = None
+        needle = query if case_sensitive else query.lower()
+        if fixed_strings:
+            literals = [query]
+        else:
+            try:
+                pattern = re.compile(query, 0 if case_sensitive else re.IGNORECASE)
+            except re.error as exc:
+                raise ValueError(f"invalid regex: {exc}") from exc
+            literals = required_regex_literals(query, pattern.flags)
+
+        with self._lock:
+            self._ensure_fresh()
+            candidates = [self._files[rel] for rel in self._candidate_paths(literals)]
+
+        matches: list[dict[str, Any]] = []
+        scanned_files = 0
+        truncated = False
+        for indexed in candidates:
+            if file_glob and not fnmatch.fnmatch(indexed.rel_from_data, file_glob):
+                continue
+            if glob and not fnmatch.fnmatch(indexed.rel_from_data, glob):
+                continue
+            scanned_files += 1
+
+            haystacks = indexed.lines if case_sensitive or pattern is not None else indexed.lowered_lines
+            for line_number, haystack in enumerate(haystacks, start=1):
+                line = indexed.lines[line_number - 1]
+                submatches: list[dict[str, Any]] = []
+                if pattern is None:
+                    start = haystack.find(needle)
+                    while start >= 0 and needle:
+                        end = start + len(needle)
+                        submatches.append({"start": start, "end": end, "text": line[start:end]})
+                        start = haystack.find(needle, end)
+                else:
+                    for match in pattern.finditer(line):
+                        submatches.append({"start": match.start(), "end": match.end(), "text": match.group(0)})
+                if not submatches:
+                    continue
+
+                if len(matches) == max_results:
+                    truncated = True
+                    break
+                matches.append(
+                    {
+                        "path": indexed.rel_from_project,
+                        "line_number": line_number,
+                        "line": line,
+                        "submatches": submatches,
+                    }
+                )
+            if truncated:
+                break
+
+        return {
+            "engine": "memory-index",
+            "query": query,
+            "matches": matches,
+            "match_count": len(matches) + 1 if truncated else len(matches),
+            "truncated": truncated,
+            "summary": {
+                "indexed_files": len(self._files),
+                "candidate_files": len(candidates),
+                "searched_files": scanned_files,
+            },
+        }
+
+
+class DataTextIndexRegistry:
+    def __init__(self, *, rescan_seconds: float = DEFAULT_RESCAN_SECONDS) -> None:
+        self.rescan_seconds = rescan_seconds
+        self._indexes: dict[tuple[str, str], DataTextIndex] = {}
+        self._lock = threading.Lock()
+
+    def get(self, *, project_root: Path, data_root: Path) -> DataTextIndex:
+        key = (str(project_root.resolve()), str(data_root.resolve()))
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is None:
+                index = DataTextIndex(
+                    project_root=project_root,
+                    data_root=data_root,
+                    rescan_seconds=self.rescan_seconds,
+                )
+                self._indexes[key] = index
+            return index
+
+    def refresh_paths(self, *, project_root: Path, data_root: Path, paths: Iterable[str]) -> None:
+        key = (str(project_root.resolve()), str(data_root.resolve()))
+        with self._lock:
+            index = self._indexes.get(key)
+        if index is not None:
+            index.refresh_paths(paths)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._indexes.clear()
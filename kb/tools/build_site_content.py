@@ -17,8 +17,8 @@ from typing import Any
 from urllib.parse import urlparse
 
 import yaml
-from pydantic import ValidationError
 
+from kb.entity_files import load_entity
 from kb.schemas import ChangelogRow, EdgeRecord, EmploymentHistoryRow, LookingForRow, partial_date_sort_key
 
 FRONTMATTER_RE = re.compile(r"\A---\n(.*?)\n---\n?", re.DOTALL)
@@ -109,29 +109,6 @@ def infer_sources_root(project_root: Path, entity_data_root: Path) -> Path:
     return project_root / "data" / "source"
 
 
-def load_jsonl_rows(path: Path, model_cls: type) -> list[Any]:
-    if not path.exists():
-        return []
-
-    rows: list[Any] = []
-    with path.open("r", encoding="utf-8") as handle:
-        for line_number, line in enumerate(handle, start=1):
-            text = line.strip()
-            if not text:
-                continue
-            try:
-                payload = json.loads(text)
-            except json.JSONDecodeError as exc:
-                raise ValueError(f"{path.as_posix()}:{line_number} JSON parse error: {exc.msg}") from exc
-            try:
-                rows.append(model_cls.model_validate(payload))
-            except ValidationError as exc:
-                raise ValueError(
-                    f"{path.as_posix()}:{line_number} schema error: {exc.errors()[0]['msg']}"
-                ) from exc
-    return rows
-
-
 def load_entity_page(index_path: Path, entity_type: str, output_path: Path, data_root: Path) -> Page:
     entity_dir = index_path.parent
     prefix = f"{entity_type}@"
@@ -139,19 +116,25 @@ def load_entity_page(index_path: Path, entity_type: str, output_path: Path, data
         raise ValueError(f"Unexpected entity directory name: {entity_dir.as_posix()}")
 
     slug = entity_dir.name[len(prefix) :]
-    markdown = index_path.read_text(encoding="utf-8")
-    metadata, body = split_frontmatter(markdown)
+    entity = load_entity(entity_dir, entity_type)
+    if not entity.index.exists:
+        raise FileNotFoundError(index_path)
+    if entity.index.frontmatter_error is not None:
+        raise ValueError(f"{index_path.as_posix()} invalid YAML frontmatter: {entity.index.frontmatter_error}")
+    metadata, body = entity.index.metadata(), entity.index.body
+    for loaded in entity.jsonl.values():
+        loaded.raise_for_errors()
 
     if entity_type == "person":
         title = str(metadata.get("person") or slug.replace("-", " ").title())
-        employment_rows = load_jsonl_rows(entity_dir / "employment-history.jsonl", EmploymentHistoryRow)
-        looking_for_rows = load_jsonl_rows(entity_dir / "looking-for.jsonl", LookingForRow)
+        employment_rows = entity.jsonl["employment"].records()
+        looking_for_rows = entity.jsonl["looking_for"].records()
     else:
         title = str(metadata.get("org") or slug.replace("-", " ").title())
         employment_rows = []
         looking_for_rows = []
 
-    changelog_rows = load_jsonl_rows(entity_dir / "changelog.jsonl", ChangelogRow)
+    changelog_rows = entity.jsonl["changelog"].records() if "changelog" in entity.jsonl else []
 
     entity_rel_path = entity_dir.relative_to(data_root).as_posix()
     return Page(
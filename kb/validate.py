@@ -1,21 +1,30 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
-import re
 import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterable
 
-import yaml
 from pydantic import ValidationError
 
+from kb.entity_files import LoadedJsonl, entity_jsonl_files, load_jsonl, load_markdown
 from kb.schemas import ChangelogRow, EdgeRecord, EmploymentHistoryRow, LookingForRow, SourceRecord
 
-FRONTMATTER_RE = re.compile(r"\A---\s*\n(.*?)\n---\s*\n?", re.DOTALL)
-FOOTNOTE_REF_RE = re.compile(r"\[\^([^\]]+)\](?!:)")
+if TYPE_CHECKING:
+    from kb.reference_graph import ReferenceGraph
+
+VALIDATION_CACHE_VERSION = 1
+DEFAULT_VALIDATION_CACHE_PATH = ".build/validation/cache.json"
+RACY_MTIME_WINDOW_NS = 2_000_000_000
+JSONL_MODELS: dict[str, type] = {
+    model_cls.__name__: model_cls for model_cls in (ChangelogRow, EmploymentHistoryRow, LookingForRow)
+}
 
 
 @dataclass(frozen=True)
@@ -58,6 +67,168 @@ class ValidationIssue:
             payload["line"] = self.line
         return payload
 
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> "ValidationIssue":
+        return cls(
+            code=str(payload["code"]),
+            path=str(payload["path"]),
+            message=str(payload["message"]),
+            line=payload.get("line"),
+        )
+
+
+def validator_fingerprint() -> str:
+    digest = hashlib.sha256()
+    for module_name in ("validate.py", "entity_files.py", "schemas.py"):
+        module_path = Path(__file__).with_name(module_name)
+        digest.update(module_path.read_bytes())
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class FileCheckTask:
+    kind: str
+    path: Path
+    project_root: Path
+    subject: SourceFile | EdgeFile | None = None
+
+
+class ValidationCache:
+    def __init__(self, path: Path | None, *, project_root: Path) -> None:
+        self.path = path
+        self.project_root = project_root
+        self.fingerprint = validator_fingerprint()
+        self.entries: dict[str, dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._seen: set[str] = set()
+        self._prefetched: set[str] = set()
+        self._dirty = False
+        if path is not None:
+            self._load()
+
+    def _load(self) -> None:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        if not isinstance(payload, dict):
+            return
+        if payload.get("version") != VALIDATION_CACHE_VERSION or payload.get("fingerprint") != self.fingerprint:
+            self._dirty = True
+            return
+        entries = payload.get("entries")
+        if isinstance(entries, dict):
+            self.entries = entries
+
+    def _key(self, path: Path, kind: str) -> str:
+        try:
+            rel = path.relative_to(self.project_root).as_posix()
+        except ValueError:
+            rel = path.as_posix()
+        return f"{kind}:{rel}"
+
+    def _probe(self, task: FileCheckTask) -> tuple[str, dict[str, Any] | None, dict[str, Any] | None]:
+        try:
+            stat = task.path.stat()
+        except OSError:
+            return "", None, None
+
+        key = self._key(task.path, task.kind)
+        self._seen.add(key)
+        entry = self.entries.get(key)
+        if entry is not None:
+            if (
+                entry.get("mtime_ns") == stat.st_mtime_ns
+                and entry.get("size") == stat.st_size
+                and stat.st_mtime_ns < int(entry.get("checked_ns") or 0) - RACY_MTIME_WINDOW_NS
+            ):
+                return key, entry, None
+
+        digest = hashlib.sha256(task.path.read_bytes()).hexdigest()
+        fresh = {
+            "sha256": digest,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "checked_ns": time.time_ns(),
+        }
+        if entry is not None and entry.get("sha256") == digest:
+            entry.update(fresh)
+            self._dirty = True
+            return key, entry, None
+        return key, None, fresh
+
+    def _store(self, key: str, fresh: dict[str, Any], value: Any, issues: list[ValidationIssue]) -> None:
+        self.misses += 1
+        self.entries[key] = {**fresh, "value": value, "issues": [issue.as_dict() for issue in issues]}
+        self._dirty = True
+
+    def lookup(self, task: FileCheckTask) -> tuple[Any, list[ValidationIssue]]:
+        key, entry, fresh = self._probe(task)
+        if entry is not None:
+            if key in self._prefetched:
+                self._prefetched.discard(key)
+            else:
+                self.hits += 1
+            return entry.get("value"), [ValidationIssue.from_dict(issue) for issue in entry.get("issues") or []]
+
+        value, issues = run_file_check(task)
+        if fresh is not None:
+            self._store(key, fresh, value, issues)
+        return value, issues
+
+    def prefetch(self, tasks: list[FileCheckTask], *, jobs: int) -> None:
+        pending: list[tuple[str, dict[str, Any], FileCheckTask]] = []
+        for task in tasks:
+            key, entry, fresh = self._probe(task)
+            if entry is None and fresh is not None:
+                pending.append((key, fresh, task))
+        if not pending:
+            return
+
+        chunksize = max(1, len(pending) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = pool.map(run_file_check, [task for _, _, task in pending], chunksize=chunksize)
+            for (key, fresh, _), (value, issues) in zip(pending, results):
+                self._store(key, fresh, value, issues)
+                self._prefetched.add(key)
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.entries)}
+
+    def save(self, *, prune: bool = False) -> None:
+        if prune:
+            stale = set(self.entries) - self._seen
+            for key in stale:
+                del self.entries[key]
+            self._dirty = self._dirty or bool(stale)
+        if not self._dirty or self.path is None:
+            return
+
+        payload = {
+            "version": VALIDATION_CACHE_VERSION,
+            "fingerprint": self.fingerprint,
+            "entries": self.entries,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        temp_path.replace(self.path)
+        self._dirty = False
+
+
+def cached_check(
+    cache: ValidationCache | None,
+    task: FileCheckTask,
+    issues: list[ValidationIssue],
+) -> Any:
+    if cache is None:
+        value, file_issues = run_file_check(task)
+    else:
+        value, file_issues = cache.lookup(task)
+    issues.extend(file_issues)
+    return value
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Validate KB v2 data layout and schemas")
@@ -87,6 +258,17 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Pretty-print JSON output.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Parse and validate files in N worker processes (0 = one per CPU core).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Re-parse every file instead of reusing {DEFAULT_VALIDATION_CACHE_PATH}.",
+    )
     return parser.parse_args()
 
 
@@ -228,52 +410,84 @@ def is_within(path: Path, container: Path) -> bool:
         return False
 
 
-def is_entity_in_scope(entity: EntityRecord, scope_paths: set[Path] | None) -> bool:
-    if scope_paths is None:
-        return True
-    if len(scope_paths) == 0:
-        return False
+class ScopeIndex:
+    def __init__(self, scope_paths: Iterable[Path]) -> None:
+        self.paths = frozenset(scope_paths)
+        prefixes: set[Path] = set()
+        for path in self.paths:
+            prefixes.add(path)
+            prefixes.update(path.parents)
+        self._prefixes = frozenset(prefixes)
 
-    for scoped in scope_paths:
-        if scoped == entity.directory or scoped == entity.index_path:
-            return True
-        if is_within(scoped, entity.directory):
-            return True
-        if is_within(entity.directory, scoped):
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def covers(self, path: Path) -> bool:
+        if path in self.paths:
             return True
-    return False
+        return any(parent in self.paths for parent in path.parents)
+
+    def touches(self, directory: Path) -> bool:
+        return directory in self._prefixes
+
+    def dependents(
+        self,
+        *,
+        entities: dict[str, EntityRecord],
+        sources: dict[str, SourceFile],
+        edge_files: list[EdgeFile],
+    ) -> dict[Path, list[str]]:
+        owners_by_dir: dict[Path, list[str]] = {}
+        covered_by_scope: dict[Path, list[str]] = {}
+
+        def register(anchor_dir: Path | None, own_path: Path, rel: str) -> None:
+            if anchor_dir is not None:
+                owners_by_dir.setdefault(anchor_dir, []).append(rel)
+            for candidate in (own_path, *own_path.parents):
+                if candidate in self.paths:
+                    covered_by_scope.setdefault(candidate, []).append(rel)
+
+        for entity in entities.values():
+            register(entity.directory, entity.directory, entity.rel_dir)
+        for source_file in sources.values():
+            register(source_file.directory, source_file.directory, source_file.rel_dir)
+        for edge_file in edge_files:
+            register(None, edge_file.path, edge_file.rel_path)
+
+        affected: dict[Path, list[str]] = {}
+        for scoped in self.paths:
+            rels = set(covered_by_scope.get(scoped, []))
+            for candidate in (scoped, *scoped.parents):
+                rels.update(owners_by_dir.get(candidate, []))
+            affected[scoped] = sorted(rels)
+        return affected
+
+
+def as_scope_index(scope_paths: set[Path] | ScopeIndex | None) -> ScopeIndex | None:
+    if scope_paths is None or isinstance(scope_paths, ScopeIndex):
+        return scope_paths
+    return ScopeIndex(scope_paths)
+
+
+def is_entity_in_scope(entity: EntityRecord, scope_paths: set[Path] | ScopeIndex | None) -> bool:
+    scope = as_scope_index(scope_paths)
+    if scope is None:
+        return True
+    return scope.touches(entity.directory) or scope.covers(entity.directory)
 
 
-def is_edge_in_scope(edge: EdgeFile, scope_paths: set[Path] | None) -> bool:
-    if scope_paths is None:
+def is_edge_in_scope(edge: EdgeFile, scope_paths: set[Path] | ScopeIndex | None) -> bool:
+    scope = as_scope_index(scope_paths)
+    if scope is None:
         return True
-    if len(scope_paths) == 0:
-        return False
-
-    for scoped in scope_paths:
-        if scoped == edge.path:
-            return True
-        if is_within(scoped, edge.path.parent):
-            return True
-        if is_within(edge.path, scoped):
-            return True
-    return False
+    return scope.covers(edge.path)
 
 
-def is_source_in_scope(source: SourceFile, scope_paths: set[Path] | None) -> bool:
-    if scope_paths is None:
+def is_source_in_scope(source: SourceFile, scope_paths: set[Path] | ScopeIndex | None) -> bool:
+    scope = as_scope_index(scope_paths)
+    if scope is None:
         return True
-    if len(scope_paths) == 0:
-        return False
-
-    for scoped in scope_paths:
-        if scoped == source.directory or scoped == source.index_path:
-            return True
-        if is_within(scoped, source.directory):
-            return True
-        if is_within(source.directory, scoped):
-            return True
-    return False
+    return scope.touches(source.directory) or scope.covers(source.directory)
 
 
 def append_issue(
@@ -333,10 +547,13 @@ def validate_jsonl(
     model_cls: type,
     issues: list[ValidationIssue],
     project_root: Path,
+    loaded: LoadedJsonl | None = None,
 ) -> list[dict[str, Any]]:
+    if loaded is None:
+        loaded = load_jsonl(path, model_cls)
     rows: list[dict[str, Any]] = []
     seen_ids: set[str] = set()
-    if not path.exists():
+    if not loaded.exists:
         append_issue(
             issues,
             code="missing_file",
@@ -346,53 +563,37 @@ def validate_jsonl(
         )
         return rows
 
-    with path.open("r", encoding="utf-8") as handle:
-        for line_number, line in enumerate(handle, start=1):
-            text = line.strip()
-            if not text:
-                continue
-            try:
-                payload = json.loads(text)
-            except json.JSONDecodeError as exc:
-                append_issue(
-                    issues,
-                    code="invalid_jsonl",
-                    path=path,
-                    message=f"JSONL parse error: {exc.msg}",
-                    line=line_number,
-                    project_root=project_root,
-                )
-                continue
+    errors_by_line = {error.line: error for error in loaded.errors}
+    records_by_line = dict(loaded.rows)
+    for line_number in sorted({*errors_by_line, *records_by_line}):
+        error = errors_by_line.get(line_number)
+        if error is not None:
+            append_issue(
+                issues,
+                code=error.code,
+                path=path,
+                message=f"JSONL parse error: {error.message}" if error.code == "invalid_jsonl" else error.message,
+                line=line_number,
+                project_root=project_root,
+            )
+            continue
 
-            try:
-                record = model_cls.model_validate(payload)
-            except ValidationError as exc:
+        normalized = records_by_line[line_number].model_dump(mode="json", by_alias=True)
+        row_id = str(normalized.get("id") or "").strip()
+        if row_id:
+            if row_id in seen_ids:
                 append_issue(
                     issues,
-                    code="schema_error",
+                    code="duplicate_row_id",
                     path=path,
-                    message=exc.errors()[0]["msg"],
+                    message=f"duplicate row id {row_id}",
                     line=line_number,
                     project_root=project_root,
                 )
                 continue
+            seen_ids.add(row_id)
 
-            normalized = record.model_dump(by_alias=True)
-            row_id = str(normalized.get("id") or "").strip()
-            if row_id:
-                if row_id in seen_ids:
-                    append_issue(
-                        issues,
-                        code="duplicate_row_id",
-                        path=path,
-                        message=f"duplicate row id {row_id}",
-                        line=line_number,
-                        project_root=project_root,
-                    )
-                    continue
-                seen_ids.add(row_id)
-
-            rows.append(normalized)
+        rows.append(normalized)
 
     return rows
 
@@ -404,7 +605,8 @@ def read_index_frontmatter(
     issues: list[ValidationIssue],
     project_root: Path,
 ) -> dict[str, Any] | None:
-    if not path.exists():
+    loaded = load_markdown(path)
+    if not loaded.exists:
         append_issue(
             issues,
             code="missing_file",
@@ -414,9 +616,7 @@ def read_index_frontmatter(
         )
         return None
 
-    text = path.read_text(encoding="utf-8")
-    match = FRONTMATTER_RE.match(text)
-    if not match:
+    if not loaded.has_frontmatter:
         append_issue(
             issues,
             code="missing_frontmatter",
@@ -426,19 +626,17 @@ def read_index_frontmatter(
         )
         return None
 
-    try:
-        payload = yaml.safe_load(match.group(1)) or {}
-    except yaml.YAMLError as exc:
+    if loaded.frontmatter_error is not None:
         append_issue(
             issues,
             code="invalid_frontmatter",
             path=path,
-            message=f"invalid YAML frontmatter: {exc}",
+            message=f"invalid YAML frontmatter: {loaded.frontmatter_error}",
             project_root=project_root,
         )
         return None
 
-    if not isinstance(payload, dict):
+    if not isinstance(loaded.frontmatter, dict):
         append_issue(
             issues,
             code="invalid_frontmatter",
@@ -448,39 +646,93 @@ def read_index_frontmatter(
         )
         return None
 
-    return payload
+    return loaded.frontmatter
 
 
-def extract_citation_keys(text: str) -> set[str]:
-    return {match.group(1).strip() for match in FOOTNOTE_REF_RE.finditer(text) if match.group(1).strip()}
+def compute_jsonl_check(
+    path: Path,
+    model_cls: type,
+    project_root: Path,
+) -> tuple[dict[str, Any], list[ValidationIssue]]:
+    file_issues: list[ValidationIssue] = []
+    loaded = load_jsonl(path, model_cls)
+    rows = validate_jsonl(path=path, model_cls=model_cls, issues=file_issues, project_root=project_root, loaded=loaded)
+    return {"rows": rows, "citations": sorted(loaded.citation_keys)}, file_issues
+
 
+def check_jsonl_file(
+    *,
+    path: Path,
+    model_cls: type,
+    issues: list[ValidationIssue],
+    project_root: Path,
+    cache: ValidationCache | None = None,
+) -> tuple[list[dict[str, Any]], set[str]]:
+    task = FileCheckTask(kind=f"jsonl:{model_cls.__name__}", path=path, project_root=project_root)
+    value = cached_check(cache, task, issues)
+    return value["rows"], set(value["citations"])
 
-def read_citations_from_markdown(path: Path) -> set[str]:
-    if not path.exists():
-        return set()
-    return extract_citation_keys(path.read_text(encoding="utf-8"))
 
+def check_markdown_citations(
+    *,
+    path: Path,
+    issues: list[ValidationIssue],
+    project_root: Path,
+    cache: ValidationCache | None = None,
+) -> set[str]:
+    task = FileCheckTask(kind="markdown-citations", path=path, project_root=project_root)
+    return set(cached_check(cache, task, issues))
 
-def read_citations_from_jsonl(path: Path) -> set[str]:
-    citations: set[str] = set()
-    if not path.exists():
-        return citations
 
-    with path.open("r", encoding="utf-8") as handle:
-        for line in handle:
-            text = line.strip()
-            if not text:
-                continue
-            try:
-                payload = json.loads(text)
-            except json.JSONDecodeError:
-                continue
-            if not isinstance(payload, dict):
-                continue
-            for value in payload.values():
-                if isinstance(value, str):
-                    citations.update(extract_citation_keys(value))
-    return citations
+def run_file_check(task: FileCheckTask) -> tuple[Any, list[ValidationIssue]]:
+    if task.kind == "markdown-citations":
+        return sorted(load_markdown(task.path).citation_keys), []
+    if task.kind == "source":
+        return compute_source_check(task.subject, task.project_root)
+    if task.kind == "edge":
+        return compute_edge_check(task.subject, task.project_root)
+    if task.kind.startswith("jsonl:"):
+        return compute_jsonl_check(task.path, JSONL_MODELS[task.kind.split(":", 1)[1]], task.project_root)
+    raise ValueError(f"unknown file check kind: {task.kind}")
+
+
+def collect_file_check_tasks(
+    *,
+    project_root: Path,
+    entities: dict[str, EntityRecord],
+    sources: dict[str, SourceFile],
+    edge_files: list[EdgeFile],
+    scope_paths: set[Path] | ScopeIndex | None,
+) -> list[FileCheckTask]:
+    tasks: list[FileCheckTask] = []
+    for rel_dir in sorted(entities):
+        entity = entities[rel_dir]
+        if not is_entity_in_scope(entity, scope_paths):
+            continue
+        tasks.append(FileCheckTask(kind="markdown-citations", path=entity.index_path, project_root=project_root))
+        for _, filename, model_cls in entity_jsonl_files(entity.kind):
+            tasks.append(
+                FileCheckTask(
+                    kind=f"jsonl:{model_cls.__name__}",
+                    path=entity.directory / filename,
+                    project_root=project_root,
+                )
+            )
+    for rel_dir in sorted(sources):
+        source_file = sources[rel_dir]
+        if is_source_in_scope(source_file, scope_paths):
+            tasks.append(
+                FileCheckTask(
+                    kind="source",
+                    path=source_file.index_path,
+                    project_root=project_root,
+                    subject=source_file,
+                )
+            )
+    for edge_file in edge_files:
+        if is_edge_in_scope(edge_file, scope_paths):
+            tasks.append(FileCheckTask(kind="edge", path=edge_file.path, project_root=project_root, subject=edge_file))
+    return tasks
 
 
 def validate_entities(
@@ -488,8 +740,9 @@ def validate_entities(
     project_root: Path,
     data_root: Path,
     entities: dict[str, EntityRecord],
-    scope_paths: set[Path] | None,
+    scope_paths: set[Path] | ScopeIndex | None,
     issues: list[ValidationIssue],
+    cache: ValidationCache | None = None,
 ) -> tuple[dict[str, dict[str, list[dict[str, Any]]]], dict[str, set[str]]]:
     loaded_rows: dict[str, dict[str, list[dict[str, Any]]]] = {}
     citation_keys_by_entity: dict[str, set[str]] = {}
@@ -519,46 +772,33 @@ def validate_entities(
             )
 
         rows_for_entity: dict[str, list[dict[str, Any]]] = {}
-        citations_for_entity = read_citations_from_markdown(entity.index_path)
-
-        if entity.kind in {"person", "org"}:
-            changelog_path = entity.directory / "changelog.jsonl"
-            rows_for_entity["changelog"] = validate_jsonl(
-                path=changelog_path,
-                model_cls=ChangelogRow,
-                issues=issues,
-                project_root=project_root,
-            )
-            citations_for_entity.update(read_citations_from_jsonl(changelog_path))
+        citations_for_entity = check_markdown_citations(
+            path=entity.index_path,
+            issues=issues,
+            project_root=project_root,
+            cache=cache,
+        )
 
-        if entity.kind == "person":
-            employment_path = entity.directory / "employment-history.jsonl"
-            rows_for_entity["employment"] = validate_jsonl(
-                path=employment_path,
-                model_cls=EmploymentHistoryRow,
-                issues=issues,
-                project_root=project_root,
-            )
-            citations_for_entity.update(read_citations_from_jsonl(employment_path))
-            looking_path = entity.directory / "looking-for.jsonl"
-            rows_for_entity["looking_for"] = validate_jsonl(
-                path=looking_path,
-                model_cls=LookingForRow,
+        for group, filename, model_cls in entity_jsonl_files(entity.kind):
+            rows, citations = check_jsonl_file(
+                path=entity.directory / filename,
+                model_cls=model_cls,
                 issues=issues,
                 project_root=project_root,
+                cache=cache,
             )
-            citations_for_entity.update(read_citations_from_jsonl(looking_path))
+            rows_for_entity[group] = rows
+            citations_for_entity.update(citations)
 
         loaded_rows[rel_dir] = rows_for_entity
         citation_keys_by_entity[rel_dir] = citations_for_entity
 
-    entity_rel_paths = set(entities.keys())
     for rel_dir, row_groups in loaded_rows.items():
         for row in row_groups.get("employment", []):
             ref = row.get("organization_ref")
             if not ref:
                 continue
-            if ref not in entity_rel_paths:
+            if ref not in entities:
                 append_issue(
                     issues,
                     code="invalid_reference",
@@ -570,12 +810,78 @@ def validate_entities(
     return loaded_rows, citation_keys_by_entity
 
 
+def compute_source_check(
+    source_file: SourceFile,
+    project_root: Path,
+) -> tuple[dict[str, Any] | None, list[ValidationIssue]]:
+    file_issues: list[ValidationIssue] = []
+    frontmatter = read_index_frontmatter(
+        path=source_file.index_path,
+        entity_label="source",
+        issues=file_issues,
+        project_root=project_root,
+    )
+    if frontmatter is None:
+        return None, file_issues
+
+    try:
+        record = SourceRecord.model_validate(frontmatter)
+    except ValidationError as exc:
+        append_issue(
+            file_issues,
+            code="schema_error",
+            path=source_file.index_path,
+            message=exc.errors()[0]["msg"],
+            project_root=project_root,
+        )
+        return None, file_issues
+
+    if record.id != source_file.source_id:
+        append_issue(
+            file_issues,
+            code="source_id_mismatch",
+            path=source_file.index_path,
+            message=f"frontmatter id {record.id} does not match directory {source_file.source_id}",
+            project_root=project_root,
+        )
+
+    try:
+        canonical_source_path = source_file.index_path.relative_to(project_root).as_posix()
+    except ValueError:
+        canonical_source_path = source_file.index_path.as_posix()
+    if record.source_path != canonical_source_path:
+        append_issue(
+            file_issues,
+            code="source_path_mismatch",
+            path=source_file.index_path,
+            message=f"source-path must be {canonical_source_path}",
+            project_root=project_root,
+        )
+    return record.model_dump(mode="json", by_alias=True), file_issues
+
+
+def check_source_frontmatter(
+    *,
+    source_file: SourceFile,
+    issues: list[ValidationIssue],
+    project_root: Path,
+    cache: ValidationCache | None = None,
+) -> SourceRecord | None:
+    task = FileCheckTask(kind="source", path=source_file.index_path, project_root=project_root, subject=source_file)
+    payload = cached_check(cache, task, issues)
+    if payload is None:
+        return None
+    return SourceRecord.model_validate(payload)
+
+
 def validate_sources(
     *,
     project_root: Path,
     sources: dict[str, SourceFile],
-    scope_paths: set[Path] | None,
+    scope_paths: set[Path] | ScopeIndex | None,
     issues: list[ValidationIssue],
+    cache: ValidationCache | None = None,
+    known_sources_by_citation_key: dict[str, set[str]] | None = None,
 ) -> tuple[dict[str, SourceRecord], dict[str, str]]:
     validated: dict[str, SourceRecord] = {}
     source_by_citation_key: dict[str, str] = {}
@@ -595,49 +901,15 @@ def validate_sources(
             )
             continue
 
-        frontmatter = read_index_frontmatter(
-            path=source_file.index_path,
-            entity_label="source",
+        record = check_source_frontmatter(
+            source_file=source_file,
             issues=issues,
             project_root=project_root,
+            cache=cache,
         )
-        if frontmatter is None:
-            continue
-
-        try:
-            record = SourceRecord.model_validate(frontmatter)
-        except ValidationError as exc:
-            append_issue(
-                issues,
-                code="schema_error",
-                path=source_file.index_path,
-                message=exc.errors()[0]["msg"],
-                project_root=project_root,
-            )
+        if record is None:
             continue
 
-        if record.id != source_file.source_id:
-            append_issue(
-                issues,
-                code="source_id_mismatch",
-                path=source_file.index_path,
-                message=f"frontmatter id {record.id} does not match directory {source_file.source_id}",
-                project_root=project_root,
-            )
-
-        try:
-            canonical_source_path = source_file.index_path.relative_to(project_root).as_posix()
-        except ValueError:
-            canonical_source_path = source_file.index_path.as_posix()
-        if record.source_path != canonical_source_path:
-            append_issue(
-                issues,
-                code="source_path_mismatch",
-                path=source_file.index_path,
-                message=f"source-path must be {canonical_source_path}",
-                project_root=project_root,
-            )
-
         source_path = (project_root / record.source_path).absolute()
         if not source_path.exists():
             append_issue(
@@ -670,6 +942,15 @@ def validate_sources(
                 )
 
         existing_rel_dir = source_by_citation_key.get(record.citation_key)
+        if not existing_rel_dir and known_sources_by_citation_key is not None:
+            existing_rel_dir = next(
+                (
+                    other
+                    for other in sorted(known_sources_by_citation_key.get(record.citation_key, ()))
+                    if other != rel_dir and other in sources and not is_source_in_scope(sources[other], scope_paths)
+                ),
+                None,
+            )
         if existing_rel_dir and existing_rel_dir != rel_dir:
             append_issue(
                 issues,
@@ -689,14 +970,74 @@ def validate_sources(
     return validated, source_by_citation_key
 
 
+def compute_edge_check(
+    edge_file: EdgeFile,
+    project_root: Path,
+) -> tuple[dict[str, Any] | None, list[ValidationIssue]]:
+    file_issues: list[ValidationIssue] = []
+    payload = read_json_file(edge_file.path, file_issues, project_root)
+    if payload is None:
+        return None, file_issues
+
+    try:
+        record = EdgeRecord.model_validate(payload)
+    except ValidationError as exc:
+        append_issue(
+            file_issues,
+            code="schema_error",
+            path=edge_file.path,
+            message=exc.errors()[0]["msg"],
+            project_root=project_root,
+        )
+        return None, file_issues
+
+    raw_relation = payload.get("relation")
+    canonical_relation = record.relation.value
+    if isinstance(raw_relation, str) and raw_relation.strip() != canonical_relation:
+        append_issue(
+            file_issues,
+            code="non_canonical_relation",
+            path=edge_file.path,
+            message=f"use canonical relation '{canonical_relation}' instead of '{raw_relation.strip()}'",
+            project_root=project_root,
+        )
+
+    expected_name = f"edge@{record.id}.json"
+    if edge_file.path.name != expected_name:
+        append_issue(
+            file_issues,
+            code="edge_filename_mismatch",
+            path=edge_file.path,
+            message=f"expected filename {expected_name}",
+            project_root=project_root,
+        )
+    return record.model_dump(mode="json", by_alias=True), file_issues
+
+
+def check_edge_file(
+    *,
+    edge_file: EdgeFile,
+    issues: list[ValidationIssue],
+    project_root: Path,
+    cache: ValidationCache | None = None,
+) -> EdgeRecord | None:
+    task = FileCheckTask(kind="edge", path=edge_file.path, project_root=project_root, subject=edge_file)
+    payload = cached_check(cache, task, issues)
+    if payload is None:
+        return None
+    return EdgeRecord.model_validate(payload)
+
+
 def validate_edge_files(
     *,
     project_root: Path,
     data_root: Path,
     edge_files: list[EdgeFile],
     entities: dict[str, EntityRecord],
-    scope_paths: set[Path] | None,
+    scope_paths: set[Path] | ScopeIndex | None,
     issues: list[ValidationIssue],
+    cache: ValidationCache | None = None,
+    known_edge_paths_by_id: dict[str, set[str]] | None = None,
 ) -> tuple[dict[str, tuple[EdgeRecord, EdgeFile]], dict[str, list[Path]]]:
     edge_by_id: dict[str, tuple[EdgeRecord, EdgeFile]] = {}
     duplicate_edge_files: dict[str, list[Path]] = {}
@@ -704,43 +1045,15 @@ def validate_edge_files(
     for edge_file in edge_files:
         if not is_edge_in_scope(edge_file, scope_paths):
             continue
-        payload = read_json_file(edge_file.path, issues, project_root)
-        if payload is None:
-            continue
-
-        try:
-            record = EdgeRecord.model_validate(payload)
-        except ValidationError as exc:
-            append_issue(
-                issues,
-                code="schema_error",
-                path=edge_file.path,
-                message=exc.errors()[0]["msg"],
-                project_root=project_root,
-            )
+        record = check_edge_file(
+            edge_file=edge_file,
+            issues=issues,
+            project_root=project_root,
+            cache=cache,
+        )
+        if record is None:
             continue
 
-        raw_relation = payload.get("relation")
-        canonical_relation = record.relation.value
-        if isinstance(raw_relation, str) and raw_relation.strip() != canonical_relation:
-            append_issue(
-                issues,
-                code="non_canonical_relation",
-                path=edge_file.path,
-                message=f"use canonical relation '{canonical_relation}' instead of '{raw_relation.strip()}'",
-                project_root=project_root,
-            )
-
-        expected_name = f"edge@{record.id}.json"
-        if edge_file.path.name != expected_name:
-            append_issue(
-                issues,
-                code="edge_filename_mismatch",
-                path=edge_file.path,
-                message=f"expected filename {expected_name}",
-                project_root=project_root,
-            )
-
         if record.from_entity not in entities:
             append_issue(
                 issues,
@@ -784,6 +1097,12 @@ def validate_edge_files(
         else:
             edge_by_id[record.id] = (record, edge_file)
 
+        if known_edge_paths_by_id is not None:
+            for other_rel_path in sorted(known_edge_paths_by_id.get(record.id, ())):
+                other = EdgeFile(path=data_root / other_rel_path, rel_path=other_rel_path)
+                if other_rel_path != edge_file.rel_path and not is_edge_in_scope(other, scope_paths):
+                    duplicate_edge_files.setdefault(record.id, [edge_file.path]).append(other.path)
+
     for edge_id, files in sorted(duplicate_edge_files.items()):
         unique_paths = sorted(set(files), key=lambda path: path.as_posix())
         for path in unique_paths:
@@ -907,8 +1226,9 @@ def validate_entity_citations(
     entities: dict[str, EntityRecord],
     citation_keys_by_entity: dict[str, set[str]],
     source_by_citation_key: dict[str, str],
-    scope_paths: set[Path] | None,
+    scope_paths: set[Path] | ScopeIndex | None,
     issues: list[ValidationIssue],
+    known_sources_by_citation_key: dict[str, set[str]] | None = None,
 ) -> None:
     for rel_dir, citation_keys in sorted(citation_keys_by_entity.items()):
         entity = entities.get(rel_dir)
@@ -919,6 +1239,8 @@ def validate_entity_citations(
         for citation_key in sorted(citation_keys):
             if citation_key in source_by_citation_key:
                 continue
+            if known_sources_by_citation_key is not None and known_sources_by_citation_key.get(citation_key):
+                continue
             append_issue(
                 issues,
                 code="unresolved_citation",
@@ -934,6 +1256,9 @@ def run_validation(
     data_root: Path,
     scope_paths: set[Path] | None,
     scope_label: str,
+    cache_path: Path | None = None,
+    jobs: int = 1,
+    graph: ReferenceGraph | None = None,
 ) -> dict[str, Any]:
     issues: list[ValidationIssue] = []
 
@@ -956,31 +1281,63 @@ def run_validation(
             checked_jsonl_files=0,
         )
 
-    entities = gather_entities(data_root)
-    sources = gather_source_files(data_root)
-    edge_files = gather_edge_files(data_root)
+    known_sources_by_citation_key: dict[str, set[str]] | None = None
+    known_edge_paths_by_id: dict[str, set[str]] | None = None
+    if graph is not None and scope_paths is not None:
+        entities = graph.entities
+        sources = graph.sources
+        edge_files = [
+            graph.edge_files[rel_path]
+            for rel_path in sorted(graph.edge_files)
+            if is_edge_in_scope(graph.edge_files[rel_path], scope_paths)
+        ]
+        known_sources_by_citation_key = graph.sources_by_citation_key
+        known_edge_paths_by_id = graph.edge_paths_by_id
+    else:
+        entities = gather_entities(data_root)
+        sources = gather_source_files(data_root)
+        edge_files = gather_edge_files(data_root)
+    scope = as_scope_index(scope_paths)
+    cache = ValidationCache(cache_path, project_root=project_root) if cache_path is not None else None
+    if jobs != 1:
+        if cache is None:
+            cache = ValidationCache(None, project_root=project_root)
+        cache.prefetch(
+            collect_file_check_tasks(
+                project_root=project_root,
+                entities=entities,
+                sources=sources,
+                edge_files=edge_files,
+                scope_paths=scope,
+            ),
+            jobs=jobs if jobs > 0 else (os.cpu_count() or 1),
+        )
 
     loaded_rows, citation_keys_by_entity = validate_entities(
         project_root=project_root,
         data_root=data_root,
         entities=entities,
-        scope_paths=scope_paths,
+        scope_paths=scope,
         issues=issues,
+        cache=cache,
     )
 
     _, source_by_citation_key = validate_sources(
         project_root=project_root,
         sources=sources,
-        scope_paths=scope_paths,
+        scope_paths=scope,
         issues=issues,
+        cache=cache,
+        known_sources_by_citation_key=known_sources_by_citation_key,
     )
     validate_entity_citations(
         project_root=project_root,
         entities=entities,
         citation_keys_by_entity=citation_keys_by_entity,
         source_by_citation_key=source_by_citation_key,
-        scope_paths=scope_paths,
+        scope_paths=scope,
         issues=issues,
+        known_sources_by_citation_key=known_sources_by_citation_key,
     )
 
     validate_edge_files(
@@ -988,13 +1345,15 @@ def run_validation(
         data_root=data_root,
         edge_files=edge_files,
         entities=entities,
-        scope_paths=scope_paths,
+        scope_paths=scope,
         issues=issues,
+        cache=cache,
+        known_edge_paths_by_id=known_edge_paths_by_id,
     )
 
-    checked_entities = len([entity for entity in entities.values() if is_entity_in_scope(entity, scope_paths)])
-    checked_sources = len([source for source in sources.values() if is_source_in_scope(source, scope_paths)])
-    checked_edges = len([edge for edge in edge_files if is_edge_in_scope(edge, scope_paths)])
+    checked_entities = len([entity for entity in entities.values() if is_entity_in_scope(entity, scope)])
+    checked_sources = len([source for source in sources.values() if is_source_in_scope(source, scope)])
+    checked_edges = len([edge for edge in edge_files if is_edge_in_scope(edge, scope)])
     checked_jsonl_files = 0
     for entity_rel_dir in loaded_rows:
         entity = entities[entity_rel_dir]
@@ -1003,7 +1362,7 @@ def run_validation(
         if entity.kind == "person":
             checked_jsonl_files += 2
 
-    return format_result(
+    result = format_result(
         project_root=project_root,
         data_root=data_root,
         scope_label=scope_label,
@@ -1013,6 +1372,10 @@ def run_validation(
         checked_edges=checked_edges,
         checked_jsonl_files=checked_jsonl_files,
     )
+    if cache_path is not None and cache is not None:
+        cache.save(prune=scope_paths is None)
+        result["cache"] = cache.stats()
+    return result
 
 
 def format_result(
@@ -1076,6 +1439,8 @@ def main() -> int:
         data_root=data_root,
         scope_paths=scope_paths,
         scope_label=scope_label,
+        cache_path=None if args.no_cache else project_root / DEFAULT_VALIDATION_CACHE_PATH,
+        jobs=args.jobs,
     )
 
     if args.pretty:
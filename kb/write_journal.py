@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Iterator
+
+_ACTIVE_JOURNAL: ContextVar[WriteJournal | None] = ContextVar("kb_write_journal", default=None)
+
+
+class WriteJournal:
+    def __init__(self, *, project_root: Path) -> None:
+        self.project_root = Path(os.path.abspath(project_root))
+        self._paths: set[str] = set()
+
+    def __bool__(self) -> bool:
+        return bool(self._paths)
+
+    def record(self, path: Path) -> None:
+        absolute = Path(os.path.abspath(path))
+        try:
+            self._paths.add(absolute.relative_to(self.project_root).as_posix())
+        except ValueError:
+            self._paths.add(absolute.as_posix())
+
+    def paths(self) -> list[str]:
+        return sorted(self._paths)
+
+
+@contextmanager
+def recording(journal: WriteJournal) -> Iterator[WriteJournal]:
+    token = _ACTIVE_JOURNAL.set(journal)
+    try:
+        yield journal
+    finally:
+        _ACTIVE_JOURNAL.reset(token)
+
+
+def record_write(*paths: Path) -> None:
+    journal = _ACTIVE_JOURNAL.get()
+    if journal is None:
+        return
+    for path in paths:
+        journal.record(path)
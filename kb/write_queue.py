@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import fcntl
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+FILE_LOCK_POLL_SECONDS = 0.01
+FILE_LOCK_MAX_POLL_SECONDS = 0.1
+
+
+class WriteQueueTimeout(TimeoutError):
+    pass
+
+
+class FairWriteQueue:
+    def __init__(self, *, lock_path: Path) -> None:
+        self.lock_path = lock_path
+        self._condition = threading.Condition()
+        self._next_ticket = 0
+        self._serving = 0
+        self._abandoned: set[int] = set()
+        self.max_depth = 0
+        self.acquisitions = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def _advance(self) -> None:
+        self._serving += 1
+        while self._serving in self._abandoned:
+            self._abandoned.discard(self._serving)
+            self._serving += 1
+        self._condition.notify_all()
+
+    def _wait_for_turn(self, ticket: int, deadline: float | None) -> None:
+        while self._serving != ticket:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                self._abandoned.add(ticket)
+                raise WriteQueueTimeout("timed out waiting for queued writers")
+            self._condition.wait(timeout=remaining)
+
+    def _lock_file(self, deadline: float | None) -> Any:
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        handle = self.lock_path.open("w", encoding="utf-8")
+        delay = FILE_LOCK_POLL_SECONDS
+        while True:
+            try:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return handle
+            except BlockingIOError:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    handle.close()
+                    raise WriteQueueTimeout("timed out waiting for the repository write lock") from None
+                time.sleep(delay if remaining is None else min(delay, remaining))
+                delay = min(delay * 2, FILE_LOCK_MAX_POLL_SECONDS)
+
+    @contextmanager
+    def acquire(self, timeout: float | None = None) -> Iterator[Path]:
+        started = time.monotonic()
+        deadline = None if timeout is None else started + timeout
+        with self._condition:
+            ticket = self._next_ticket
+            self._next_ticket += 1
+            self.max_depth = max(self.max_depth, self._next_ticket - self._serving)
+            try:
+                self._wait_for_turn(ticket, deadline)
+            except WriteQueueTimeout:
+                self.timeouts += 1
+                raise
+
+        try:
+            handle = self._lock_file(deadline)
+        except BaseException:
+            with self._condition:
+                self.timeouts += 1
+                self._advance()
+            raise
+
+        waited = time.monotonic() - started
+        with self._condition:
+            self.acquisitions += 1
+            self.total_wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+        try:
+            yield self.lock_path
+        finally:
+            try:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            finally:
+                handle.close()
+                with self._condition:
+                    self._advance()
+
+    def status(self) -> dict[str, Any]:
+        with self._condition:
+            depth = self._next_ticket - self._serving - len(self._abandoned)
+            return {
+                "queue_depth": depth,
+                "max_queue_depth": self.max_depth,
+                "acquisitions": self.acquisitions,
+                "timeouts": self.timeouts,
+                "average_wait_seconds": (
+                    round(self.total_wait_seconds / self.acquisitions, 6) if self.acquisitions else 0.0
+                ),
+                "max_wait_seconds": round(self.max_wait_seconds, 6),
+            }
+
+
+class FairWriteQueueRegistry:
+    def __init__(self) -> None:
+        self._queues: dict[str, FairWriteQueue] = {}
+        self._lock = threading.Lock()
+
+    def get(self, *, lock_path: Path) -> FairWriteQueue:
+        key = str(lock_path.resolve())
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue is None:
+                queue = FairWriteQueue(lock_path=lock_path)
+                self._queues[key] = queue
+            return queue
+
+    def clear(self) -> None:
+        with self._lock:
+            self._queues.clear()